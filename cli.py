@@ -11,26 +11,26 @@ Features:
 """
 
 import asyncio
+import atexit
+import csv
+import logging
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 
 # Rich for beautiful terminal output
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.prompt import Prompt, IntPrompt, Confirm
 from rich.text import Text
-from rich.markdown import Markdown
 from rich import box
-from rich.live import Live
-from rich.layout import Layout
-from rich.style import Style
 
-# Import scrapers and ETL components
-import pandas as pd
-from scrapers import InstagramScraper, YouTubeScraper, RedditScraper, TwitterScraper, load_config
+# Scrapers (and their Playwright/Google client dependencies) are imported
+# inside the menu handlers that use them to keep startup fast
 
 # Initialize console
 console = Console()
@@ -44,6 +44,17 @@ except ImportError:
     DB_AVAILABLE = False
     console.print("[yellow]Note: Install duckdb for database features: pip install duckdb[/]")
 
+# Shared database connection, opened on first use and closed at exit
+_db_singleton = None
+
+# Background ETL runs; finished ones are reported at the top of the menu loop.
+# They start as soon as they are submitted (the menu prompts block the event
+# loop, so asyncio tasks would only start at the next await) and share the one
+# database connection, so a single worker loads them one at a time
+_ETL_THREAD_PREFIX = 'cli-etl'
+_etl_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=_ETL_THREAD_PREFIX)
+_pending_tasks = []
+
 # ASCII Art Banner
 BANNER = """
 [bold cyan]
@@ -68,6 +79,20 @@ BANNER = """
 [/bold cyan]
 """
 
+# Banner markup is parsed once; the rendered output is cached on first display
+_BANNER_TEXT = Text.from_markup(BANNER)
+_banner_ansi = None
+
+# Rendered main menu as (terminal width, output)
+_main_menu_cache = None
+
+# Prompt markup is parsed once and reused for every prompt
+_PROMPT_PREFIX = Text.from_markup("[bold cyan]>[/] ")
+_SQL_PROMPT = Text.from_markup("[bold cyan]SQL>[/]")
+_PRESS_ENTER = Text.from_markup("[dim]Press Enter[/]")
+_PRESS_ENTER_NEWLINE = Text("\n") + _PRESS_ENTER
+_PRESS_ENTER_CONTINUE = Text.from_markup("[dim]Press Enter to continue[/]")
+
 # Platform info
 PLATFORMS = {
     "1": {"name": "Reddit", "icon": "🟠", "description": "Subreddits & search (FREE)", "color": "orange1"},
@@ -76,17 +101,66 @@ PLATFORMS = {
     "4": {"name": "Instagram", "icon": "📸", "description": "Hashtag scraping", "color": "magenta"}
 }
 
+# Maximum number of rows rendered in a query results table
+DISPLAY_LIMIT = 20
+
+# Columns shown per row in the query results table
+DISPLAY_FIELDS = ('platform', 'author', 'post_text', 'likes', 'sentiment_label')
+_get_display_fields = itemgetter(*DISPLAY_FIELDS)
+
+# Display colors for sentiment labels
+SENTIMENT_COLORS = {'positive': 'green', 'negative': 'red', 'neutral': 'yellow'}
+
+
+def get_db():
+    """Return the shared Database instance, opening it on first use."""
+    global _db_singleton
+    if _db_singleton is None:
+        _db_singleton = Database()
+    return _db_singleton
+
+
+def close_db():
+    """Close the shared Database instance if it was opened."""
+    global _db_singleton
+    if _db_singleton is not None:
+        _db_singleton.close()
+        _db_singleton = None
+
+
+atexit.register(close_db)
+
+
+def prompt_text(label):
+    """Build a "> label" prompt from the pre-parsed prefix."""
+    return _PROMPT_PREFIX + label
+
+
+def _buffered_print(*renderables):
+    """Render all renderables into one buffer and write it to the terminal at once."""
+    with console.capture() as capture:
+        for renderable in renderables:
+            console.print(renderable)
+    sys.stdout.write(capture.get())
+    sys.stdout.flush()
+
 
 def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    console.clear()
 
 
 def show_banner():
-    console.print(BANNER)
+    global _banner_ansi
+    if _banner_ansi is None:
+        with console.capture() as capture:
+            console.print(_BANNER_TEXT)
+        _banner_ansi = capture.get()
+    sys.stdout.write(_banner_ansi)
+    sys.stdout.flush()
 
 
-def show_main_menu():
-    """Display the main menu with all options."""
+def _build_main_menu():
+    """Build the main menu table."""
     table = Table(
         title="[bold]Main Menu[/bold]",
         box=box.ROUNDED,
@@ -108,13 +182,24 @@ def show_main_menu():
     table.add_row("8", "⚙️  [yellow]Settings[/]", "Configure credentials")
     table.add_row("0", "🚪 [red]Exit[/]", "Quit")
     
-    console.print(table)
-    console.print()
+    return table
+
+
+def show_main_menu():
+    """Display the main menu, re-rendering only when the terminal width changes."""
+    global _main_menu_cache
+    if _main_menu_cache is None or _main_menu_cache[0] != console.width:
+        with console.capture() as capture:
+            console.print(_build_main_menu())
+            console.print()
+        _main_menu_cache = (console.width, capture.get())
+    sys.stdout.write(_main_menu_cache[1])
+    sys.stdout.flush()
 
 
 def get_menu_choice():
     choice = Prompt.ask(
-        "[bold cyan]>[/] Choose an option",
+        prompt_text("Choose an option"),
         choices=["0", "1", "2", "3", "4", "5", "6", "7", "8"],
         default="1"
     )
@@ -123,112 +208,181 @@ def get_menu_choice():
 
 # ============ SCRAPING FUNCTIONS ============
 
+# Maximum number of targets scraped at once in batch mode
+BATCH_CONCURRENCY = 10
+# Browser-based scrapers launch a Chromium instance per target, so keep them lower
+BROWSER_BATCH_CONCURRENCY = 2
+# Tabs searching at once when a batch shares one browser context (Twitter)
+TAB_BATCH_CONCURRENCY = 4
+
+
+def parse_targets(raw):
+    """Split a comma-separated prompt answer into individual scrape targets."""
+    return [target.strip() for target in raw.split(',') if target.strip()]
+
+
+def browser_note(config):
+    """Describe whether a browser scrape will open a window ("headless" in config.json)."""
+    return "Browser runs headless" if config.get('headless', True) else "Browser window will open"
+
+
+async def scrape_batch(targets, scrape_one, concurrency=BATCH_CONCURRENCY):
+    """
+    Scrape several targets concurrently and return the combined posts.
+    
+    Args:
+        targets: List of queries, hashtags or subreddits
+        scrape_one: Coroutine function taking a single target
+        concurrency: Maximum number of targets in flight at once
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def _one(target):
+        async with semaphore:
+            return await scrape_one(target)
+    
+    results = await asyncio.gather(*[_one(target) for target in targets], return_exceptions=True)
+    
+    posts = []
+    for target, result in zip(targets, results):
+        if isinstance(result, Exception):
+            console.print(f"[red]Error scraping '{target}': {result}[/]")
+        elif result:
+            posts.extend(result)
+    return posts
+
+
 async def scrape_reddit():
     """Interactive Reddit scraping."""
+    from scrapers import RedditScraper
+    
     console.print(Panel("[bold orange1]🟠 Reddit Scraper[/]", box=box.DOUBLE))
     
     console.print("\n[bold]Choose mode:[/]")
     console.print("  [1] Subreddit - Scrape a specific subreddit")
     console.print("  [2] Search - Search across Reddit")
     
-    mode = Prompt.ask("[bold cyan]>[/] Mode", choices=["1", "2"], default="1")
+    mode = Prompt.ask(prompt_text("Mode"), choices=["1", "2"], default="1")
     
     if mode == "1":
-        subreddit = Prompt.ask("[bold cyan]>[/] Subreddit name (without r/)")
-        sort = Prompt.ask("[bold cyan]>[/] Sort by", choices=["hot", "new", "top", "rising"], default="hot")
-        limit = IntPrompt.ask("[bold cyan]>[/] Number of posts", default=25)
+        subreddits = parse_targets(Prompt.ask(prompt_text("Subreddit name(s) (without r/, comma-separated)")))
+        sort = Prompt.ask(prompt_text("Sort by"), choices=["hot", "new", "top", "rising"], default="hot")
+        limit = IntPrompt.ask(prompt_text("Number of posts"), default=25)
         
-        console.print(Panel(f"[bold]r/{subreddit}[/] • {sort} • {limit} posts", box=box.ROUNDED))
+        names = ", ".join(f"r/{subreddit}" for subreddit in subreddits)
+        console.print(Panel(f"[bold]{names}[/] • {sort} • {limit} posts", box=box.ROUNDED))
         
-        if not Confirm.ask("[bold cyan]>[/] Start?", default=True):
+        if not subreddits or not Confirm.ask(prompt_text("Start?"), default=True):
             return []
         
-        with console.status(f"[bold green]Scraping r/{subreddit}...", spinner="dots"):
-            scraper = RedditScraper()
-            posts = scraper.search_subreddit(subreddit, sort=sort, limit=limit)
+        # One scraper for the batch, so every target shares its pacing and 429 backoff
+        reddit = RedditScraper()
+        with console.status(f"[bold green]Scraping {names}...", spinner="dots"):
+            posts = await scrape_batch(
+                subreddits,
+                lambda subreddit: reddit.search_subreddit_async(subreddit, sort=sort, limit=limit)
+            )
         return posts
     else:
-        query = Prompt.ask("[bold cyan]>[/] Search query")
-        limit = IntPrompt.ask("[bold cyan]>[/] Number of posts", default=25)
+        queries = parse_targets(Prompt.ask(prompt_text("Search query (comma-separated for batch)")))
+        limit = IntPrompt.ask(prompt_text("Number of posts"), default=25)
         
-        if not Confirm.ask(f"[bold cyan]>[/] Search '{query}'?", default=True):
+        if not queries or not Confirm.ask(prompt_text(f"Search {', '.join(map(repr, queries))}?"), default=True):
             return []
         
+        # One scraper for the batch, so every query shares its pacing and 429 backoff
+        reddit = RedditScraper()
         with console.status(f"[bold green]Searching...", spinner="dots"):
-            scraper = RedditScraper()
-            posts = scraper.search_posts(query, limit=limit)
+            posts = await scrape_batch(
+                queries,
+                lambda query: reddit.search_posts_async(query, limit=limit)
+            )
         return posts
 
 
 async def scrape_twitter():
     """Interactive Twitter scraping."""
+    from scrapers import TwitterScraper, get_config
+    
     console.print(Panel("[bold cyan]🐦 Twitter/X Scraper[/]", box=box.DOUBLE))
     
-    query = Prompt.ask("[bold cyan]>[/] Search query or hashtag")
-    limit = IntPrompt.ask("[bold cyan]>[/] Number of tweets", default=25)
+    queries = parse_targets(Prompt.ask(prompt_text("Search query or hashtag (comma-separated for batch)")))
+    limit = IntPrompt.ask(prompt_text("Number of tweets"), default=25)
     
-    console.print(Panel(f"[bold]Query:[/] {query}\n[dim]Browser window will open[/]", box=box.ROUNDED))
+    console.print(Panel(f"[bold]Query:[/] {', '.join(queries)}\n[dim]{browser_note(get_config())}[/]", box=box.ROUNDED))
     
-    if not Confirm.ask("[bold cyan]>[/] Start?", default=True):
+    if not queries or not Confirm.ask(prompt_text("Start?"), default=True):
         return []
     
     console.print("[yellow]Opening browser...[/]")
-    try:
-        posts = await TwitterScraper.scrape(query, limit)
-        return posts
-    except Exception as e:
-        console.print(f"[red]Error: {e}[/]")
-        return []
+    # One browser context and login for the batch, one tab per query
+    results = await TwitterScraper.scrape_many(queries, limit, concurrency=TAB_BATCH_CONCURRENCY)
+    
+    posts = []
+    for query, result in results.items():
+        if isinstance(result, Exception):
+            console.print(f"[red]Error scraping '{query}': {result}[/]")
+        else:
+            posts.extend(result)
+    return posts
 
 
 async def scrape_youtube():
     """Interactive YouTube scraping."""
+    from scrapers import YouTubeScraper, get_config
+    
     console.print(Panel("[bold red]▶️  YouTube Scraper[/]", box=box.DOUBLE))
     
-    config = load_config()
+    config = get_config()
     if not config.get('youtube_api_key') or config.get('youtube_api_key') == 'YOUR_YOUTUBE_API_KEY':
         console.print("[red]⚠️  YouTube API key not configured![/]")
         console.print("[dim]Edit config.json to add your API key[/]")
-        Prompt.ask("[dim]Press Enter[/]")
+        Prompt.ask(_PRESS_ENTER)
         return []
     
-    query = Prompt.ask("[bold cyan]>[/] Search query")
-    limit = IntPrompt.ask("[bold cyan]>[/] Number of videos", default=25)
+    queries = parse_targets(Prompt.ask(prompt_text("Search query (comma-separated for batch)")))
+    limit = IntPrompt.ask(prompt_text("Number of videos"), default=25)
     
-    if not Confirm.ask(f"[bold cyan]>[/] Search '{query}'?", default=True):
+    if not queries or not Confirm.ask(prompt_text(f"Search {', '.join(map(repr, queries))}?"), default=True):
         return []
     
+    # Queries run concurrently on aiohttp (the googleapiclient fallback runs in a worker thread)
     with console.status("[bold green]Searching YouTube...", spinner="dots"):
-        posts = await YouTubeScraper.scrape(query, limit)
+        posts = await scrape_batch(
+            queries,
+            lambda query: YouTubeScraper.scrape(query, limit)
+        )
     return posts
 
 
 async def scrape_instagram():
     """Interactive Instagram scraping."""
+    from scrapers import InstagramScraper, get_config
+    
     console.print(Panel("[bold magenta]📸 Instagram Scraper[/]", box=box.DOUBLE))
     
-    config = load_config()
+    config = get_config()
     ig_config = config.get('instagram', {})
     if not ig_config.get('username') or ig_config.get('username') == 'YOUR_INSTAGRAM_USERNAME':
         console.print("[red]⚠️  Instagram credentials not configured![/]")
-        Prompt.ask("[dim]Press Enter[/]")
+        Prompt.ask(_PRESS_ENTER)
         return []
     
-    hashtag = Prompt.ask("[bold cyan]>[/] Hashtag (without #)")
-    limit = IntPrompt.ask("[bold cyan]>[/] Number of posts", default=25)
+    hashtags = parse_targets(Prompt.ask(prompt_text("Hashtag(s) (without #, comma-separated)")))
+    limit = IntPrompt.ask(prompt_text("Number of posts"), default=25)
     
-    console.print(Panel(f"[bold]#{hashtag}[/] • {limit} posts\n[dim]Browser window will open[/]", box=box.ROUNDED))
+    tags = ", ".join(f"#{hashtag}" for hashtag in hashtags)
+    console.print(Panel(f"[bold]{tags}[/] • {limit} posts\n[dim]{browser_note(config)}[/]", box=box.ROUNDED))
     
-    if not Confirm.ask("[bold cyan]>[/] Start?", default=True):
+    if not hashtags or not Confirm.ask(prompt_text("Start?"), default=True):
         return []
     
     console.print("[yellow]Opening browser...[/]")
-    try:
-        posts = await InstagramScraper.scrape(hashtag, limit)
-        return posts
-    except Exception as e:
-        console.print(f"[red]Error: {e}[/]")
-        return []
+    return await scrape_batch(
+        hashtags,
+        lambda hashtag: InstagramScraper.scrape(hashtag, limit),
+        concurrency=BROWSER_BATCH_CONCURRENCY
+    )
 
 
 # ============ ETL & DATABASE FUNCTIONS ============
@@ -242,16 +396,74 @@ def run_etl_pipeline(posts, platform):
         console.print("[yellow]Database not available. Falling back to CSV.[/]")
         return None
     
+    pipeline = ETLPipeline(get_db())
+    return pipeline.run(posts)
+
+
+def _outside_etl_worker(record):
+    """Logging filter dropping records emitted on the background ETL thread."""
+    return not record.threadName.startswith(_ETL_THREAD_PREFIX)
+
+
+def _quiet_etl_worker_on_console():
+    """
+    Keep background ETL log lines off the terminal so they don't print over an
+    open prompt; they still reach scraper.log, and results are shown by
+    report_finished_tasks.
+    """
+    for handler in logging.getLogger().handlers:
+        if type(handler) is logging.StreamHandler and _outside_etl_worker not in handler.filters:
+            handler.addFilter(_outside_etl_worker)
+
+
+def start_etl_pipeline(posts, platform):
+    """Run the ETL pipeline in a worker thread so it overlaps with the next menu interaction."""
     console.print()
-    console.print("[bold]🔄 Running ETL Pipeline...[/]")
+    console.print(f"[bold]🔄 Running ETL Pipeline for {len(posts)} {platform} posts in the background...[/]")
+    
+    _quiet_etl_worker_on_console()
+    future = _etl_executor.submit(run_etl_pipeline, posts, platform)
+    _pending_tasks.append(future)
+    return future
+
+
+def _show_etl_outcome(outcome):
+    """Display a background ETL run's results, or its error."""
+    if isinstance(outcome, Exception):
+        console.print(f"[red]ETL pipeline failed: {outcome}[/]")
+    elif outcome:
+        show_etl_results(outcome)
+
+
+def report_finished_tasks():
+    """Display results of background ETL runs that have finished, without waiting for the rest."""
+    for future in [future for future in _pending_tasks if future.done()]:
+        _pending_tasks.remove(future)
+        _show_etl_outcome(future.exception() or future.result())
+
+
+async def drain_pending_tasks():
+    """Wait for all background ETL runs and display their results."""
+    if not _pending_tasks:
+        return
     
-    with console.status("[bold green]Transforming and loading data...", spinner="dots"):
-        db = Database()
-        pipeline = ETLPipeline(db)
-        results = pipeline.run(posts)
-        db.close()
+    futures = _pending_tasks[:]
+    _pending_tasks.clear()
     
-    # Display results
+    tasks = [asyncio.wrap_future(future) for future in futures]
+    for outcome in await asyncio.gather(*tasks, return_exceptions=True):
+        _show_etl_outcome(outcome)
+
+
+async def close_browsers():
+    """Close the scrapers' pooled browsers, if a browser scraper ever ran."""
+    scrapers = sys.modules.get('scrapers')
+    if scrapers is not None:
+        await scrapers.BROWSER_POOL.close()
+
+
+def show_etl_results(results):
+    """Display ETL pipeline results."""
     table = Table(title="[bold]ETL Pipeline Results[/]", box=box.ROUNDED)
     table.add_column("Metric", style="bold")
     table.add_column("Value", justify="right")
@@ -270,95 +482,135 @@ def run_etl_pipeline(posts, platform):
     console.print(f"  [green]Positive:[/] {sentiment['positive']}")
     console.print(f"  [yellow]Neutral:[/] {sentiment['neutral']}")
     console.print(f"  [red]Negative:[/] {sentiment['negative']}")
+    console.print()
+
+
+def append_posts_csv(posts, filename):
+    """Append posts to a CSV file row by row, writing the header only for a new file."""
+    fieldnames = None
+    if os.path.exists(filename):
+        with open(filename, 'r', newline='', encoding='utf-8') as f:
+            fieldnames = next(csv.reader(f), None)
     
-    return results
+    write_header = not fieldnames
+    if write_header:
+        # Union of keys across platforms, in first-seen order
+        fieldnames = list(dict.fromkeys(key for post in posts for key in post))
+    
+    with open(filename, 'a', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+        if write_header:
+            writer.writeheader()
+        writer.writerows(posts)
 
 
 def query_data():
     """Interactive SQL query interface."""
     if not DB_AVAILABLE:
         console.print("[red]Database not available. Install duckdb: pip install duckdb[/]")
-        Prompt.ask("[dim]Press Enter[/]")
+        Prompt.ask(_PRESS_ENTER)
         return
     
     console.print(Panel("[bold green]📊 Query Data[/]", box=box.DOUBLE))
     
-    db = Database()
+    db = get_db()
     stats = db.get_stats()
     
     # Show database stats
-    console.print(f"\n[bold]Database Stats:[/]")
-    console.print(f"  Total posts: [cyan]{stats['total_posts']}[/]")
+    text = Text()
+    text.append("\nDatabase Stats:\n", style="bold")
+    text.append("  Total posts: ")
+    text.append(f"{stats['total_posts']}\n", style="cyan")
     
     if stats['by_platform']:
-        console.print(f"\n[bold]By Platform:[/]")
-        for platform, count in stats['by_platform'].items():
-            console.print(f"  • {platform}: {count}")
-    
-    console.print("\n[bold]Query Options:[/]")
-    console.print("  [1] Recent posts")
-    console.print("  [2] Top posts by likes")
-    console.print("  [3] Search posts")
-    console.print("  [4] Custom SQL")
-    console.print("  [5] Back")
+        text.append("\nBy Platform:\n", style="bold")
+        text.append("".join(f"  • {platform}: {count}\n" for platform, count in stats['by_platform'].items()))
+    
+    text.append("\nQuery Options:\n", style="bold")
+    text.append(
+        "  [1] Recent posts\n"
+        "  [2] Top posts by likes\n"
+        "  [3] Search posts\n"
+        "  [4] Custom SQL\n"
+        "  [5] Back"
+    )
+    _buffered_print(text)
     
-    choice = Prompt.ask("[bold cyan]>[/] Choose", choices=["1", "2", "3", "4", "5"], default="1")
+    choice = Prompt.ask(prompt_text("Choose"), choices=["1", "2", "3", "4", "5"], default="1")
     
     if choice == "1":
-        platform = Prompt.ask("[bold cyan]>[/] Filter by platform (or 'all')", default="all")
-        limit = IntPrompt.ask("[bold cyan]>[/] Number of posts", default=20)
+        platform = Prompt.ask(prompt_text("Filter by platform (or 'all')"), default="all")
+        limit = IntPrompt.ask(prompt_text("Number of posts"), default=20)
         
         platform_filter = None if platform == "all" else platform
         
+        if platform_filter:
+            available = stats['by_platform'].get(platform_filter, 0)
+        else:
+            available = stats['total_posts']
+        
         with console.status("[bold green]Querying...", spinner="dots"):
-            results = db.get_posts(platform=platform_filter, limit=limit)
+            results = db.get_posts(
+                platform=platform_filter, limit=min(limit, DISPLAY_LIMIT), columns=DISPLAY_FIELDS
+            )
         
-        display_query_results(results)
+        display_query_results(results, total=min(limit, available))
     
     elif choice == "2":
-        limit = IntPrompt.ask("[bold cyan]>[/] Number of posts", default=20)
+        limit = IntPrompt.ask(prompt_text("Number of posts"), default=20)
         
         with console.status("[bold green]Querying...", spinner="dots"):
-            results = db.query(f"SELECT * FROM posts ORDER BY likes DESC LIMIT {limit}")
+            results = db.get_posts(limit=min(limit, DISPLAY_LIMIT), order_by="likes DESC", columns=DISPLAY_FIELDS)
         
-        display_query_results(results)
+        display_query_results(results, total=min(limit, stats['total_posts']))
     
     elif choice == "3":
-        query = Prompt.ask("[bold cyan]>[/] Search term")
+        query = Prompt.ask(prompt_text("Search term"))
         
         with console.status("[bold green]Searching...", spinner="dots"):
-            results = db.search(query, limit=50)
+            results = db.search(query, limit=DISPLAY_LIMIT, columns=DISPLAY_FIELDS)
+            total = min(50, db.count_search(query))
         
-        display_query_results(results)
+        display_query_results(results, total=total)
     
     elif choice == "4":
         console.print("\n[dim]Enter SQL query (table: posts)[/]")
         console.print("[dim]Example: SELECT * FROM posts WHERE platform = 'reddit' LIMIT 10[/]")
-        sql = Prompt.ask("[bold cyan]SQL>[/]")
+        sql = Prompt.ask(_SQL_PROMPT)
         
         try:
             with console.status("[bold green]Executing...", spinner="dots"):
-                start = datetime.now()
-                results = db.query(sql)
-                duration = (datetime.now() - start).total_seconds() * 1000
+                start = time.perf_counter()
+                # One row past the page tells us whether the result was cut off,
+                # without running the query a second time to count it
+                results = db.query(sql, max_rows=DISPLAY_LIMIT + 1)
+                duration = (time.perf_counter() - start) * 1000
             
             console.print(f"\n[dim]Query completed in {duration:.2f}ms[/]")
             display_query_results(results)
         except Exception as e:
             console.print(f"[red]Error: {e}[/]")
     
-    db.close()
-    Prompt.ask("\n[dim]Press Enter[/]")
+    Prompt.ask(_PRESS_ENTER_NEWLINE)
 
 
-def display_query_results(results):
-    """Display query results in a table."""
+def display_query_results(results, total=None):
+    """
+    Display query results in a table.
+    
+    Args:
+        results: Rows to display (at most DISPLAY_LIMIT are rendered)
+        total: Total number of matching rows, if more exist than were fetched.
+            Without it, rows past DISPLAY_LIMIT only mark the result as truncated.
+    """
+    truncated = total is None and len(results) > DISPLAY_LIMIT
+    if total is None:
+        total = len(results)
+    
     if not results:
         console.print("[yellow]No results found[/]")
         return
     
-    console.print(f"\n[bold green]Found {len(results)} results[/]\n")
-    
     table = Table(box=box.ROUNDED, show_lines=True)
     table.add_column("#", style="dim", width=3)
     table.add_column("Platform", style="cyan", width=10)
@@ -367,39 +619,50 @@ def display_query_results(results):
     table.add_column("👍", justify="right", width=6)
     table.add_column("Sentiment", width=10)
     
-    for i, row in enumerate(results[:20], 1):
-        text = str(row.get('post_text', ''))[:35]
-        if len(str(row.get('post_text', ''))) > 35:
-            text += "..."
+    for i, row in enumerate(results[:DISPLAY_LIMIT], 1):
+        try:
+            platform, author, post_text, likes, sentiment = _get_display_fields(row)
+        except KeyError:
+            # Custom SQL may not select every display column
+            platform, author, post_text, likes, sentiment = (
+                row.get(field, '') for field in DISPLAY_FIELDS
+            )
+        
+        post_text = str(post_text)
+        text = post_text[:35] + "..." if len(post_text) > 35 else post_text
         
-        sentiment = row.get('sentiment_label', '')
-        sentiment_color = {'positive': 'green', 'negative': 'red', 'neutral': 'yellow'}.get(sentiment, 'dim')
+        sentiment_color = SENTIMENT_COLORS.get(sentiment, 'dim')
         
         table.add_row(
             str(i),
-            str(row.get('platform', '')),
-            str(row.get('author', ''))[:12],
+            str(platform),
+            str(author)[:12],
             text,
-            str(row.get('likes', 0)),
+            str(likes),
             f"[{sentiment_color}]{sentiment}[/]" if sentiment else ""
         )
     
-    if len(results) > 20:
-        table.add_row("...", f"[dim]+{len(results) - 20} more[/]", "", "", "", "")
+    shown = min(len(results), DISPLAY_LIMIT)
+    if truncated:
+        table.add_row("...", "[dim]more[/]", "", "", "", "")
+        _buffered_print(f"\n[bold green]Found more than {shown} results[/]\n", table)
+        return
+    if total > shown:
+        table.add_row("...", f"[dim]+{total - shown} more[/]", "", "", "", "")
     
-    console.print(table)
+    _buffered_print(f"\n[bold green]Found {total} results[/]\n", table)
 
 
 def show_analytics():
     """Show analytics dashboard."""
     if not DB_AVAILABLE:
         console.print("[red]Database not available[/]")
-        Prompt.ask("[dim]Press Enter[/]")
+        Prompt.ask(_PRESS_ENTER)
         return
     
     console.print(Panel("[bold blue]📈 Analytics Dashboard[/]", box=box.DOUBLE))
     
-    db = Database()
+    db = get_db()
     
     with console.status("[bold green]Analyzing data...", spinner="dots"):
         stats = db.get_stats()
@@ -407,48 +670,57 @@ def show_analytics():
         top_hashtags = db.get_top_hashtags(limit=10)
     
     # Overview
-    console.print(f"\n[bold]📊 Overview[/]")
-    console.print(f"  Total Posts: [cyan]{stats['total_posts']}[/]")
+    text = Text()
+    text.append("\n📊 Overview\n", style="bold")
+    text.append("  Total Posts: ")
+    text.append(f"{stats['total_posts']}\n", style="cyan")
     
     # Platform breakdown
     if stats['by_platform']:
-        console.print(f"\n[bold]🌐 By Platform[/]")
-        for platform, count in stats['by_platform'].items():
-            pct = round(count / max(stats['total_posts'], 1) * 100, 1)
-            console.print(f"  {platform}: {count} ({pct}%)")
+        text.append("\n🌐 By Platform\n", style="bold")
+        total = max(stats['total_posts'], 1)
+        text.append("".join(
+            f"  {platform}: {count} ({round(count / total * 100, 1)}%)\n"
+            for platform, count in stats['by_platform'].items()
+        ))
     
     # Sentiment distribution
     if sentiment_dist:
-        console.print(f"\n[bold]😊 Sentiment Distribution[/]")
+        text.append("\n😊 Sentiment Distribution\n", style="bold")
         for row in sentiment_dist:
             label = row['sentiment_label']
             count = row['count']
             pct = row['percentage']
-            color = {'positive': 'green', 'negative': 'red', 'neutral': 'yellow'}.get(label, 'dim')
-            console.print(f"  [{color}]{label}[/]: {count} ({pct}%)")
+            color = SENTIMENT_COLORS.get(label, 'dim')
+            text.append("  ")
+            text.append(label, style=color)
+            text.append(f": {count} ({pct}%)\n")
     
     # Top hashtags
     if top_hashtags:
-        console.print(f"\n[bold]#️⃣  Top Hashtags[/]")
-        for i, row in enumerate(top_hashtags[:10], 1):
-            console.print(f"  {i}. #{row['hashtag']} ({row['count']})")
+        text.append("\n#️⃣  Top Hashtags\n", style="bold")
+        text.append("".join(
+            f"  {i}. #{row['hashtag']} ({row['count']})\n" for i, row in enumerate(top_hashtags[:10], 1)
+        ))
     
     # Top authors
     if stats.get('top_authors'):
-        console.print(f"\n[bold]👤 Top Authors[/]")
-        for i, row in enumerate(stats['top_authors'][:5], 1):
-            console.print(f"  {i}. @{row['author']} ({row['count']} posts)")
+        text.append("\n👤 Top Authors\n", style="bold")
+        text.append("".join(
+            f"  {i}. @{row['author']} ({row['count']} posts)\n" for i, row in enumerate(stats['top_authors'][:5], 1)
+        ))
+    
+    _buffered_print(text)
     
-    db.close()
     console.print()
-    Prompt.ask("[dim]Press Enter[/]")
+    Prompt.ask(_PRESS_ENTER)
 
 
-def export_data():
+async def export_data():
     """Export data to files."""
     if not DB_AVAILABLE:
         console.print("[red]Database not available[/]")
-        Prompt.ask("[dim]Press Enter[/]")
+        Prompt.ask(_PRESS_ENTER)
         return
     
     console.print(Panel("[bold magenta]💾 Export Data[/]", box=box.DOUBLE))
@@ -458,36 +730,42 @@ def export_data():
     console.print("  [2] Parquet (compressed, fast)")
     console.print("  [3] Both")
     
-    choice = Prompt.ask("[bold cyan]>[/] Choose", choices=["1", "2", "3"], default="1")
+    choice = Prompt.ask(prompt_text("Choose"), choices=["1", "2", "3"], default="1")
     
-    platform = Prompt.ask("[bold cyan]>[/] Filter by platform (or 'all')", default="all")
+    platform = Prompt.ask(prompt_text("Filter by platform (or 'all')"), default="all")
     platform_filter = None if platform == "all" else platform
     
-    db = Database()
+    db = get_db()
+    basename = f"export_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
     
-    try:
-        if choice in ["1", "3"]:
-            filename = f"export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            db.export_csv(filename, platform=platform_filter)
-            console.print(f"[green]✓ Exported to {filename}[/]")
-        
-        if choice in ["2", "3"]:
-            filename = f"export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet"
-            db.export_parquet(filename, platform=platform_filter)
-            console.print(f"[green]✓ Exported to {filename}[/]")
+    exports = []
+    if choice in ["1", "3"]:
+        exports.append((f"{basename}.csv", db.export_csv))
+    if choice in ["2", "3"]:
+        exports.append((f"{basename}.parquet", db.export_parquet))
     
-    except Exception as e:
-        console.print(f"[red]Error: {e}[/]")
+    # Both formats are written concurrently when "Both" is chosen
+    outcomes = await asyncio.gather(
+        *[asyncio.to_thread(export, filename, platform=platform_filter) for filename, export in exports],
+        return_exceptions=True
+    )
     
-    db.close()
-    Prompt.ask("\n[dim]Press Enter[/]")
+    for (filename, _), outcome in zip(exports, outcomes):
+        if isinstance(outcome, Exception):
+            console.print(f"[red]Error: {outcome}[/]")
+        else:
+            console.print(f"[green]✓ Exported to {filename}[/]")
+    
+    Prompt.ask(_PRESS_ENTER_NEWLINE)
 
 
 def show_settings():
     """Display settings."""
+    from scrapers import get_config
+    
     console.print(Panel("[bold yellow]⚙️  Settings[/]", box=box.DOUBLE))
     
-    config = load_config()
+    config = get_config()
     
     table = Table(title="[bold]Configuration[/]", box=box.ROUNDED)
     table.add_column("Service", style="bold")
@@ -522,7 +800,7 @@ def show_settings():
     
     console.print(table)
     console.print("\n[dim]Edit config.json to update[/]")
-    Prompt.ask("\n[dim]Press Enter[/]")
+    Prompt.ask(_PRESS_ENTER_NEWLINE)
 
 
 # ============ MAIN LOOP ============
@@ -533,16 +811,25 @@ async def main_loop():
     show_banner()
     
     while True:
+        # ETL runs keep going in their threads while the user picks the next action
+        report_finished_tasks()
         show_main_menu()
         choice = get_menu_choice()
         
         if choice == "0":
+            await drain_pending_tasks()
+            await close_browsers()
             console.print("\n[bold cyan]👋 Goodbye![/]\n")
             break
         
         clear_screen()
         show_banner()
         
+        # Querying, analytics and export read the database the ETL threads write to
+        if choice in ("5", "6", "7") and _pending_tasks:
+            console.print("[dim]Waiting for background ETL to finish...[/]")
+            await drain_pending_tasks()
+        
         posts = []
         platform = ""
         
@@ -570,7 +857,7 @@ async def main_loop():
                 show_banner()
                 continue
             elif choice == "7":
-                export_data()
+                await export_data()
                 clear_screen()
                 show_banner()
                 continue
@@ -584,15 +871,13 @@ async def main_loop():
             if posts:
                 console.print(f"\n[bold green]✓ Scraped {len(posts)} posts from {platform}[/]")
                 
-                # Run ETL pipeline
+                # Run ETL pipeline in the background
                 if DB_AVAILABLE:
-                    run_etl_pipeline(posts, platform)
+                    start_etl_pipeline(posts, platform)
                 else:
                     # Fallback to CSV
-                    if Confirm.ask("\n[bold cyan]>[/] Save to CSV?", default=True):
-                        df = pd.DataFrame(posts)
-                        df.to_csv('metadata.csv', mode='a', header=not os.path.exists('metadata.csv'), 
-                                  index=False, encoding='utf-8')
+                    if Confirm.ask(Text("\n") + prompt_text("Save to CSV?"), default=True):
+                        append_posts_csv(posts, 'metadata.csv')
                         console.print("[green]✓ Saved to metadata.csv[/]")
             
         except KeyboardInterrupt:
@@ -601,17 +886,26 @@ async def main_loop():
             console.print(f"\n[red]Error: {e}[/]")
         
         console.print()
-        Prompt.ask("[dim]Press Enter to continue[/]")
+        Prompt.ask(_PRESS_ENTER_CONTINUE)
         clear_screen()
         show_banner()
 
 
 def main():
     """Entry point."""
+    # uvloop is an optional, faster drop-in event loop (not available on Windows)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     try:
         asyncio.run(main_loop())
     except KeyboardInterrupt:
         console.print("\n[bold cyan]👋 Goodbye![/]\n")
+    finally:
+        close_db()
 
 
 if __name__ == "__main__":
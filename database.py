@@ -20,9 +20,75 @@ try:
 except ImportError:
     raise ImportError("DuckDB is required. Install with: pip install duckdb")
 
+try:
+    import pyarrow as pa
+except ImportError:
+    raise ImportError("PyArrow is required. Install with: pip install pyarrow")
+
 logger = logging.getLogger(__name__)
 
 
+def _as_text(value: Any) -> Optional[str]:
+    """Coerce a value to str for VARCHAR columns, keeping None as NULL."""
+    if value is None or isinstance(value, str):
+        return value
+    return str(value)
+
+
+def _sql_literal(value: str) -> str:
+    """Quote a string as a SQL literal (COPY targets cannot be bound parameters)."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _as_tags(value: Any) -> Optional[List[str]]:
+    """Coerce hashtags (list or comma-joined string) to a list for VARCHAR[] columns."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.split(',')
+    return [str(tag).strip() for tag in value if str(tag).strip()]
+
+
+def _as_int(value: Any) -> int:
+    """Coerce a value to int for INTEGER columns, defaulting to 0."""
+    try:
+        return int(value or 0)
+    except (ValueError, TypeError):
+        return 0
+
+
+def _as_float(value: Any) -> float:
+    """Coerce a value to float for FLOAT columns, defaulting to 0.0."""
+    try:
+        return float(value or 0)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse a post timestamp, returning None if it is missing or invalid."""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        return None
+
+
+def _parse_scraped_at(value: Any) -> Optional[datetime]:
+    """Parse a scraped_at value, falling back to now if it is invalid."""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except (ValueError, AttributeError, TypeError):
+        return datetime.now()
+
+
 class Database:
     """
     Production-grade embedded database for social media data.
@@ -41,16 +107,22 @@ class Database:
     
     # Schema definition
     SCHEMA = """
+        CREATE SEQUENCE IF NOT EXISTS posts_id_seq;
+        
+        -- Closed label sets produced by the Transformer, stored as 1-byte ENUMs
+        CREATE TYPE IF NOT EXISTS sentiment_t AS ENUM ('positive', 'negative', 'neutral');
+        CREATE TYPE IF NOT EXISTS engagement_t AS ENUM ('low', 'medium', 'high', 'viral');
+        
         CREATE TABLE IF NOT EXISTS posts (
-            id INTEGER PRIMARY KEY,
+            id INTEGER PRIMARY KEY DEFAULT nextval('posts_id_seq'),
             post_id VARCHAR NOT NULL,
             platform VARCHAR NOT NULL,
             post_text TEXT,
-            hashtags VARCHAR,
+            hashtags VARCHAR[],
             timestamp TIMESTAMP,
             image_url VARCHAR,
-            likes INTEGER DEFAULT 0,
-            comments INTEGER DEFAULT 0,
+            likes UINTEGER DEFAULT 0,
+            comments UINTEGER DEFAULT 0,
             author VARCHAR,
             url VARCHAR,
             scraped_at TIMESTAMP,
@@ -58,48 +130,207 @@ class Database:
             -- Platform-specific fields
             subreddit VARCHAR,              -- Reddit
             upvote_ratio FLOAT,             -- Reddit
-            retweet_count INTEGER,          -- Twitter
-            view_count INTEGER,             -- YouTube
+            retweet_count UINTEGER,         -- Twitter
+            view_count UBIGINT,             -- YouTube (can exceed 4B)
             duration VARCHAR,               -- YouTube
             channel_id VARCHAR,             -- YouTube
             
             -- ETL metadata
-            sentiment_label VARCHAR,
-            engagement_level VARCHAR,
+            sentiment_label sentiment_t,
+            engagement_level engagement_t,
             processed_at TIMESTAMP,
             
             -- Unique constraint to avoid duplicates
             UNIQUE(post_id, platform)
         );
         
-        -- Indexes for fast queries
-        CREATE INDEX IF NOT EXISTS idx_platform ON posts(platform);
+        -- Indexes for fast queries (platform and sentiment_label have only a
+        -- handful of values, so zone maps + scans beat an ART index there)
         CREATE INDEX IF NOT EXISTS idx_timestamp ON posts(timestamp);
         CREATE INDEX IF NOT EXISTS idx_author ON posts(author);
-        CREATE INDEX IF NOT EXISTS idx_sentiment ON posts(sentiment_label);
+        DROP INDEX IF EXISTS idx_platform;
+        DROP INDEX IF EXISTS idx_sentiment;
+    """
+    
+    # Columns written by insert_posts, in staging-table order
+    STAGING_SCHEMA = pa.schema([
+        ('post_id', pa.string()),
+        ('platform', pa.string()),
+        ('post_text', pa.string()),
+        ('hashtags', pa.list_(pa.string())),
+        ('timestamp', pa.timestamp('us')),
+        ('image_url', pa.string()),
+        ('likes', pa.int64()),
+        ('comments', pa.int64()),
+        ('author', pa.string()),
+        ('url', pa.string()),
+        ('scraped_at', pa.timestamp('us')),
+        ('subreddit', pa.string()),
+        ('upvote_ratio', pa.float64()),
+        ('retweet_count', pa.int64()),
+        ('view_count', pa.int64()),
+        ('duration', pa.string()),
+        ('channel_id', pa.string()),
+        ('sentiment_label', pa.string()),
+        ('engagement_level', pa.string()),
+        ('processed_at', pa.timestamp('us')),
+    ])
+    INSERT_COLUMNS = STAGING_SCHEMA.names
+    
+    # Columns narrower than their staging type; values are cast on load and
+    # pre-existing VARCHAR/INTEGER columns are migrated by _init_schema
+    COLUMN_TYPES = {
+        'likes': 'UINTEGER',
+        'comments': 'UINTEGER',
+        'retweet_count': 'UINTEGER',
+        'view_count': 'UBIGINT',
+        'sentiment_label': 'sentiment_t',
+        'engagement_level': 'engagement_t',
+        'hashtags': 'VARCHAR[]',
+    }
+    
+    # Columns callers may project in get_posts/search/export_*
+    ALLOWED_COLUMNS = frozenset(['id', *INSERT_COLUMNS])
+    
+    # Upsert from a staging relation; formatted by _upsert_sql
+    UPSERT_SQL = """
+        INSERT INTO posts ({columns})
+        SELECT {expressions} FROM {source}
+        ON CONFLICT (post_id, platform) DO UPDATE SET
+            likes = excluded.likes,
+            comments = excluded.comments,
+            scraped_at = excluded.scraped_at
     """
+    # Columns UPSERT_SQL refreshes on conflict (every other column keeps the first insert)
+    UPSERT_UPDATED_COLUMNS = ('likes', 'comments', 'scraped_at')
+    
+    # Per-column coercion used by insert_columns (processed_at is set at load time)
+    COLUMN_CONVERTERS = {
+        field.name: {
+            pa.string(): _as_text,
+            pa.int64(): _as_int,
+            pa.float64(): _as_float,
+            pa.list_(pa.string()): _as_tags,
+        }.get(field.type, _parse_timestamp)
+        for field in STAGING_SCHEMA
+    }
+    COLUMN_CONVERTERS['scraped_at'] = _parse_scraped_at
     
-    def __init__(self, db_path: str = "social_media.duckdb"):
+    def __init__(
+        self,
+        db_path: str = "social_media.duckdb",
+        threads: Optional[int] = None,
+        memory_limit: Optional[str] = None
+    ):
         """
         Initialize database connection.
         
         Args:
             db_path: Path to DuckDB database file
+            threads: Worker threads for query execution (default: CPU count)
+            memory_limit: DuckDB memory limit, e.g. '4GB' (default: DuckDB's own)
         """
         self.db_path = db_path
         self.conn = duckdb.connect(db_path)
+        self.conn.execute(f"SET threads = {int(threads or os.cpu_count() or 1)}")
+        if memory_limit:
+            self.conn.execute("SET memory_limit = ?", [memory_limit])
         self._init_schema()
+        self._insert_sql = self._upsert_sql(self.INSERT_COLUMNS)
+        self._fts_available = self._load_fts()
+        self._fts_fresh = False
         logger.info(f"Database initialized: {db_path}")
     
     def _init_schema(self):
         """Create tables and indexes if they don't exist."""
         self.conn.execute(self.SCHEMA)
+        self._migrate_column_types()
         self.conn.commit()
     
+    def _migrate_column_types(self):
+        """
+        Rebuild a posts table created by an older schema with COLUMN_TYPES.
+        
+        DuckDB can't ALTER columns of an indexed table, so rows are copied
+        out, the table is recreated from SCHEMA and the rows cast back in.
+        """
+        current = dict(self.conn.execute("""
+            SELECT column_name, data_type FROM information_schema.columns
+            WHERE table_name = 'posts'
+        """).fetchall())
+        
+        outdated = [
+            column for column, column_type in self.COLUMN_TYPES.items()
+            if current.get(column) not in (None, column_type) and not current[column].startswith('ENUM')
+        ]
+        if not outdated:
+            return
+        
+        columns = ['id', *self.INSERT_COLUMNS]
+        self.conn.begin()
+        try:
+            self.conn.execute("CREATE TEMP TABLE posts_migration AS SELECT * FROM posts")
+            self.conn.execute("DROP TABLE posts")
+            self.conn.execute(self.SCHEMA)
+            self.conn.execute(f"""
+                INSERT INTO posts ({', '.join(columns)})
+                SELECT {', '.join(self._cast_expression(column, current.get(column)) for column in columns)}
+                FROM posts_migration
+            """)
+            self.conn.execute("DROP TABLE posts_migration")
+            self.conn.commit()
+            logger.info(f"Migrated posts columns to narrower types: {', '.join(outdated)}")
+        except Exception as e:
+            self.conn.rollback()
+            logger.warning(f"Could not migrate posts column types: {e}")
+    
+    @classmethod
+    def _cast_expression(cls, column: str, source_type: Optional[str] = None) -> str:
+        """
+        SQL converting a raw column to its stored type (invalid values become NULL).
+        
+        Args:
+            column: Column name
+            source_type: DuckDB type of the source column, if known
+        """
+        column_type = cls.COLUMN_TYPES.get(column)
+        if column_type is None:
+            return column
+        if column_type == 'VARCHAR[]' and source_type == 'VARCHAR':
+            # Comma-joined tags from older tables, or '[a, b]' lists from CSV exports
+            return (
+                f"CASE WHEN starts_with({column}, '[') THEN TRY_CAST({column} AS VARCHAR[]) "
+                f"ELSE list_filter(list_transform(string_split({column}, ','), tag -> trim(tag)), tag -> tag != '') END"
+            )
+        if column_type.startswith('U'):
+            # Counts are never negative; out-of-range values become NULL instead of failing the batch
+            return f"TRY_CAST(greatest(TRY_CAST({column} AS HUGEINT), 0) AS {column_type})"
+        return f"TRY_CAST({column} AS {column_type})"
+    
+    @classmethod
+    def _upsert_sql(
+        cls,
+        columns: List[str],
+        source: str = "stg_posts",
+        source_types: Optional[Dict[str, str]] = None
+    ) -> str:
+        """UPSERT_SQL for the given columns read from `source`."""
+        source_types = source_types or {}
+        return cls.UPSERT_SQL.format(
+            columns=', '.join(columns),
+            expressions=', '.join(
+                f"{cls._cast_expression(column, source_types.get(column))} AS {column}" for column in columns
+            ),
+            source=source
+        )
+    
     def insert_posts(self, posts: List[Dict], batch_size: int = 1000) -> int:
         """
         Insert posts into database with upsert logic.
         
+        Rows are converted to a columnar Arrow table and loaded with a single
+        INSERT ... SELECT per batch instead of one INSERT per post.
+        
         Args:
             posts: List of post dictionaries
             batch_size: Number of records per batch
@@ -110,79 +341,191 @@ class Database:
         if not posts:
             return 0
         
-        inserted = 0
+        # One processing timestamp for the whole call
+        processed_at = datetime.now()
         
+        rows = []
         for post in posts:
             try:
-                # Parse timestamp
-                timestamp = None
-                if post.get('timestamp'):
-                    try:
-                        timestamp = datetime.fromisoformat(
-                            post['timestamp'].replace('Z', '+00:00')
-                        )
-                    except (ValueError, AttributeError):
-                        timestamp = None
-                
-                scraped_at = None
-                if post.get('scraped_at'):
-                    try:
-                        scraped_at = datetime.fromisoformat(post['scraped_at'])
-                    except (ValueError, AttributeError):
-                        scraped_at = datetime.now()
-                
-                # Insert with conflict handling
-                self.conn.execute("""
-                    INSERT INTO posts (
-                        post_id, platform, post_text, hashtags, timestamp,
-                        image_url, likes, comments, author, url, scraped_at,
-                        subreddit, upvote_ratio, retweet_count, view_count,
-                        duration, channel_id, sentiment_label, engagement_level,
-                        processed_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT (post_id, platform) DO UPDATE SET
-                        likes = excluded.likes,
-                        comments = excluded.comments,
-                        scraped_at = excluded.scraped_at
-                """, [
-                    post.get('post_id'),
-                    post.get('platform'),
-                    post.get('post_text'),
-                    post.get('hashtags'),
-                    timestamp,
-                    post.get('image_url'),
-                    int(post.get('likes', 0) or 0),
-                    int(post.get('comments', 0) or 0),
-                    post.get('author'),
-                    post.get('url'),
-                    scraped_at,
-                    post.get('subreddit'),
-                    float(post.get('upvote_ratio', 0) or 0),
-                    int(post.get('retweet_count', 0) or 0),
-                    int(post.get('view_count', 0) or 0),
-                    post.get('duration'),
-                    post.get('channel_id'),
-                    post.get('sentiment_label'),
-                    post.get('engagement_level'),
-                    datetime.now()
-                ])
-                inserted += 1
-                
+                rows.append(self._prepare_row(post, processed_at))
             except Exception as e:
-                logger.warning(f"Error inserting post {post.get('post_id')}: {e}")
+                logger.warning(f"Error preparing post {post.get('post_id')}: {e}")
+        
+        if not rows:
+            return 0
+        
+        columns = list(zip(*rows))
+        table = pa.Table.from_arrays(
+            [pa.array(column, type=field.type) for column, field in zip(columns, self.STAGING_SCHEMA)],
+            schema=self.STAGING_SCHEMA
+        )
+        return self.insert_arrow(table, batch_size)
+    
+    def insert_columns(self, columns: Dict[str, List], batch_size: int = 1000) -> int:
+        """
+        Insert posts given as parallel lists, one list per column.
+        
+        Avoids building a dict per post when the caller already holds the
+        data column-wise (see Transformer.transform_columns).
+        
+        Args:
+            columns: Mapping of column name to values; missing columns are NULL
+            batch_size: Number of records per batch
+            
+        Returns:
+            Number of records inserted/updated
+        """
+        post_ids = columns.get('post_id') or []
+        platforms = columns.get('platform') or [None] * len(post_ids)
+        
+        keep = [i for i, (post_id, platform) in enumerate(zip(post_ids, platforms)) if post_id and platform]
+        if len(keep) < len(post_ids):
+            logger.warning(f"Skipping {len(post_ids) - len(keep)} posts missing required fields (post_id, platform)")
+        if not keep:
+            return 0
+        
+        processed_at = datetime.now()
+        arrays = []
+        for field in self.STAGING_SCHEMA:
+            if field.name == 'processed_at':
+                arrays.append(pa.array([processed_at] * len(keep), type=field.type))
+                continue
+            
+            values = columns.get(field.name)
+            if values is None:
+                arrays.append(pa.nulls(len(keep), type=field.type))
                 continue
+            
+            convert = self.COLUMN_CONVERTERS[field.name]
+            arrays.append(pa.array([convert(values[i]) for i in keep], type=field.type))
+        
+        table = pa.Table.from_arrays(arrays, schema=self.STAGING_SCHEMA)
+        return self.insert_arrow(table, batch_size)
+    
+    def insert_arrow(self, table: "pa.Table", batch_size: int = 1000) -> int:
+        """
+        Upsert an Arrow table shaped like STAGING_SCHEMA.
+        
+        Args:
+            table: Arrow table with (at least) the INSERT_COLUMNS columns
+            batch_size: Number of records per batch
+            
+        Returns:
+            Number of records inserted/updated
+        """
+        if table.num_rows == 0:
+            return 0
+        
+        table = table.select(self.INSERT_COLUMNS)
+        
+        # A batch must not upsert the same (post_id, platform) twice; merge duplicates
+        # the way UPSERT_SQL would: first row's content, last row's refreshed columns
+        keys = list(zip(table.column('post_id').to_pylist(), table.column('platform').to_pylist()))
+        first_index, last_index = {}, {}
+        for i, key in enumerate(keys):
+            first_index.setdefault(key, i)
+            last_index[key] = i
+        if len(first_index) < table.num_rows:
+            firsts = sorted(first_index.values())
+            lasts = [last_index[keys[i]] for i in firsts]
+            merged = table.take(firsts)
+            for column in self.UPSERT_UPDATED_COLUMNS:
+                position = merged.schema.get_field_index(column)
+                merged = merged.set_column(position, column, table.column(column).take(lasts))
+            table = merged
+        
+        inserted = 0
+        
+        # One explicit transaction for all batches; a failed batch rolls back the whole call
+        self.conn.begin()
+        try:
+            for start in range(0, table.num_rows, batch_size):
+                staging = table.slice(start, batch_size)
+                
+                self.conn.register('stg_posts', staging)
+                try:
+                    self.conn.execute(self._insert_sql)
+                finally:
+                    self.conn.unregister('stg_posts')
+                inserted += staging.num_rows
+            
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            logger.warning(f"Error inserting posts, rolled back {table.num_rows} rows: {e}")
+            return 0
+        
+        self._fts_fresh = False
         
-        self.conn.commit()
         logger.info(f"Inserted/updated {inserted} posts")
         return inserted
     
-    def query(self, sql: str, params: Optional[List] = None) -> List[Dict]:
+    def find_existing(self, keys: List[tuple]) -> set:
+        """
+        Return which (post_id, platform) keys are already stored.
+        
+        Uses one semi join against an Arrow table of the keys instead of a
+        lookup query per post.
+        
+        Args:
+            keys: List of (post_id, platform) tuples
+            
+        Returns:
+            Set of the keys that exist in the posts table
+        """
+        if not keys:
+            return set()
+        
+        post_ids, platforms = zip(*keys)
+        incoming = pa.table({
+            'post_id': pa.array([_as_text(v) for v in post_ids], pa.string()),
+            'platform': pa.array([_as_text(v) for v in platforms], pa.string()),
+        })
+        
+        with self.conn.cursor() as cursor:
+            cursor.register('incoming', incoming)
+            rows = cursor.execute("""
+                SELECT i.post_id, i.platform FROM incoming i
+                SEMI JOIN posts p ON p.post_id = i.post_id AND p.platform = i.platform
+            """).fetchall()
+        return set(rows)
+    
+    def _prepare_row(self, post: Dict, processed_at: datetime) -> tuple:
+        """Convert a post dictionary into a tuple ordered like INSERT_COLUMNS."""
+        if not post.get('post_id') or not post.get('platform'):
+            raise ValueError("Missing required fields (post_id, platform)")
+        
+        return (
+            _as_text(post.get('post_id')),
+            _as_text(post.get('platform')),
+            _as_text(post.get('post_text')),
+            _as_tags(post.get('hashtags')),
+            _parse_timestamp(post.get('timestamp')),
+            _as_text(post.get('image_url')),
+            int(post.get('likes', 0) or 0),
+            int(post.get('comments', 0) or 0),
+            _as_text(post.get('author')),
+            _as_text(post.get('url')),
+            _parse_scraped_at(post.get('scraped_at')),
+            _as_text(post.get('subreddit')),
+            float(post.get('upvote_ratio', 0) or 0),
+            int(post.get('retweet_count', 0) or 0),
+            int(post.get('view_count', 0) or 0),
+            _as_text(post.get('duration')),
+            _as_text(post.get('channel_id')),
+            _as_text(post.get('sentiment_label')),
+            _as_text(post.get('engagement_level')),
+            processed_at
+        )
+    
+    def query(self, sql: str, params: Optional[List] = None, max_rows: Optional[int] = None) -> List[Dict]:
         """
         Execute SQL query and return results as list of dicts.
         
         Args:
             sql: SQL query string
             params: Optional query parameters
+            max_rows: Fetch at most this many rows (optional)
             
         Returns:
             List of result dictionaries
@@ -194,7 +537,10 @@ class Database:
                 result = self.conn.execute(sql)
             
             columns = [desc[0] for desc in result.description]
-            rows = result.fetchall()
+            if max_rows is not None:
+                rows = result.fetchmany(max_rows)
+            else:
+                rows = result.fetchall()
             
             return [dict(zip(columns, row)) for row in rows]
             
@@ -202,12 +548,22 @@ class Database:
             logger.error(f"Query error: {e}")
             return []
     
+    def _select_list(self, columns: Optional[List[str]] = None) -> str:
+        """Build a SELECT list from whitelisted column names (all columns if None)."""
+        if not columns:
+            return "*"
+        selected = [column for column in columns if column in self.ALLOWED_COLUMNS]
+        if not selected:
+            raise ValueError(f"No valid columns in {columns}")
+        return ", ".join(selected)
+    
     def get_posts(
         self, 
         platform: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
-        order_by: str = "scraped_at DESC"
+        order_by: str = "scraped_at DESC",
+        columns: Optional[List[str]] = None
     ) -> List[Dict]:
         """
         Get posts with optional filtering.
@@ -217,11 +573,12 @@ class Database:
             limit: Maximum records to return
             offset: Skip this many records
             order_by: SQL ORDER BY clause
+            columns: Columns to return (all if None)
             
         Returns:
             List of post dictionaries
         """
-        sql = "SELECT * FROM posts"
+        sql = f"SELECT {self._select_list(columns)} FROM posts"
         params = []
         
         if platform:
@@ -240,75 +597,172 @@ class Database:
         Returns:
             Dictionary with stats (counts, platforms, etc.)
         """
-        stats = {}
-        
-        # Total count
-        result = self.query("SELECT COUNT(*) as count FROM posts")
-        stats['total_posts'] = result[0]['count'] if result else 0
-        
-        # Count by platform
-        result = self.query("""
-            SELECT platform, COUNT(*) as count 
-            FROM posts 
-            GROUP BY platform 
-            ORDER BY count DESC
+        # One scan over posts computes every breakdown via GROUPING SETS;
+        # only the top 10 author groups are returned
+        rows = self.query("""
+            SELECT
+                GROUPING(platform) = 0 AS is_platform,
+                GROUPING(sentiment_label) = 0 AS is_sentiment,
+                GROUPING(author) = 0 AS is_author,
+                platform,
+                sentiment_label,
+                author,
+                COUNT(*) AS count,
+                MIN(timestamp) AS oldest,
+                MAX(timestamp) AS newest
+            FROM posts
+            GROUP BY GROUPING SETS ((platform), (sentiment_label), (author), ())
+            QUALIFY NOT is_author OR (
+                author IS NOT NULL AND author != '[deleted]'
+                AND row_number() OVER (
+                    PARTITION BY is_author, author IS NOT NULL AND author != '[deleted]'
+                    ORDER BY count DESC
+                ) <= 10
+            )
         """)
-        stats['by_platform'] = {row['platform']: row['count'] for row in result}
         
-        # Count by sentiment
-        result = self.query("""
-            SELECT sentiment_label, COUNT(*) as count 
-            FROM posts 
-            WHERE sentiment_label IS NOT NULL
-            GROUP BY sentiment_label
-        """)
-        stats['by_sentiment'] = {row['sentiment_label']: row['count'] for row in result}
-        
-        # Top authors
-        result = self.query("""
-            SELECT author, COUNT(*) as count 
-            FROM posts 
-            WHERE author IS NOT NULL AND author != '[deleted]'
-            GROUP BY author 
-            ORDER BY count DESC 
-            LIMIT 10
-        """)
-        stats['top_authors'] = result
+        stats = {'total_posts': 0, 'by_platform': {}, 'by_sentiment': {}, 'top_authors': []}
+        date_range = None
         
-        # Date range
-        result = self.query("""
-            SELECT 
-                MIN(timestamp) as oldest,
-                MAX(timestamp) as newest
-            FROM posts
-            WHERE timestamp IS NOT NULL
-        """)
-        if result and result[0]['oldest']:
+        for row in sorted(rows, key=lambda r: r['count'], reverse=True):
+            if row['is_platform']:
+                stats['by_platform'][row['platform']] = row['count']
+            elif row['is_sentiment']:
+                if row['sentiment_label'] is not None:
+                    stats['by_sentiment'][row['sentiment_label']] = row['count']
+            elif row['is_author']:
+                stats['top_authors'].append({'author': row['author'], 'count': row['count']})
+            else:
+                stats['total_posts'] = row['count']
+                date_range = row
+        
+        if date_range and date_range['oldest']:
             stats['date_range'] = {
-                'oldest': str(result[0]['oldest']),
-                'newest': str(result[0]['newest'])
+                'oldest': str(date_range['oldest']),
+                'newest': str(date_range['newest'])
             }
         
         return stats
     
-    def search(self, query: str, limit: int = 100) -> List[Dict]:
+    def search(self, query: str, limit: int = 100, columns: Optional[List[str]] = None) -> List[Dict]:
         """
         Full-text search across post content.
         
         Args:
             query: Search term
             limit: Maximum results
+            columns: Columns to return (all if None)
             
         Returns:
-            Matching posts
+            Matching posts, ranked by relevance when the fts extension is available
         """
-        return self.query("""
-            SELECT * FROM posts 
+        if self._ensure_fts_index():
+            # BM25 relevance ranking from the fts extension; score only orders
+            # the rows, so results have the same columns as the ILIKE fallback
+            select_list = self._select_list(columns)
+            if select_list == "*":
+                select_list = "* EXCLUDE (score)"
+            return self.query(f"""
+                SELECT {select_list} FROM (
+                    SELECT *, fts_main_posts.match_bm25(id, ?) AS score FROM posts
+                )
+                WHERE score IS NOT NULL
+                ORDER BY score DESC
+                LIMIT ?
+            """, [query, limit])
+        
+        return self.query(f"""
+            SELECT {self._select_list(columns)} FROM posts 
             WHERE post_text ILIKE ?
             ORDER BY likes DESC
             LIMIT ?
         """, [f'%{query}%', limit])
     
+    def count_search(self, query: str) -> int:
+        """Count posts matching a full-text search term."""
+        if self._ensure_fts_index():
+            result = self.query("""
+                SELECT COUNT(*) AS count FROM posts
+                WHERE fts_main_posts.match_bm25(id, ?) IS NOT NULL
+            """, [query])
+        else:
+            result = self.query("""
+                SELECT COUNT(*) AS count FROM posts 
+                WHERE post_text ILIKE ?
+            """, [f'%{query}%'])
+        return result[0]['count'] if result else 0
+    
+    def install_fts(self) -> bool:
+        """
+        Download and load DuckDB's fts extension (needs network access).
+        
+        Only needed once per machine; later connections load the installed
+        extension on their own.
+        
+        Returns:
+            True if full-text search is now available
+        """
+        try:
+            self.conn.execute("INSTALL fts")
+            self.conn.execute("LOAD fts")
+        except Exception as e:
+            logger.warning(f"Could not install DuckDB fts extension: {e}")
+            return False
+        self._fts_available = True
+        self._fts_fresh = False
+        return True
+    
+    def _load_fts(self) -> bool:
+        """Load DuckDB's fts extension if it is already installed (never downloads it)."""
+        installed = self.conn.execute(
+            "SELECT installed FROM duckdb_extensions() WHERE extension_name = 'fts'"
+        ).fetchone()
+        if not (installed and installed[0]):
+            logger.info("DuckDB fts extension not installed, search uses ILIKE (see Database.install_fts)")
+            return False
+        try:
+            self.conn.execute("LOAD fts")
+        except Exception as e:
+            logger.info(f"DuckDB fts extension unavailable, search falls back to ILIKE: {e}")
+            return False
+        return True
+    
+    def _ensure_fts_index(self) -> bool:
+        """
+        Build the BM25 index over post_text if rows changed since the last build.
+        
+        DuckDB's FTS index is not updated by inserts. Upserts never change
+        post_text and rows are not deleted, so the index is current as long
+        as the row count matches the one recorded in fts_index_state when it
+        was built; that survives reconnects, so reopening a database doesn't
+        rebuild it.
+        
+        Returns:
+            True if full-text search can be used
+        """
+        if not self._fts_available:
+            return False
+        if self._fts_fresh:
+            return True
+        try:
+            current = self.conn.execute("""
+                SELECT (SELECT COUNT(*) FROM posts) = (SELECT indexed_rows FROM fts_index_state)
+            """).fetchone()[0]
+        except Exception:
+            current = False  # never built in this database file
+        if not current:
+            try:
+                self.conn.execute("PRAGMA create_fts_index('posts', 'id', 'post_text', overwrite=1)")
+                self.conn.execute(
+                    "CREATE OR REPLACE TABLE fts_index_state AS SELECT COUNT(*) AS indexed_rows FROM posts"
+                )
+            except Exception as e:
+                logger.warning(f"Could not build full-text index, falling back to ILIKE: {e}")
+                self._fts_available = False
+                return False
+        self._fts_fresh = True
+        return True
+    
     def get_sentiment_distribution(self, platform: Optional[str] = None) -> List[Dict]:
         """Get sentiment distribution, optionally filtered by platform."""
         sql = """
@@ -331,52 +785,83 @@ class Database:
     
     def get_top_hashtags(self, limit: int = 20) -> List[Dict]:
         """Get most common hashtags across all posts."""
-        # DuckDB supports string splitting
+        # hashtags is a VARCHAR[] list, so tags unnest without string splitting
         return self.query("""
-            SELECT 
-                TRIM(hashtag) as hashtag,
-                COUNT(*) as count
-            FROM (
-                SELECT UNNEST(STRING_SPLIT(hashtags, ',')) as hashtag
-                FROM posts
-                WHERE hashtags IS NOT NULL AND hashtags != ''
-            )
-            WHERE TRIM(hashtag) != ''
-            GROUP BY TRIM(hashtag)
+            SELECT hashtag, COUNT(*) as count
+            FROM (SELECT UNNEST(hashtags) as hashtag FROM posts)
+            WHERE hashtag != ''
+            GROUP BY hashtag
             ORDER BY count DESC
             LIMIT ?
         """, [limit])
     
-    def export_csv(self, filepath: str, platform: Optional[str] = None):
+    def export_csv(self, filepath: str, platform: Optional[str] = None, columns: Optional[List[str]] = None):
         """Export data to CSV file."""
-        sql = "SELECT * FROM posts"
+        sql = f"SELECT {self._select_list(columns)} FROM posts"
+        params = []
         if platform:
-            sql += f" WHERE platform = '{platform}'"
+            sql += " WHERE platform = ?"
+            params.append(platform)
         
-        self.conn.execute(f"COPY ({sql}) TO '{filepath}' (HEADER, DELIMITER ',')")
+        # A cursor gets its own connection handle so exports can run in parallel threads
+        with self.conn.cursor() as cursor:
+            cursor.execute(f"COPY ({sql}) TO {_sql_literal(filepath)} (HEADER, DELIMITER ',')", params)
         logger.info(f"Exported to {filepath}")
     
-    def export_parquet(self, filepath: str, platform: Optional[str] = None):
+    def export_parquet(self, filepath: str, platform: Optional[str] = None, columns: Optional[List[str]] = None):
         """Export data to Parquet file (compressed, fast to load)."""
-        sql = "SELECT * FROM posts"
+        sql = f"SELECT {self._select_list(columns)} FROM posts"
+        params = []
         if platform:
-            sql += f" WHERE platform = '{platform}'"
+            sql += " WHERE platform = ?"
+            params.append(platform)
         
-        self.conn.execute(f"COPY ({sql}) TO '{filepath}' (FORMAT PARQUET)")
+        with self.conn.cursor() as cursor:
+            cursor.execute(f"COPY ({sql}) TO {_sql_literal(filepath)} (FORMAT PARQUET)", params)
         logger.info(f"Exported to {filepath}")
     
-    def import_csv(self, filepath: str):
+    def import_csv(self, filepath: str) -> int:
         """Import data from CSV file."""
+        return self._import_file('read_csv_auto', filepath)
+    
+    def import_parquet(self, filepath: str) -> int:
+        """Import data from Parquet file (faster to load than CSV)."""
+        return self._import_file('read_parquet', filepath)
+    
+    def _import_file(self, reader: str, filepath: str) -> int:
+        """
+        Upsert rows from a file straight into posts using a DuckDB reader.
+        
+        Only columns the file shares with INSERT_COLUMNS are loaded, so files
+        produced by export_csv/export_parquet (which include id) round-trip.
+        
+        Args:
+            reader: DuckDB table function (read_csv_auto or read_parquet)
+            filepath: Path to the file
+            
+        Returns:
+            Number of records inserted/updated
+        """
         if not os.path.exists(filepath):
-            raise FileNotFoundError(f"CSV file not found: {filepath}")
+            raise FileNotFoundError(f"File not found: {filepath}")
+        
+        file_columns = {row[0]: row[1] for row in self.conn.execute(
+            f"DESCRIBE SELECT * FROM {reader}(?)", [filepath]
+        ).fetchall()}
+        if not {'post_id', 'platform'} <= file_columns.keys():
+            raise ValueError(f"{filepath} is missing required columns (post_id, platform)")
+        
+        columns = [column for column in self.INSERT_COLUMNS if column in file_columns]
+        upsert_sql = self._upsert_sql(columns, source=f"""{reader}(?)
+            WHERE post_id IS NOT NULL AND platform IS NOT NULL
+            QUALIFY row_number() OVER (PARTITION BY post_id, platform) = 1""", source_types=file_columns)
         
-        # Read CSV and insert
-        result = self.conn.execute(f"""
-            SELECT * FROM read_csv_auto('{filepath}')
-        """).fetchall()
+        # DuckDB streams the file; rows never pass through Python
+        count = self.conn.execute(upsert_sql, [filepath]).fetchone()[0]
+        self._fts_fresh = False
         
-        logger.info(f"Imported {len(result)} records from {filepath}")
-        return len(result)
+        logger.info(f"Imported {count} records from {filepath}")
+        return count
     
     def close(self):
         """Close database connection."""
@@ -10,13 +10,35 @@ This module handles the T and L in ETL (scrapers handle E).
 
 import re
 import json
+import time
+import queue
+import threading
+from bisect import bisect_right
+from itertools import islice
 from datetime import datetime
 from typing import List, Dict, Optional, Generator, Any
 import logging
 
+# DuckDB/PyArrow are only needed for the optional vectorized transform
+try:
+    import duckdb
+    import pyarrow as pa
+    VECTORIZED_AVAILABLE = True
+except ImportError:
+    VECTORIZED_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _sql_text(value: Any) -> Optional[str]:
+    """Coerce a raw field to str for the vectorized transform, keeping None as NULL."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (list, tuple)):
+        return ','.join(map(str, value))
+    return str(value)
+
+
 class Transformer:
     """
     Transform raw scraped data into clean, enriched, labeled datasets.
@@ -26,11 +48,14 @@ class Transformer:
     2. Enrich: Add metadata, extract entities
     3. Label: Sentiment, engagement level, topics
     4. Validate: Ensure data quality
+    
+    Set config={'vectorized': True} to run the clean/enrich/label stages as a
+    single DuckDB SQL query over an Arrow table instead of per post in Python.
     """
     
     # Text patterns
-    URL_PATTERN = re.compile(r'https?://\S+|www\.\S+')
-    MENTION_PATTERN = re.compile(r'@\w+')
+    # URLs and mentions, counted together in one finditer pass
+    METADATA_PATTERN = re.compile(r'(?P<url>https?://\S+|www\.\S+)|(?P<mention>@\w+)')
     HASHTAG_PATTERN = re.compile(r'#(\w+)')
     EMOJI_PATTERN = re.compile(
         "["
@@ -45,21 +70,59 @@ class Transformer:
     )
     
     # Sentiment lexicons
-    POSITIVE_WORDS = {
+    POSITIVE_WORDS = frozenset({
         'love', 'loved', 'loving', 'great', 'amazing', 'awesome', 'excellent',
         'good', 'best', 'happy', 'wonderful', 'fantastic', 'brilliant', 'perfect',
         'beautiful', 'incredible', 'outstanding', 'superb', 'magnificent',
         'thank', 'thanks', 'grateful', 'appreciate', 'excited', 'joy', 'blessed',
         'recommend', 'recommended', 'favorite', 'favourite', 'impressive'
-    }
+    })
     
-    NEGATIVE_WORDS = {
+    NEGATIVE_WORDS = frozenset({
         'hate', 'hated', 'hating', 'bad', 'terrible', 'awful', 'worst', 'horrible',
         'angry', 'sad', 'disappointed', 'disappointing', 'frustrating', 'frustrated',
         'annoying', 'annoyed', 'useless', 'waste', 'poor', 'pathetic', 'disgusting',
         'ugly', 'stupid', 'boring', 'fail', 'failed', 'failing', 'sucks', 'broken',
         'scam', 'fake', 'trash', 'garbage', 'nightmare', 'disappoints'
+    })
+    
+    # Emoji sentiment indicators
+    POSITIVE_EMOJIS = frozenset({'😊', '😍', '❤️', '👍', '🎉', '💯', '🙏', '😁', '🔥', '💪'})
+    NEGATIVE_EMOJIS = frozenset({'😢', '😡', '👎', '💔', '😤', '🤮', '😭', '😠', '🙄'})
+    
+    # Word tokens looked up in the lexicons (so 'good/bad' and 'great,' still match)
+    WORD_PATTERN = re.compile(r'\w+')
+    
+    # HTML entities decoded by _clean_text ('&amp;' last so chained
+    # replacements never double-decode, matching the single-pass regex)
+    HTML_ENTITIES = {
+        '&lt;': '<',
+        '&gt;': '>',
+        '&quot;': '"',
+        '&#39;': "'",
+        '&#x200B;': '',
+        '&amp;': '&',
     }
+    ENTITY_PATTERN = re.compile('|'.join(map(re.escape, HTML_ENTITIES)))
+    
+    # Special Unicode characters replaced by _clean_text
+    CHAR_REPLACEMENTS = {
+        '\u2018': "'", '\u2019': "'",  # Smart quotes
+        '\u201c': '"', '\u201d': '"',
+        '\u2013': '-', '\u2014': '--',
+        '\u200b': '', '\ufeff': '',     # Zero-width chars
+        '\u00a0': ' ',                   # Non-breaking space
+    }
+    
+    # Fallback timestamp formats for strings fromisoformat rejects
+    TIMESTAMP_FORMATS = (
+        '%Y-%m-%dT%H:%M:%S.%fZ',
+        '%Y-%m-%dT%H:%M:%SZ',
+        '%Y-%m-%dT%H:%M:%S%z',
+        '%Y-%m-%dT%H:%M:%S.%f%z',
+        '%Y-%m-%dT%H:%M:%S',
+        '%Y-%m-%d %H:%M:%S',
+    )
     
     # Engagement thresholds by platform
     ENGAGEMENT_THRESHOLDS = {
@@ -69,6 +132,13 @@ class Transformer:
         'reddit': {'low': 10, 'medium': 100, 'high': 1000, 'viral': 10000},
     }
     
+    # Levels indexed by how many of a platform's cutoffs a score reaches
+    ENGAGEMENT_LEVELS = ('low', 'medium', 'high', 'viral')
+    _ENGAGEMENT_CUTOFFS = {
+        platform: (levels['medium'], levels['high'], levels['viral'])
+        for platform, levels in ENGAGEMENT_THRESHOLDS.items()
+    }
+    
     def __init__(self, config: Optional[Dict] = None):
         """
         Initialize transformer with optional config.
@@ -82,6 +152,7 @@ class Transformer:
             'errors': 0,
             'sentiment': {'positive': 0, 'negative': 0, 'neutral': 0}
         }
+        self._last_format_idx = 0
     
     def transform(self, posts: List[Dict]) -> List[Dict]:
         """
@@ -93,12 +164,19 @@ class Transformer:
         Returns:
             List of transformed, enriched post dictionaries
         """
+        if self.config.get('vectorized') and VECTORIZED_AVAILABLE and posts:
+            try:
+                return self.transform_vectorized(posts)
+            except Exception as e:
+                logger.warning(f"Vectorized transform failed, falling back to per-post transform: {e}")
+        
         transformed = []
+        processed_at = datetime.now().isoformat()
         
         for post in posts:
             try:
                 # Run transformation pipeline
-                result = self._transform_single(post)
+                result = self._transform_single(post, processed_at)
                 if result:
                     transformed.append(result)
                     self.stats['processed'] += 1
@@ -110,94 +188,301 @@ class Transformer:
         logger.info(f"Transformed {len(transformed)} posts ({self.stats['errors']} errors)")
         return transformed
     
-    def _transform_single(self, post: Dict) -> Optional[Dict]:
-        """Transform a single post through the pipeline."""
-        if not post.get('post_id'):
-            return None
+    def transform_columns(self, posts: List[Dict], columns: List[str]) -> Dict[str, List]:
+        """
+        Transform posts into parallel per-column lists instead of post dicts.
         
-        result = post.copy()
+        Skips the per-post dict copy of transform(); the result can be handed
+        straight to Database.insert_columns.
         
-        # 1. Clean text
-        result['post_text'] = self._clean_text(post.get('post_text', ''))
+        Args:
+            posts: List of raw post dictionaries
+            columns: Output column names (raw fields are passed through)
+            
+        Returns:
+            Dict mapping each column name to a list of values
+        """
+        output = {column: [] for column in columns}
+        
+        if self.config.get('vectorized') and VECTORIZED_AVAILABLE:
+            for post in self.transform(posts):
+                for column, values in output.items():
+                    values.append(post.get(column))
+            return output
         
-        # 2. Extract and normalize hashtags
-        result['hashtags'] = self._normalize_hashtags(post.get('hashtags', ''))
+        processed_at = datetime.now().isoformat()
         
-        # 3. Normalize numeric fields
-        result['likes'] = self._safe_int(post.get('likes', 0))
-        result['comments'] = self._safe_int(post.get('comments', 0))
-        result['retweet_count'] = self._safe_int(post.get('retweet_count', 0))
-        result['view_count'] = self._safe_int(post.get('view_count', 0))
+        for post in posts:
+            if not post.get('post_id'):
+                continue
+            try:
+                derived = self._derive_fields(post, processed_at)
+            except Exception as e:
+                logger.warning(f"Transform error for post {post.get('post_id')}: {e}")
+                self.stats['errors'] += 1
+                continue
+            
+            for column, values in output.items():
+                values.append(derived[column] if column in derived else post.get(column))
+            self.stats['processed'] += 1
         
-        # 4. Parse and normalize timestamp
-        result['timestamp'] = self._normalize_timestamp(post.get('timestamp'))
+        logger.info(f"Transformed {len(output.get('post_id', []))} posts ({self.stats['errors']} errors)")
+        return output
+    
+    def transform_vectorized(self, posts: List[Dict]) -> List[Dict]:
+        """
+        Transform a batch of posts with one DuckDB query over an Arrow table.
         
-        # 5. Add sentiment label
-        result['sentiment_label'] = self._analyze_sentiment(result['post_text'])
-        self.stats['sentiment'][result['sentiment_label']] += 1
+        Text cleaning, hashtag normalization, numeric parsing, sentiment and
+        engagement labeling and metadata counts run as vectorized SQL; only
+        timestamp normalization and merging results back into the post dicts
+        happen per post in Python.
         
-        # 6. Add engagement level
-        result['engagement_level'] = self._calculate_engagement(
-            result['likes'],
-            result['comments'],
-            post.get('platform', 'unknown')
+        Args:
+            posts: List of raw post dictionaries
+            
+        Returns:
+            List of transformed, enriched post dictionaries
+        """
+        posts = [post for post in posts if post.get('post_id')]
+        if not posts:
+            return []
+        
+        raw = pa.table(
+            {'idx': pa.array(range(len(posts)), pa.int64())} | {
+                column: pa.array([_sql_text(post.get(column)) for post in posts], pa.string())
+                for column in self._VECTORIZED_INPUTS
+            }
         )
         
-        # 7. Extract metadata
-        result['word_count'] = len(result['post_text'].split())
-        result['has_media'] = bool(post.get('image_url'))
-        result['mention_count'] = len(self.MENTION_PATTERN.findall(post.get('post_text', '')))
-        result['url_count'] = len(self.URL_PATTERN.findall(post.get('post_text', '')))
+        conn = self._get_connection()
+        conn.register('raw_posts', raw)
+        try:
+            result = conn.execute(self._vectorized_sql(), self._vectorized_params())
+            columns = [desc[0] for desc in result.description]
+            rows = result.fetchall()
+        finally:
+            conn.unregister('raw_posts')
+        
+        processed_at = datetime.now().isoformat()
+        transformed = []
+        
+        for row in rows:
+            values = dict(zip(columns, row))
+            post = posts[values.pop('idx')]
+            
+            result = post.copy()
+            result.update(values)
+            result['timestamp'] = self._normalize_timestamp(post.get('timestamp'))
+            result['processed_at'] = processed_at
+            
+            self.stats['sentiment'][result['sentiment_label']] += 1
+            transformed.append(result)
+        
+        self.stats['processed'] += len(transformed)
+        logger.info(f"Transformed {len(transformed)} posts (vectorized)")
+        return transformed
+    
+    # Raw post fields read by the vectorized transform
+    _VECTORIZED_INPUTS = (
+        'platform', 'post_text', 'hashtags', 'image_url',
+        'likes', 'comments', 'retweet_count', 'view_count',
+    )
+    
+    # Characters Python's str.split() treats as whitespace (RE2's \s is ASCII-only)
+    _SQL_WHITESPACE = r'[\s\x0b\x1c-\x1f\x85\xa0\x{1680}\x{2000}-\x{200a}\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}]'
+    
+    # Equivalents of EMOJI_PATTERN and \w+ in RE2 syntax
+    _SQL_EMOJI = (
+        r'[\x{1F600}-\x{1F64F}\x{1F300}-\x{1F5FF}\x{1F680}-\x{1F6FF}'
+        r'\x{1F1E0}-\x{1F1FF}\x{2702}-\x{27B0}\x{24C2}-\x{1F251}]+'
+    )
+    _SQL_WORD = r'[\pL\pN_]+'
+    _SQL_URL = r'https?://\S+|www\.\S+'
+    
+    def _get_connection(self):
+        """Return the in-memory DuckDB connection used for vectorized transforms."""
+        if getattr(self, '_conn', None) is None:
+            self._conn = duckdb.connect()
+        return self._conn
+    
+    def _vectorized_params(self) -> List:
+        """Parameters for _vectorized_sql, in placeholder order."""
+        replacements = list(self.HTML_ENTITIES.items()) + list(self.CHAR_REPLACEMENTS.items())
+        return [value for pair in replacements for value in pair] + [
+            self._SQL_WHITESPACE + '+',
+            sorted(self.POSITIVE_WORDS),
+            sorted(self.POSITIVE_EMOJIS),
+            sorted(self.NEGATIVE_WORDS),
+            sorted(self.NEGATIVE_EMOJIS),
+            f'^{self._SQL_WHITESPACE}+|{self._SQL_WHITESPACE}+$',
+        ]
+    
+    def _vectorized_sql(self) -> str:
+        """Build the SQL that mirrors _transform_single for a whole batch."""
+        replacements = list(self.HTML_ENTITIES.items()) + list(self.CHAR_REPLACEMENTS.items())
+        clean_expr = "coalesce(post_text, '')"
+        for _ in replacements:
+            clean_expr = f"replace({clean_expr}, ?, ?)"
+        
+        def safe_int(column):
+            return f"coalesce(TRY_CAST(trunc(TRY_CAST(replace({column}, ',', '') AS DOUBLE)) AS BIGINT), 0)"
+        
+        thresholds = ', '.join(
+            f"('{platform}', {levels['medium']}, {levels['high']}, {levels['viral']})"
+            for platform, levels in self.ENGAGEMENT_THRESHOLDS.items()
+        )
         
-        # 8. Set processing timestamp
-        result['processed_at'] = datetime.now().isoformat()
+        return f"""
+            WITH cleaned AS (
+                SELECT
+                    *,
+                    trim(regexp_replace({clean_expr}, ?, ' ', 'g')) AS clean_text,
+                    {safe_int('likes')} AS likes_int,
+                    {safe_int('comments')} AS comments_int
+                FROM raw_posts
+            ),
+            scored AS (
+                SELECT
+                    *,
+                    list_distinct(regexp_extract_all(lower(clean_text), '{self._SQL_WORD}')) AS words,
+                    regexp_extract_all(clean_text, '{self._SQL_EMOJI}') AS emojis
+                FROM cleaned
+            ),
+            counted AS (
+                SELECT
+                    *,
+                    len(list_intersect(words, ?::VARCHAR[]))
+                        + len(list_filter(emojis, e -> list_contains(?::VARCHAR[], e))) AS positive_count,
+                    len(list_intersect(words, ?::VARCHAR[]))
+                        + len(list_filter(emojis, e -> list_contains(?::VARCHAR[], e))) AS negative_count
+                FROM scored
+            )
+            SELECT
+                c.idx,
+                c.clean_text AS post_text,
+                list_filter(
+                    list_transform(
+                        string_split(coalesce(c.hashtags, ''), ','),
+                        tag -> lower(regexp_replace(tag, ?, '', 'g'))
+                    ),
+                    tag -> length(tag) > 1
+                ) AS hashtags,
+                c.likes_int AS likes,
+                c.comments_int AS comments,
+                {safe_int('c.retweet_count')} AS retweet_count,
+                {safe_int('c.view_count')} AS view_count,
+                CASE
+                    WHEN c.positive_count > c.negative_count THEN 'positive'
+                    WHEN c.negative_count > c.positive_count THEN 'negative'
+                    ELSE 'neutral'
+                END AS sentiment_label,
+                CASE
+                    WHEN c.likes_int + c.comments_int * 3 >= coalesce(t.viral, d.viral) THEN 'viral'
+                    WHEN c.likes_int + c.comments_int * 3 >= coalesce(t.high, d.high) THEN 'high'
+                    WHEN c.likes_int + c.comments_int * 3 >= coalesce(t.medium, d.medium) THEN 'medium'
+                    ELSE 'low'
+                END AS engagement_level,
+                CASE WHEN c.clean_text = '' THEN 0 ELSE len(string_split(c.clean_text, ' ')) END AS word_count,
+                coalesce(c.image_url, '') != '' AS has_media,
+                len(regexp_extract_all(
+                    regexp_replace(coalesce(c.post_text, ''), '{self._SQL_URL}', ' ', 'g'),
+                    '@{self._SQL_WORD}'
+                )) AS mention_count,
+                len(regexp_extract_all(coalesce(c.post_text, ''), '{self._SQL_URL}')) AS url_count
+            FROM counted c
+            LEFT JOIN (VALUES {thresholds}) t(platform, medium, high, viral)
+                ON t.platform = coalesce(c.platform, 'unknown')
+            CROSS JOIN (VALUES {thresholds}) d(platform, medium, high, viral)
+            WHERE d.platform = 'twitter'
+            ORDER BY c.idx
+        """
+    
+    def _transform_single(self, post: Dict, processed_at: Optional[str] = None) -> Optional[Dict]:
+        """Transform a single post through the pipeline."""
+        if not post.get('post_id'):
+            return None
         
+        result = post.copy()
+        result.update(self._derive_fields(post, processed_at or datetime.now().isoformat()))
         return result
     
+    def _derive_fields(self, post: Dict, processed_at: str) -> Dict:
+        """Compute the cleaned and enriched fields for a single post."""
+        # 1. Clean text
+        post_text = self._clean_text(post.get('post_text', ''))
+        
+        # 2. Normalize numeric fields
+        likes = self._safe_int(post.get('likes', 0))
+        comments = self._safe_int(post.get('comments', 0))
+        
+        # 3. Add sentiment label
+        sentiment_label = self._analyze_sentiment(post_text)
+        self.stats['sentiment'][sentiment_label] += 1
+        
+        # 4. Count URLs and mentions in the raw text
+        counts = {'url': 0, 'mention': 0}
+        for match in self.METADATA_PATTERN.finditer(post.get('post_text') or ''):
+            counts[match.lastgroup] += 1
+        
+        return {
+            'post_text': post_text,
+            'hashtags': self._normalize_hashtags(post.get('hashtags', '')),
+            'likes': likes,
+            'comments': comments,
+            'retweet_count': self._safe_int(post.get('retweet_count', 0)),
+            'view_count': self._safe_int(post.get('view_count', 0)),
+            'timestamp': self._normalize_timestamp(post.get('timestamp')),
+            'sentiment_label': sentiment_label,
+            'engagement_level': self._calculate_engagement(likes, comments, post.get('platform', 'unknown')),
+            'word_count': len(post_text.split()),
+            'has_media': bool(post.get('image_url')),
+            'mention_count': counts['mention'],
+            'url_count': counts['url'],
+            'processed_at': processed_at,
+        }
+    
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text content."""
         if not text:
             return ""
         
-        # Decode HTML entities
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        text = text.replace('&quot;', '"')
-        text = text.replace('&#39;', "'")
-        text = text.replace('&#x200B;', '')
-        
-        # Replace special Unicode characters
-        replacements = {
-            '\u2018': "'", '\u2019': "'",  # Smart quotes
-            '\u201c': '"', '\u201d': '"',
-            '\u2013': '-', '\u2014': '--',
-            '\u200b': '', '\ufeff': '',     # Zero-width chars
-            '\u00a0': ' ',                   # Non-breaking space
-        }
-        for old, new in replacements.items():
+        # Decode HTML entities in one pass
+        if '&' in text:
+            text = self.ENTITY_PATTERN.sub(lambda m: self.HTML_ENTITIES[m.group()], text)
+        
+        # Replace special Unicode characters (chained str.replace beats a
+        # str.translate dict table on non-ASCII text)
+        for old, new in self.CHAR_REPLACEMENTS.items():
             text = text.replace(old, new)
         
         # Normalize whitespace
-        text = ' '.join(text.split())
-        
-        return text.strip()
+        return ' '.join(text.split())
     
-    def _normalize_hashtags(self, hashtags: str) -> str:
-        """Normalize hashtag string."""
+    def _normalize_hashtags(self, hashtags: Any) -> List[str]:
+        """Normalize hashtags (comma-joined string or list) to a list of tags."""
         if not hashtags:
-            return ""
+            return []
         
-        # Split, clean, and rejoin
-        tags = [tag.strip().lower() for tag in hashtags.split(',')]
-        tags = [tag for tag in tags if tag and len(tag) > 1]
+        # Split and clean
+        if isinstance(hashtags, str):
+            hashtags = hashtags.split(',')
+        tags = [str(tag).strip().lower() for tag in hashtags]
         
-        return ','.join(tags)
+        return [tag for tag in tags if len(tag) > 1]
     
     def _safe_int(self, value: Any) -> int:
         """Safely convert value to integer."""
         if value is None or value == '':
             return 0
+        # Scrapers mostly emit ints already; skip the str/float round trip
+        if type(value) is int:
+            return value
+        if type(value) is float:
+            try:
+                return int(value)
+            except (ValueError, OverflowError):
+                return 0
         try:
             return int(float(str(value).replace(',', '')))
         except (ValueError, TypeError):
@@ -212,24 +497,23 @@ class Transformer:
             return timestamp.isoformat()
         
         if isinstance(timestamp, str):
-            # Try parsing common formats
-            formats = [
-                '%Y-%m-%dT%H:%M:%S.%fZ',
-                '%Y-%m-%dT%H:%M:%SZ',
-                '%Y-%m-%dT%H:%M:%S%z',
-                '%Y-%m-%dT%H:%M:%S.%f%z',
-                '%Y-%m-%dT%H:%M:%S',
-                '%Y-%m-%d %H:%M:%S',
-            ]
-            
-            # Handle timezone suffix
-            ts = timestamp.replace('Z', '+00:00')
+            # Fast path: scrapers emit ISO-8601; a trailing 'Z' is dropped so
+            # the result stays naive like the strptime formats below
+            try:
+                return datetime.fromisoformat(timestamp[:-1] if timestamp.endswith('Z') else timestamp).isoformat()
+            except ValueError:
+                pass
             
-            for fmt in formats:
+            # Probe the remaining formats starting from the last one that matched
+            formats = self.TIMESTAMP_FORMATS
+            for offset in range(len(formats)):
+                idx = (self._last_format_idx + offset) % len(formats)
                 try:
-                    return datetime.strptime(timestamp, fmt).isoformat()
+                    parsed = datetime.strptime(timestamp, formats[idx])
                 except ValueError:
                     continue
+                self._last_format_idx = idx
+                return parsed.isoformat()
             
             # Return as-is if can't parse
             return timestamp
@@ -245,21 +529,18 @@ class Transformer:
         if not text:
             return 'neutral'
         
-        text_lower = text.lower()
-        words = set(re.findall(r'\b\w+\b', text_lower))
+        words = set(self.WORD_PATTERN.findall(text.lower()))
         
         positive_count = len(words & self.POSITIVE_WORDS)
         negative_count = len(words & self.NEGATIVE_WORDS)
         
-        # Check for emoji sentiment
-        emojis = self.EMOJI_PATTERN.findall(text)
-        positive_emojis = {'😊', '😍', '❤️', '👍', '🎉', '💯', '🙏', '😁', '🔥', '💪'}
-        negative_emojis = {'😢', '😡', '👎', '💔', '😤', '🤮', '😭', '😠', '🙄'}
+        # Check for emoji sentiment (ASCII-only text has none, skip the scan)
+        emojis = self.EMOJI_PATTERN.findall(text) if not text.isascii() else ()
         
         for emoji in emojis:
-            if emoji in positive_emojis:
+            if emoji in self.POSITIVE_EMOJIS:
                 positive_count += 1
-            elif emoji in negative_emojis:
+            elif emoji in self.NEGATIVE_EMOJIS:
                 negative_count += 1
         
         if positive_count > negative_count:
@@ -274,21 +555,12 @@ class Transformer:
         
         Returns: 'low', 'medium', 'high', or 'viral'
         """
-        thresholds = self.ENGAGEMENT_THRESHOLDS.get(
-            platform, 
-            self.ENGAGEMENT_THRESHOLDS['twitter']
-        )
+        cutoffs = self._ENGAGEMENT_CUTOFFS.get(platform, self._ENGAGEMENT_CUTOFFS['twitter'])
         
         # Weight comments higher than likes
         engagement_score = likes + (comments * 3)
         
-        if engagement_score >= thresholds['viral']:
-            return 'viral'
-        elif engagement_score >= thresholds['high']:
-            return 'high'
-        elif engagement_score >= thresholds['medium']:
-            return 'medium'
-        return 'low'
+        return self.ENGAGEMENT_LEVELS[bisect_right(cutoffs, engagement_score)]
     
     def get_stats(self) -> Dict:
         """Get transformation statistics."""
@@ -340,6 +612,25 @@ class Loader:
         logger.info(f"Loaded {loaded} posts into database")
         return loaded
     
+    def load_columns(self, columns: Dict[str, List]) -> int:
+        """
+        Load posts held as parallel per-column lists.
+        
+        Args:
+            columns: Output of Transformer.transform_columns
+            
+        Returns:
+            Number of records loaded
+        """
+        if not columns.get('post_id'):
+            return 0
+        
+        loaded = self.db.insert_columns(columns)
+        self.stats['loaded'] += loaded
+        
+        logger.info(f"Loaded {loaded} posts into database")
+        return loaded
+    
     def load_with_validation(self, posts: List[Dict]) -> Dict:
         """
         Load posts with validation and return detailed results.
@@ -356,6 +647,7 @@ class Loader:
             'duplicates': []
         }
         
+        valid = []
         for post in posts:
             # Validate required fields
             if not post.get('post_id') or not post.get('platform'):
@@ -364,25 +656,34 @@ class Loader:
                     'error': 'Missing required fields (post_id, platform)'
                 })
                 continue
-            
-            # Check for duplicate
-            existing = self.db.query(
-                "SELECT id FROM posts WHERE post_id = ? AND platform = ?",
-                [post['post_id'], post['platform']]
-            )
-            
-            if existing:
+            valid.append(post)
+        
+        # Check for duplicates with a single bulk lookup
+        existing = self.db.find_existing([(str(post['post_id']), str(post['platform'])) for post in valid])
+        
+        new_posts = []
+        for post in valid:
+            if (str(post['post_id']), str(post['platform'])) in existing:
                 results['duplicates'].append(post['post_id'])
-                continue
-            
+            else:
+                new_posts.append(post)
+        self.stats['duplicates'] += len(results['duplicates'])
+        
+        if new_posts:
             try:
-                self.db.insert_posts([post])
-                results['success'].append(post['post_id'])
+                loaded = self.db.insert_posts(new_posts)
             except Exception as e:
-                results['errors'].append({
-                    'post_id': post['post_id'],
-                    'error': str(e)
-                })
+                loaded = 0
+                logger.warning(f"Bulk insert failed: {e}")
+            
+            if loaded:
+                results['success'].extend(post['post_id'] for post in new_posts)
+                self.stats['loaded'] += loaded
+            else:
+                results['errors'].extend(
+                    {'post_id': post['post_id'], 'error': 'Bulk insert failed'}
+                    for post in new_posts
+                )
         
         return results
     
@@ -431,22 +732,21 @@ class ETLPipeline:
         Returns:
             Pipeline results with stats
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         logger.info(f"Starting ETL pipeline with {len(posts)} posts")
         
-        # Transform
-        transformed = self.transformer.transform(posts)
+        # Transform column-wise so the load can build Arrow arrays directly
+        transformed = self.transformer.transform_columns(posts, self.db.INSERT_COLUMNS)
         
         # Load
-        loaded_count = self.loader.load(transformed)
+        loaded_count = self.loader.load_columns(transformed)
         
-        end_time = datetime.now()
-        duration = (end_time - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
         
         results = {
             'input_count': len(posts),
-            'transformed_count': len(transformed),
+            'transformed_count': len(transformed['post_id']),
             'loaded_count': loaded_count,
             'duration_seconds': round(duration, 2),
             'records_per_second': round(len(posts) / max(duration, 0.001), 2),
@@ -461,34 +761,47 @@ class ETLPipeline:
         """
         Run pipeline in streaming mode for large datasets.
         
+        Batches are transformed on the calling thread while a loader thread
+        writes the previous batches, connected by a bounded queue so the
+        transformer can run at most `load_queue_size` batches ahead.
+        
         Args:
             posts_generator: Generator yielding post dicts
             
         Yields:
-            Transformed and loaded posts
+            Transformed posts. A batch is queued for loading before its posts
+            are yielded, but the loader thread may not have written it yet;
+            every batch is in the database only once the generator has been
+            exhausted or closed.
         """
-        batch = []
         batch_size = self.config.get('batch_size', 100)
+        load_queue = queue.Queue(maxsize=self.config.get('load_queue_size', 4))
         
-        for post in posts_generator:
-            batch.append(post)
-            
-            if len(batch) >= batch_size:
+        def load_worker():
+            while True:
+                transformed = load_queue.get()
+                if transformed is None:
+                    return
+                try:
+                    self.loader.load(transformed)
+                except Exception as e:
+                    logger.warning(f"Streaming load error: {e}")
+                    self.loader.stats['errors'] += 1
+        
+        worker = threading.Thread(target=load_worker, name="etl-loader", daemon=True)
+        worker.start()
+        
+        try:
+            posts_iter = iter(posts_generator)
+            while batch := list(islice(posts_iter, batch_size)):
                 transformed = self.transformer.transform(batch)
-                self.loader.load(transformed)
+                load_queue.put(transformed)
                 
-                for t in transformed:
-                    yield t
-                
-                batch = []
-        
-        # Process remaining
-        if batch:
-            transformed = self.transformer.transform(batch)
-            self.loader.load(transformed)
-            
-            for t in transformed:
-                yield t
+                yield from transformed
+        finally:
+            # Flush remaining batches before returning
+            load_queue.put(None)
+            worker.join()
 
 
 def create_pipeline(db_path: str = "social_media.duckdb") -> ETLPipeline:
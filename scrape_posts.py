@@ -11,109 +11,471 @@ Supports scraping from:
 
 import asyncio
 import argparse
+import csv
+import io
+import logging
 import os
-import pandas as pd
+import queue
+import sqlite3
+import sys
+import threading
 from datetime import datetime
-from scrapers import InstagramScraper, YouTubeScraper, RedditScraper, TwitterScraper
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+# Streamed tweets are handed to the writer in batches of this size while scrolling continues
+TWITTER_SAVE_BATCH = 25
+
+# Scrapers (Playwright, Google API client) and pyarrow are imported inside the
+# functions that use them so --help and argument errors return immediately
 
 
 async def run_instagram_scraper(target, limit):
     """Run Instagram hashtag scraper."""
-    print(f"Starting Instagram scraper for '{target}' with limit {limit}")
+    from scrapers import InstagramScraper
+    
+    logger.info(f"Starting Instagram scraper for '{target}' with limit {limit}")
     posts = await InstagramScraper.scrape(target, limit)
     
     if posts:
-        print(f"Successfully scraped {len(posts)} Instagram posts")
+        logger.info(f"Successfully scraped {len(posts)} Instagram posts")
     else:
-        print("No Instagram posts were scraped")
+        logger.info("No Instagram posts were scraped")
     
     return posts
 
 
 async def run_youtube_scraper(target, limit):
     """Run YouTube search scraper."""
-    print(f"Starting YouTube scraper for '{target}' with limit {limit}")
+    from scrapers import YouTubeScraper
+    
+    logger.info(f"Starting YouTube scraper for '{target}' with limit {limit}")
     posts = await YouTubeScraper.scrape(target, limit)
     
     if posts:
-        print(f"Successfully scraped {len(posts)} YouTube videos")
+        logger.info(f"Successfully scraped {len(posts)} YouTube videos")
     else:
-        print("No YouTube videos were scraped")
+        logger.info("No YouTube videos were scraped")
     
     return posts
 
 
-async def run_reddit_scraper(target, limit, subreddit=None, sort='hot'):
-    """Run Reddit scraper using free .json endpoints."""
+async def run_reddit_scraper(target, limit, subreddit=None, sort='hot', session=None):
+    """Run Reddit scraper using free .json endpoints, on `session` if given."""
+    from scrapers import RedditScraper
+    
     if subreddit:
-        print(f"Starting Reddit scraper for r/{subreddit} ({sort}) with limit {limit}")
+        logger.info(f"Starting Reddit scraper for r/{subreddit} ({sort}) with limit {limit}")
     else:
-        print(f"Starting Reddit scraper for '{target}' with limit {limit}")
+        logger.info(f"Starting Reddit scraper for '{target}' with limit {limit}")
     
-    # Reddit scraper is synchronous (uses requests, not Playwright)
+    # Async variants use aiohttp so other scrapers keep running while Reddit waits
     scraper = RedditScraper()
     
     if subreddit:
-        posts = scraper.search_subreddit(subreddit, sort=sort, limit=limit)
+        posts = await scraper.search_subreddit_async(subreddit, sort=sort, limit=limit, session=session)
     else:
-        posts = scraper.search_posts(target, sort='relevance', limit=limit)
+        posts = await scraper.search_posts_async(target, sort='relevance', limit=limit, session=session)
     
     if posts:
-        print(f"Successfully scraped {len(posts)} Reddit posts")
+        logger.info(f"Successfully scraped {len(posts)} Reddit posts")
     else:
-        print("No Reddit posts were scraped")
+        logger.info("No Reddit posts were scraped")
     
     return posts
 
 
-async def run_twitter_scraper(target, limit):
-    """Run Twitter/X scraper using Playwright."""
-    print(f"Starting Twitter scraper for '{target}' with limit {limit}")
-    posts = await TwitterScraper.scrape(target, limit)
+async def run_twitter_scraper(target, limit, save_batch=None):
+    """
+    Run Twitter/X scraper using Playwright.
     
-    if posts:
-        print(f"Successfully scraped {len(posts)} tweets")
+    With `save_batch`, tweets are streamed and passed to it every
+    TWITTER_SAVE_BATCH posts (and once more at the end, or on failure),
+    so they are written while scrolling continues; nothing is returned then.
+    """
+    from scrapers import TwitterScraper
+    
+    logger.info(f"Starting Twitter scraper for '{target}' with limit {limit}")
+    
+    if save_batch is None:
+        posts = await TwitterScraper.scrape(target, limit)
+        count = len(posts)
+    else:
+        posts, batch, count = [], [], 0
+        try:
+            async for post in TwitterScraper.stream(target, limit):
+                batch.append(post)
+                count += 1
+                if len(batch) >= TWITTER_SAVE_BATCH:
+                    save_batch(batch)
+                    batch = []
+        finally:
+            if batch:
+                save_batch(batch)
+    
+    if count:
+        logger.info(f"Successfully scraped {count} tweets")
     else:
-        print("No tweets were scraped")
+        logger.info("No tweets were scraped")
     
     return posts
 
 
+def _save_worker(save_queue, save_posts):
+    """Save batches of posts from the queue until a None sentinel arrives."""
+    while (posts := save_queue.get()) is not None:
+        try:
+            save_posts(posts)
+        except Exception as e:
+            logger.error(f"Error saving posts: {e}")
+
+
+def _open_http_session():
+    """Open the shared aiohttp session for async scrapers, or None without aiohttp."""
+    import scrapers
+    
+    if scrapers.aiohttp is None:
+        return None
+    return scrapers.create_http_session()
+
+
+async def _run_labelled(platform, scrape):
+    """Await a scraper coroutine, reporting failures under its platform name."""
+    try:
+        return platform, await scrape
+    except Exception as e:
+        logger.error(f"Error scraping {platform}: {e}")
+        return platform, []
+
+
+def _posts_to_table(posts, columns):
+    """Build an Arrow table from post dicts with the given column order."""
+    import pyarrow as pa
+    
+    arrays = []
+    for column in columns:
+        values = [post.get(column) for post in posts]
+        try:
+            array = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Mixed types across posts: fall back to text
+            array = None
+        if array is None or pa.types.is_nested(array.type):
+            array = pa.array([None if value is None else str(value) for value in values], pa.string())
+        arrays.append(array)
+    return pa.Table.from_arrays(arrays, names=columns)
+
+
+def _post_key(post):
+    """Identity of a post across runs, or None if it has no post_id."""
+    post_id = post.get('post_id')
+    if post_id in (None, ''):
+        return None
+    return f"{post.get('platform') or ''}:{post_id}"
+
+
+def _filter_new_posts(posts, ids_file, existing_posts):
+    """
+    Drop posts already saved, tracked in a sidecar file of post keys.
+    
+    The sidecar is loaded into a set, so saving never re-reads the data file;
+    it is rebuilt from `existing_posts()` only when missing.
+    
+    Args:
+        posts: Scraped post dictionaries
+        ids_file: Sidecar path, one post key per line
+        existing_posts: Callable yielding already-saved posts (empty if there is no data file)
+        
+    Returns:
+        (posts not seen before, record) - posts without a post_id are always
+        kept; call record() once they are written, to add their keys to the
+        sidecar (before that, a failed write must not mark them as saved)
+    """
+    if os.path.exists(ids_file):
+        with open(ids_file, 'r', encoding='utf-8') as f:
+            seen = set(f.read().splitlines())
+        append_keys = True
+    else:
+        seen = {key for key in map(_post_key, existing_posts()) if key}
+        append_keys = False
+    
+    new_posts = []
+    new_keys = []
+    for post in posts:
+        key = _post_key(post)
+        if key is not None:
+            if key in seen:
+                continue
+            seen.add(key)
+            new_keys.append(key)
+        new_posts.append(post)
+    
+    skipped = len(posts) - len(new_posts)
+    if skipped:
+        logger.info(f"Skipped {skipped} posts already saved")
+    
+    def record():
+        if append_keys:
+            if new_keys:
+                with open(ids_file, 'a', encoding='utf-8') as f:
+                    f.write('\n'.join(new_keys) + '\n')
+        else:
+            with open(ids_file, 'w', encoding='utf-8') as f:
+                f.writelines(f"{key}\n" for key in sorted(seen))
+    
+    return new_posts, record
+
+
+def _csv_codec(filename):
+    """Compression implied by a metadata CSV filename: zstd for .zst, else None."""
+    return 'zstd' if filename.endswith('.zst') else None
+
+
+def _open_csv_text(filename, codec):
+    """Open a (possibly compressed) CSV file for reading as text."""
+    import pyarrow as pa
+    
+    return io.TextIOWrapper(pa.input_stream(filename, compression=codec), encoding='utf-8', newline='')
+
+
 def save_to_metadata_csv(posts, filename='metadata.csv'):
-    """Save or append scraped posts to the metadata.csv file."""
+    """
+    Save or append scraped posts to the metadata.csv file.
+    
+    A filename ending in .zst is written zstd-compressed; each append adds a
+    new zstd frame, so earlier data is never recompressed.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    
+    codec = _csv_codec(filename)
+    
     if not posts:
-        print("No data to save")
+        logger.info("No data to save")
         return
     
-    # Convert posts to DataFrame
-    df_new = pd.DataFrame(posts)
+    # Skip posts already in the file (ids are kept in a sidecar next to it)
+    file_exists = os.path.exists(filename) and os.path.getsize(filename) > 0
+    
+    def existing_posts():
+        if not file_exists:
+            return []
+        # Multithreaded Arrow reader, parsing only the two key columns
+        table = pacsv.read_csv(filename, convert_options=pacsv.ConvertOptions(
+            include_columns=['post_id', 'platform'],
+            include_missing_columns=True,
+            column_types={'post_id': pa.string(), 'platform': pa.string()},
+        ))
+        return table.to_pylist()
+    
+    ids_file = f"{filename}.ids"
+    if not file_exists and os.path.exists(ids_file):
+        os.remove(ids_file)
+    posts, record_saved = _filter_new_posts(posts, ids_file, existing_posts)
+    if not posts:
+        record_saved()
+        return
+    
+    # Column order: first appearance across posts
+    columns = list(dict.fromkeys(key for post in posts for key in post))
     
     # Check if metadata.csv exists
-    if os.path.exists(filename):
+    if file_exists:
         try:
-            # Read existing data
-            df_existing = pd.read_csv(filename, encoding='utf-8')
-            print(f"Found existing metadata.csv with {len(df_existing)} records")
+            # Only the header is read; existing rows are never parsed
+            with _open_csv_text(filename, codec) as f:
+                header = next(csv.reader(f))
             
-            # Append new data
-            df_combined = pd.concat([df_existing, df_new], ignore_index=True)
+            if not set(columns) <= set(header):
+                # New columns: stream the existing rows into a file with a wider header
+                header += [column for column in columns if column not in header]
+                tmp_filename = f"{filename}.tmp"
+                with _open_csv_text(filename, codec) as src, \
+                        io.TextIOWrapper(pa.output_stream(tmp_filename, compression=codec), encoding='utf-8', newline='') as dst:
+                    writer = csv.DictWriter(dst, fieldnames=header)
+                    writer.writeheader()
+                    writer.writerows(csv.DictReader(src))
+                os.replace(tmp_filename, filename)
             
-            # Save combined data
-            df_combined.to_csv(filename, index=False, encoding='utf-8')
-            print(f"Added {len(df_new)} new posts to {filename}")
-            print(f"Total posts in {filename}: {len(df_combined)}")
+            # Append new rows in the existing column order
+            with open(filename, 'ab') as raw:
+                # Compressed files get one more zstd frame; readers decode concatenated frames
+                sink = pa.CompressedOutputStream(raw, codec) if codec else raw
+                pacsv.write_csv(
+                    _posts_to_table(posts, header), sink,
+                    write_options=pacsv.WriteOptions(include_header=False)
+                )
+                sink.close()
+            record_saved()
+            logger.info(f"Added {len(posts)} new posts to {filename}")
         except Exception as e:
-            print(f"Error reading existing file: {e}")
-            df_new.to_csv(filename, index=False, encoding='utf-8')
-            print(f"Saved {len(df_new)} posts to new {filename}")
+            logger.error(f"Error reading existing file: {e}")
+            table = _posts_to_table(posts, columns)  # built first, so a failure here leaves the file alone
+            with pa.output_stream(filename, compression=codec) as f:
+                pacsv.write_csv(table, f)
+            # The file now holds only this batch; drop the sidecar so the next
+            # save rebuilds it from the file
+            if os.path.exists(ids_file):
+                os.remove(ids_file)
+            logger.info(f"Saved {len(posts)} posts to new {filename}")
     else:
         # Create new file
-        df_new.to_csv(filename, index=False, encoding='utf-8')
-        print(f"Created new {filename} with {len(df_new)} posts")
+        with pa.output_stream(filename, compression=codec) as f:
+            pacsv.write_csv(_posts_to_table(posts, columns), f)
+        record_saved()
+        logger.info(f"Created new {filename} with {len(posts)} posts")
 
 
-async def main():
-    """Main entry point for the CLI."""
+def save_to_metadata_parquet(posts, dirname='metadata_parquet'):
+    """Save scraped posts as a new Parquet file in the metadata dataset directory."""
+    import pyarrow.parquet as pq
+    
+    if not posts:
+        logger.info("No data to save")
+        return
+    
+    os.makedirs(dirname, exist_ok=True)
+    
+    # Skip posts already in the dataset (ids are kept in a sidecar in the directory)
+    part_files = [os.path.join(dirname, name) for name in os.listdir(dirname) if name.endswith('.parquet')]
+    
+    def existing_posts():
+        for part_file in part_files:
+            table = pq.read_table(part_file)
+            platforms = table.column('platform').to_pylist() if 'platform' in table.column_names else []
+            for i, post_id in enumerate(table.column('post_id').to_pylist() if 'post_id' in table.column_names else []):
+                yield {'post_id': post_id, 'platform': platforms[i] if platforms else ''}
+    
+    ids_file = os.path.join(dirname, '_ids')
+    if not part_files and os.path.exists(ids_file):
+        os.remove(ids_file)
+    posts, record_saved = _filter_new_posts(posts, ids_file, existing_posts)
+    if not posts:
+        record_saved()
+        return
+    
+    columns = list(dict.fromkeys(key for post in posts for key in post))
+    
+    # One new file per run: nothing existing is read or rewritten
+    filename = os.path.join(dirname, f"part-{datetime.now():%Y%m%d_%H%M%S}-{uuid4().hex[:8]}.parquet")
+    pq.write_table(_posts_to_table(posts, columns), filename, compression='zstd')
+    record_saved()
+    logger.info(f"Saved {len(posts)} posts to {filename}")
+
+
+def _sqlite_ident(name):
+    """Quote a column name for SQLite."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _sqlite_value(value):
+    """Convert a post value into something sqlite3 can bind."""
+    if value is None or isinstance(value, (str, int, float, bytes)):
+        return value
+    return str(value)
+
+
+def save_to_metadata_sqlite(posts, filename='metadata.db'):
+    """Insert scraped posts into a SQLite metadata database, skipping known posts."""
+    if not posts:
+        logger.info("No data to save")
+        return
+    
+    columns = list(dict.fromkeys(key for post in posts for key in post))
+    for key in ('post_id', 'platform'):
+        if key not in columns:
+            columns.append(key)
+    
+    conn = sqlite3.connect(filename)
+    try:
+        # WAL keeps appends crash-safe without blocking readers
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS posts ('
+            'post_id TEXT NOT NULL, platform TEXT NOT NULL DEFAULT \'\', '
+            'PRIMARY KEY (platform, post_id))'
+        )
+        
+        # Add any columns this batch introduces
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(posts)")}
+        for column in columns:
+            if column not in existing:
+                conn.execute(f"ALTER TABLE posts ADD COLUMN {_sqlite_ident(column)}")
+        
+        # Posts without a post_id can't be deduplicated, so they're skipped
+        rows = [
+            tuple(
+                (post.get('platform') or '') if column == 'platform' else _sqlite_value(post.get(column))
+                for column in columns
+            )
+            for post in posts
+            if post.get('post_id') not in (None, '')
+        ]
+        
+        # The primary key does the dedup: existing (platform, post_id) pairs are ignored
+        column_list = ', '.join(_sqlite_ident(column) for column in columns)
+        placeholders = ', '.join('?' * len(columns))
+        with conn:
+            before = conn.total_changes
+            conn.executemany(
+                f"INSERT OR IGNORE INTO posts ({column_list}) VALUES ({placeholders})", rows
+            )
+            added = conn.total_changes - before
+    finally:
+        conn.close()
+    
+    logger.info(f"Added {added} new posts to {filename}")
+
+
+def export_metadata_sqlite(filename='metadata.db', csv_filename='metadata.csv'):
+    """Write the posts table of a SQLite metadata database out as CSV."""
+    conn = sqlite3.connect(filename)
+    try:
+        cursor = conn.execute("SELECT * FROM posts")
+        with open(csv_filename, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(column[0] for column in cursor.description)
+            writer.writerows(cursor)
+    finally:
+        conn.close()
+    logger.info(f"Exported {filename} to {csv_filename}")
+
+
+def load_metadata(dirname='metadata_parquet'):
+    """Load every Parquet file written by save_to_metadata_parquet into a DataFrame."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    filenames = sorted(
+        os.path.join(dirname, name) for name in os.listdir(dirname) if name.endswith('.parquet')
+    )
+    if not filenames:
+        return pa.table({}).to_pandas()
+    
+    tables = [pq.read_table(filename) for filename in filenames]
+    
+    # Runs may differ in columns/types: columns typed differently across files become text
+    field_types = {}
+    for table in tables:
+        for field in table.schema:
+            if not pa.types.is_null(field.type):
+                field_types.setdefault(field.name, set()).add(field.type)
+    mixed = {name for name, types in field_types.items() if len(types) > 1}
+    if mixed:
+        tables = [
+            table.cast(pa.schema([
+                (field.name, pa.string()) if field.name in mixed else field for field in table.schema
+            ]))
+            for table in tables
+        ]
+    
+    return pa.concat_tables(tables, promote_options='permissive').to_pandas()
+
+
+def _build_parser():
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         description='Social Media ETL Pipeline - Scrape content from multiple platforms',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -139,8 +501,9 @@ Examples:
     parser.add_argument(
         '--platform', 
         choices=['instagram', 'youtube', 'twitter', 'reddit'],
+        nargs='+',
         required=True,
-        help='Platform to scrape'
+        help='Platform(s) to scrape; several platforms run concurrently'
     )
     parser.add_argument(
         '--target', 
@@ -165,58 +528,121 @@ Examples:
     )
     parser.add_argument(
         '--output',
-        default='metadata.csv',
-        help='Output CSV file (default: metadata.csv)'
+        help='Output CSV file, Parquet directory, or SQLite database (default: metadata.csv / metadata_parquet / metadata.db)'
     )
-    
+    parser.add_argument(
+        '--format',
+        choices=['csv', 'parquet', 'sqlite'],
+        default='csv',
+        help='Output format; parquet writes one file per run into a directory, sqlite appends to a WAL database (default: csv)'
+    )
+    return parser
+
+
+async def main():
+    """Main entry point for the CLI."""
+    parser = _build_parser()
     args = parser.parse_args()
     
+    platforms = list(dict.fromkeys(args.platform))
+    
     # Validate arguments
-    if args.platform == 'reddit' and not args.target and not args.subreddit:
-        parser.error("Reddit requires either --target (search query) or --subreddit")
-    elif args.platform != 'reddit' and not args.target:
-        parser.error(f"{args.platform} requires --target argument")
-    
-    all_posts = []
-    
-    # Run the selected scraper
-    if args.platform == 'instagram':
-        posts = await run_instagram_scraper(args.target, args.limit)
-        if posts:
-            all_posts.extend(posts)
-    
-    elif args.platform == 'youtube':
-        posts = await run_youtube_scraper(args.target, args.limit)
-        if posts:
-            all_posts.extend(posts)
-    
-    elif args.platform == 'reddit':
-        posts = await run_reddit_scraper(
-            args.target, 
-            args.limit, 
-            subreddit=args.subreddit,
-            sort=args.sort
-        )
-        if posts:
-            all_posts.extend(posts)
+    for platform in platforms:
+        if platform == 'reddit' and not args.target and not args.subreddit:
+            parser.error("Reddit requires either --target (search query) or --subreddit")
+        elif platform != 'reddit' and not args.target:
+            parser.error(f"{platform} requires --target argument")
+    
+    # Same handlers the scrapers module installs (console + scraper.log), set up
+    # here so this script's messages go through them too; logging is thread-safe
+    # and per-post detail is logged at DEBUG, so it's dropped before formatting
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('scraper.log', encoding='utf-8'),
+            logging.StreamHandler()
+        ]
+    )
+    
+    if args.format == 'parquet':
+        output = args.output or 'metadata_parquet'
+        save_posts = lambda posts: save_to_metadata_parquet(posts, dirname=output)
+    elif args.format == 'sqlite':
+        output = args.output or 'metadata.db'
+        save_posts = lambda posts: save_to_metadata_sqlite(posts, filename=output)
+    else:
+        output = args.output or 'metadata.csv'
+        save_posts = lambda posts: save_to_metadata_csv(posts, filename=output)
+    
+    # One pooled HTTP session for the whole run so repeated requests to the same
+    # host reuse keep-alive connections instead of a handshake per request
+    http_session = _open_http_session() if 'reddit' in platforms else None
+    
+    # Save each platform's posts as soon as its scraper finishes, so a slow or
+    # crashing scraper doesn't hold back (or lose) the others' data. Writes run
+    # on a dedicated thread so they overlap with the scrapers still running.
+    save_queue = queue.Queue()
+    total_posts = 0
     
-    elif args.platform == 'twitter':
-        posts = await run_twitter_scraper(args.target, args.limit)
-        if posts:
-            all_posts.extend(posts)
+    def queue_posts(posts):
+        nonlocal total_posts
+        save_queue.put(posts)
+        total_posts += len(posts)
     
-    # Save all collected data
-    if all_posts:
-        save_to_metadata_csv(all_posts, filename=args.output)
+    # Run the selected scrapers concurrently so their network waits overlap
+    tasks = []
+    for platform in platforms:
+        if platform == 'instagram':
+            scrape = run_instagram_scraper(args.target, args.limit)
+        elif platform == 'youtube':
+            scrape = run_youtube_scraper(args.target, args.limit)
+        elif platform == 'reddit':
+            scrape = run_reddit_scraper(
+                args.target, 
+                args.limit, 
+                subreddit=args.subreddit,
+                sort=args.sort,
+                session=http_session
+            )
+        elif platform == 'twitter':
+            # Tweets are streamed to the writer in batches while the scroll continues
+            scrape = run_twitter_scraper(args.target, args.limit, save_batch=queue_posts)
+        tasks.append(_run_labelled(platform, scrape))
+    
+    writer = threading.Thread(target=_save_worker, args=(save_queue, save_posts), daemon=True)
+    writer.start()
+    
+    try:
+        for task in asyncio.as_completed(tasks):
+            _, posts = await task
+            if posts:
+                queue_posts(posts)
+    finally:
+        save_queue.put(None)
+        await asyncio.to_thread(writer.join)
+        if http_session is not None:
+            await http_session.close()
+        # Instagram/Twitter scrapes share pooled browsers; close them with the run
+        scrapers = sys.modules.get('scrapers')
+        if scrapers is not None:
+            await scrapers.BROWSER_POOL.close()
     
     # Print summary
     print("\n" + "="*50)
     print("Scraping Summary:")
-    print(f"  Platform: {args.platform}")
+    print(f"  Platform: {', '.join(platforms)}")
     print(f"  Target: {args.target or args.subreddit}")
-    print(f"  Total posts scraped: {len(all_posts)}")
+    print(f"  Total posts scraped: {total_posts}")
     print("="*50)
 
 
 if __name__ == "__main__":
+    # uvloop is an optional, faster drop-in event loop (not available on Windows)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     asyncio.run(main())
\ No newline at end of file
@@ -1,12 +1,39 @@
 import asyncio
+import contextlib
+import inspect
 import os
+import random
 import re
-from datetime import datetime
+from datetime import datetime, timezone
 import json
+import math
 import time
-from tqdm import tqdm
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from hashlib import blake2b, sha1
+from tqdm.asyncio import tqdm
 import requests
 
+# Optional: non-blocking HTTP for the async Reddit scraper
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Optional: faster JSON parsing (config, Reddit listings, Instagram API responses)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Optional: on-disk cache of API responses between runs
+try:
+    from diskcache import Cache
+except ImportError:
+    Cache = None
+
 # For Instagram
 from playwright.async_api import async_playwright, TimeoutError
 
@@ -30,56 +57,186 @@ if not logger.handlers:
     )
     logger = logging.getLogger(__name__)
 
+# Directories already checked by ensure_dir_exists in this process
+_existing_dirs = set()
+
 def ensure_dir_exists(directory):
-    #Ensure directory exists
+    #Ensure directory exists; each directory is only checked on disk once per process
+    if directory in _existing_dirs:
+        return
     if not os.path.exists(directory):
-        os.makedirs(directory)
+        os.makedirs(directory, exist_ok=True)
         logger.info(f"Created directory: {directory}")
+    _existing_dirs.add(directory)
+
+# Patterns shared by the scrapers, compiled once at import
+HASHTAG_RE = re.compile(r'#(\w+)\s*')
+LIKES_RE = re.compile(r'(\d+(?:,\d+)*)\s*(?:like|likes)')
+COMMENTS_RES = [
+    re.compile(r'(\d+(?:,\d+)*)\s*comments'),
+    re.compile(r'(\d+(?:,\d+)*)\s*comment'),
+    re.compile(r'view all\s*(\d+(?:,\d+)*)\s*comments')
+]
+# Suffixes Twitter uses on abbreviated counts ('1.2K', '3M', '1B')
+METRIC_MULTIPLIERS = {'K': 1_000, 'M': 1_000_000, 'B': 1_000_000_000}
+# HTML entities Reddit leaves in text, with their replacements
+HTML_ENTITIES = {'&amp;': '&', '&lt;': '<', '&gt;': '>', '&#x200B;': ''}
+HTML_ENTITY_RE = re.compile('|'.join(map(re.escape, HTML_ENTITIES)))
+
+# Curly quotes and dashes to ASCII, zero-width characters removed, applied by
+# the scrapers' _clean_text methods
+CLEAN_TEXT_REPLACEMENTS = {
+    '\u2018': "'",
+    '\u2019': "'",
+    '\u201c': '"',
+    '\u201d': '"',
+    '\u2013': '-',
+    '\u2014': '--',
+    '\u200b': '',
+    '\ufeff': '',
+}
+
+def replace_special_chars(text):
+    #Apply CLEAN_TEXT_REPLACEMENTS. Chained str.replace stays a C-level search per
+    #character, while str.translate with a dict table does a per-character dict
+    #lookup on non-ASCII text (emoji, curly quotes) and is many times slower there
+    for old, new in CLEAN_TEXT_REPLACEMENTS.items():
+        text = text.replace(old, new)
+    return text
+
+def split_hashtags(text):
+    #Return (text without hashtags, hashtags) using a single regex pass
+    hashtags = []
+    def take(match):
+        hashtags.append(match.group(1))
+        return ''
+    text = HASHTAG_RE.sub(take, text)
+    return ' '.join(text.split()), hashtags
+
+# Browser-like User-Agent for image CDNs
+THUMBNAIL_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+def _thumbnail_path(image_url, file_id, thumbnail_dir):
+    #File path for a post's thumbnail, keeping the URL's image extension (jpg by default)
+    file_extension = 'jpg'
+    if '.' in image_url.split('?')[0].split('/')[-1]:
+        url_extension = image_url.split('?')[0].split('/')[-1].split('.')[-1].lower()
+        # Only use valid image extensions
+        if url_extension in ['jpg', 'jpeg', 'png', 'webp', 'gif', 'heic']:
+            file_extension = url_extension
+    
+    # Clean the file_id to avoid issues with special characters
+    safe_file_id = "".join([c for c in file_id if c.isalnum() or c in '_-'])
+    
+    return os.path.join(thumbnail_dir, f"{safe_file_id}.{file_extension}")
+
+# Thumbnail filenames per directory, listed once with os.scandir instead of a
+# stat call per post; _finish_thumbnail adds each new file
+_thumbnail_index = {}
+
+def _thumbnail_exists(file_path):
+    #True if the thumbnail is already on disk (or was saved earlier in this run)
+    directory, name = os.path.split(file_path)
+    names = _thumbnail_index.get(directory)
+    if names is None:
+        try:
+            names = {entry.name for entry in os.scandir(directory)}
+        except FileNotFoundError:
+            names = set()
+        _thumbnail_index[directory] = names
+    return name in names
 
 def download_thumbnail(image_url, file_id, thumbnail_dir=None):
     '''Download and save thumbnail image
     Use thumbnail directory from config if not specified'''
 
     if thumbnail_dir is None:
-        config = load_config()
+        config = get_config()
         thumbnail_dir = config.get('thumbnail_directory', 'thumbnails')
         
     ensure_dir_exists(thumbnail_dir)
     
     try:
-        # Extract proper file extension from URL or use jpg as default
-        file_extension = 'jpg'
-        if '.' in image_url.split('?')[0].split('/')[-1]:
-            url_extension = image_url.split('?')[0].split('/')[-1].split('.')[-1].lower()
-            # Only use valid image extensions
-            if url_extension in ['jpg', 'jpeg', 'png', 'webp', 'gif', 'heic']:
-                file_extension = url_extension
-        
-        # Clean the file_id to avoid issues with special characters
-        safe_file_id = "".join([c for c in file_id if c.isalnum() or c in '_-'])
-        
-        # Create the file path with proper extension
-        file_path = os.path.join(thumbnail_dir, f"{safe_file_id}.{file_extension}")
+        file_path = _thumbnail_path(image_url, file_id, thumbnail_dir)
         
         # Check if file already exists to avoid re-downloading
-        if os.path.exists(file_path):
-            logger.info(f"Thumbnail already exists: {file_path}")
+        if _thumbnail_exists(file_path):
+            logger.debug("Thumbnail already exists: %s", file_path)
             return True
             
-        # Download the image with timeout and proper headers
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(image_url, timeout=15, headers=headers)
+        # Download the image with timeout and proper headers, streaming it to disk
+        with requests.get(image_url, timeout=15, headers=THUMBNAIL_HEADERS, stream=True) as response:
+            if response.status_code != 200:
+                logger.warning(f"Failed to download thumbnail, status code: {response.status_code}")
+                return False
+            
+            try:
+                with open(f"{file_path}.part", 'wb') as f:
+                    for chunk in response.iter_content(THUMBNAIL_CHUNK_SIZE):
+                        f.write(chunk)
+            except BaseException:
+                _discard_part(file_path)
+                raise
+        
+        _finish_thumbnail(file_path)
+        logger.debug("Thumbnail saved to %s", file_path)
+        return True
+    except Exception as e:
+        logger.error(f"Error downloading thumbnail: {str(e)}")
+        return False
+
+# Thumbnails are streamed to disk in chunks of this size, so memory use doesn't
+# grow with image size x concurrent downloads
+THUMBNAIL_CHUNK_SIZE = 64 * 1024
+
+def _finish_thumbnail(file_path):
+    #Move a completed download into place; images are written to a .part file first
+    #so an interrupted download never looks like a saved thumbnail
+    os.replace(f"{file_path}.part", file_path)
+    _thumbnail_index.setdefault(os.path.dirname(file_path), set()).add(os.path.basename(file_path))
+
+def _discard_part(file_path):
+    #Remove the .part file of a failed download
+    try:
+        os.remove(f"{file_path}.part")
+    except OSError:
+        pass
+
+async def download_thumbnail_async(session, image_url, file_id, thumbnail_dir, semaphore=None):
+    '''Async download_thumbnail on a shared aiohttp session
+    semaphore (optional) bounds how many downloads are in flight at once'''
+
+    try:
+        file_path = _thumbnail_path(image_url, file_id, thumbnail_dir)
         
-        if response.status_code == 200:
-            with open(file_path, 'wb') as f:
-                f.write(response.content)
-            logger.info(f"Thumbnail saved to {file_path}")
+        # Check if file already exists to avoid re-downloading
+        if _thumbnail_exists(file_path):
+            logger.debug("Thumbnail already exists: %s", file_path)
             return True
-        else:
-            logger.warning(f"Failed to download thumbnail, status code: {response.status_code}")
-            return False
+        
+        async with semaphore or contextlib.nullcontext():
+            async with session.get(image_url, headers=THUMBNAIL_HEADERS, timeout=aiohttp.ClientTimeout(total=15)) as response:
+                if response.status != 200:
+                    logger.warning(f"Failed to download thumbnail, status code: {response.status}")
+                    return False
+                
+                # Chunks are written as they arrive; disk writes run in a worker
+                # thread so they never stall the event loop
+                f = await asyncio.to_thread(open, f"{file_path}.part", 'wb')
+                try:
+                    async for chunk in response.content.iter_chunked(THUMBNAIL_CHUNK_SIZE):
+                        await asyncio.to_thread(f.write, chunk)
+                except BaseException:
+                    f.close()
+                    _discard_part(file_path)
+                    raise
+                await asyncio.to_thread(f.close)
+        
+        await asyncio.to_thread(_finish_thumbnail, file_path)
+        logger.debug("Thumbnail saved to %s", file_path)
+        return True
     except Exception as e:
         logger.error(f"Error downloading thumbnail: {str(e)}")
         return False
@@ -88,8 +245,8 @@ def load_config(config_file='config.json'):
     #Load configuration from JSON file
     try:
         if os.path.exists(config_file):
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            with open(config_file, 'rb') as f:
+                config = json_loads(f.read())
             logger.info(f"Loaded configuration from {config_file}")
             return config
         else:
@@ -99,6 +256,167 @@ def load_config(config_file='config.json'):
         logger.error(f"Error loading configuration: {str(e)}")
         return {}
 
+@lru_cache(maxsize=1)
+def _load_config_cached(config_file, mtime):
+    #mtime is only part of the cache key so that edits to the file invalidate the entry
+    return load_config(config_file)
+
+def get_config(config_file='config.json'):
+    #Return the parsed config, re-reading the file only when its mtime changes
+    try:
+        mtime = os.stat(config_file).st_mtime
+    except OSError:
+        mtime = None
+    return _load_config_cached(config_file, mtime)
+
+# How long cached API responses stay valid, in seconds
+CACHE_TTL_SEARCH = 3600  # search pages and Reddit listings
+CACHE_TTL_VIDEO = 86400  # YouTube video details
+
+_response_cache = None
+
+def get_cache():
+    #Shared diskcache.Cache for API responses (cache_directory in config), None without diskcache
+    global _response_cache
+    if Cache is None:
+        return None
+    if _response_cache is None:
+        _response_cache = Cache(get_config().get('cache_directory', os.path.join('.cache', 'scraper')))
+    return _response_cache
+
+def cache_key(url, params=None):
+    #Stable key for a request: its URL plus the parameters in sorted order
+    return sha1((url + json.dumps(params or {}, sort_keys=True)).encode()).hexdigest()
+
+def cache_get(key):
+    #Cached value for key, or None on a miss (or without diskcache)
+    cache = get_cache()
+    return cache.get(key) if cache is not None else None
+
+def cache_set(key, value, expire):
+    #Store value for expire seconds; a no-op without diskcache
+    cache = get_cache()
+    if cache is not None:
+        cache.set(key, value, expire=expire)
+
+# Browser requests the scrapers never need: fonts, CSS and audio/video. Images
+# stay allowed, since thumbnails and the img-based selectors rely on them
+BLOCKED_RESOURCE_TYPES = frozenset({'font', 'stylesheet', 'media'})
+
+# The Twitter scraper only reads img src attributes, so it can skip images too
+BLOCKED_RESOURCE_TYPES_NO_IMAGES = BLOCKED_RESOURCE_TYPES | {'image'}
+
+# Extra Chromium flags for headless runs (launch(headless=True) picks the mode
+# itself; passing --headless here as well conflicts with it): no GPU compositing
+HEADLESS_ARGS = ['--disable-gpu']
+
+async def block_unneeded_resources(route):
+    #Playwright route handler that aborts BLOCKED_RESOURCE_TYPES and passes everything else
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def block_unneeded_resources_and_images(route):
+    #Like block_unneeded_resources, but also aborts images
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES_NO_IMAGES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+# Scrolls (to the bottom, or to y), then polls in the page until it grows past the
+# given height or the timeout passes, and returns the new height
+SCROLL_AND_WAIT_JS = """
+    async ([y, height, timeout]) => {
+        window.scrollTo(0, y === null ? document.body.scrollHeight : y);
+        const deadline = Date.now() + timeout;
+        while (document.body.scrollHeight <= height && Date.now() < deadline) {
+            await new Promise(resolve => setTimeout(resolve, 100));
+        }
+        return document.body.scrollHeight;
+    }
+"""
+
+async def scroll_and_wait(page, last_height, y=None, timeout=4000):
+    #Scroll and wait for more content in a single page.evaluate round-trip
+    return await page.evaluate(SCROLL_AND_WAIT_JS, [y, last_height, timeout])
+
+def create_http_session(limit=50, limit_per_host=0):
+    #Shared aiohttp session: pooled keep-alive connections and cached DNS, so
+    #repeated requests to the same host skip the TCP/TLS handshake
+    connector = aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=30)
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+class BrowserPool:
+    """
+    Chromium browsers shared across scrape() calls.
+    
+    Each scraper opens its own context (isolated cookies and pages) on a pooled
+    browser instead of launching and closing Chromium per query. Browsers are
+    keyed by their launch options and retired after max_uses contexts.
+    """
+    
+    def __init__(self, max_uses=100):
+        self.max_uses = max_uses
+        self._playwright = None
+        self._current = {}  # launch options -> browser handed to new scrapers
+        self._stats = {}    # browser -> {'uses': contexts opened, 'active': contexts open}
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self, headless, args):
+        """Return a running browser for these launch options, launching one if needed."""
+        key = (headless, tuple(args))
+        async with self._lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            browser = self._current.get(key)
+            if browser is None or not browser.is_connected() or self._stats[browser]['uses'] >= self.max_uses:
+                if browser is not None:
+                    await self._retire(key, browser)
+                browser = await self._playwright.chromium.launch(headless=headless, args=list(args))
+                self._current[key] = browser
+                self._stats[browser] = {'uses': 0, 'active': 0}
+                logger.info("Launched pooled browser")
+            self._stats[browser]['uses'] += 1
+            self._stats[browser]['active'] += 1
+            return browser
+    
+    async def release(self, browser):
+        """Hand a browser back; retired browsers close once their last context is done."""
+        async with self._lock:
+            stats = self._stats.get(browser)
+            if stats is None:
+                return
+            stats['active'] -= 1
+            if stats['active'] <= 0 and browser not in self._current.values():
+                del self._stats[browser]
+                await browser.close()
+    
+    async def _retire(self, key, browser):
+        #Stop handing out a browser, closing it now if no scraper is still using it
+        del self._current[key]
+        if self._stats[browser]['active'] <= 0:
+            del self._stats[browser]
+            await browser.close()
+    
+    async def close(self):
+        """Close every pooled browser and stop Playwright."""
+        async with self._lock:
+            for browser in list(self._stats):
+                try:
+                    await browser.close()
+                except Exception as e:
+                    logger.debug(f"Error closing pooled browser: {e}")
+            self._current.clear()
+            self._stats.clear()
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+# Shared by the Instagram and Twitter scrapers; entry points close it on exit
+BROWSER_POOL = BrowserPool()
+
 # A parent Scraper class for both InstagramScraper and YouTubeScraper classes, providing common interface and functionality.
 class BaseScraper:
     """
@@ -106,11 +424,17 @@ class BaseScraper:
     Provides common functionality and a unified interface.
     """
     
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Decided once per scraper class: how scrape() has to call _execute_scrape
+        cls._execute_is_async = inspect.iscoroutinefunction(cls._execute_scrape)
+    
     @classmethod
     async def scrape(cls, query, limit=50):
         """
         Unified interface for scraping from any platform.
-        Handles both synchronous and asynchronous implementations.
+        Handles both synchronous and asynchronous implementations; synchronous
+        ones run in a worker thread so they don't block the event loop.
         
         Args:
             query: Search term or hashtag
@@ -122,27 +446,82 @@ class BaseScraper:
         logger.info(f"Starting {cls.__name__} for '{query}' with limit {limit}")
         
         try:
-            # Check if the _execute_scrape method is a coroutine (async)
-            import inspect
-            if inspect.iscoroutinefunction(cls._execute_scrape):
+            if cls._execute_is_async:
                 # Call async implementation
                 return await cls._execute_scrape(query, limit) #this call will implement the instagram scraper
             else:
-                # Call synchronous implementation
-                return cls._execute_scrape(query, limit) #this call will implement the youtube scraper
+                # Call synchronous implementation off the event loop
+                return await asyncio.to_thread(cls._execute_scrape, query, limit) #this call will implement the youtube scraper
         except ValueError as e:
             logger.error(str(e))
             return []
         except Exception as e:
             logger.error(f"{cls.__name__} scraping failed: {str(e)}")
             return []
+    
+    @classmethod
+    def clear_cache(cls):
+        """Drop all cached API responses so the next scrape hits the network."""
+        cache = get_cache()
+        if cache is not None:
+            cache.clear()
+            logger.info("Cleared API response cache")
+    
+    async def _download_thumbnail(self, post_data):
+        """
+        Download a post's thumbnail without blocking the event loop.
+        
+        Uses the scraper's aiohttp session (self.http) when one is open, else
+        runs the blocking download_thumbnail in a worker thread.
+        """
+        if getattr(self, 'http', None) is None:
+            return await asyncio.to_thread(
+                download_thumbnail, post_data['image_url'], post_data['post_id'], self.thumbnail_dir
+            )
+        return await download_thumbnail_async(
+            self.http, post_data['image_url'], post_data['post_id'], self.thumbnail_dir,
+            getattr(self, 'download_semaphore', None)
+        )
 
 #------------ INSTAGRAM SCRAPER USING PLAYWRIGHT ------------#
 
 class InstagramScraper(BaseScraper):
+    # Collects every field _extract_post_data needs from an opened post in one
+    # evaluate call; candidate lists keep the order the selectors are tried in
+    POST_DATA_JS = """
+    (root) => {
+        const post = document.querySelector(root);
+        if (!post) return null;
+        const text = (sel) => {
+            const el = post.querySelector(sel);
+            return el ? el.innerText : null;
+        };
+        const withText = (sel, needle) => {
+            for (const el of post.querySelectorAll(sel)) {
+                if (el.textContent.toLowerCase().includes(needle)) return el.innerText;
+            }
+            return null;
+        };
+        const img = post.querySelector('article img');
+        const time = post.querySelector('time');
+        return {
+            image_url: img ? img.getAttribute('src') : null,
+            url: window.location.href,
+            author: text('header a'),
+            captions: ["ul div > span", "h1", "div[role='button'] > span", "span[dir='auto']"].map(text),
+            timestamp: time ? (time.getAttribute('datetime') || time.innerText) : null,
+            likes: [
+                text('section span span'), text('section span a span'), text('a span span'),
+                withText('div', 'likes'), withText('div', 'like')
+            ],
+            comments: [withText('span', 'comment'), withText('a', 'comment'), withText('div', 'comment')]
+        };
+    }
+    """
+
     def __init__(self, credentials=None):
         #Initialize Instagram scraper with credentials from config file
-        config = load_config()
+        config = get_config()
         instagram_config = config.get('instagram', {})
         
         # Use credentials strictly from config file without fallbacks
@@ -152,6 +531,15 @@ class InstagramScraper(BaseScraper):
         self.username = instagram_config.get('username')
         self.password = instagram_config.get('password')
         
+        # Cookies from the last successful login, reused so later runs can skip login()
+        self.session_file = instagram_config.get('session_file', 'ig_state.json')
+        
+        # Number of tabs used to open posts concurrently when falling back to the DOM
+        self.page_pool_size = instagram_config.get('page_pool_size', 4)
+        
+        # Run Chromium without a window unless config sets "headless": false (e.g. to watch a run)
+        self.headless = config.get('headless', True)
+        
         # Use thumbnail directory from config if available
         self.thumbnail_dir = config.get('thumbnail_directory', 'thumbnails')
         logger.info(f"Using Instagram username: {self.username}")
@@ -160,22 +548,30 @@ class InstagramScraper(BaseScraper):
         self.browser = None
         self.context = None
         self.page = None
+        self.http = None  # aiohttp session for thumbnails, opened in setup_browser
+        self.download_semaphore = None
         self.posts_data = []
         
+        # Posts parsed from intercepted API responses, waiting for scroll_and_scrape
+        self._pending_posts = deque()
+        self._intercepted = False
+        
+        # Idle tabs for opening post permalinks (created lazily, reused across posts)
+        self._page_pool = asyncio.Queue()
+        self._pool_pages = 0
+        
         # Create thumbnail directory if it doesn't exist
         ensure_dir_exists(self.thumbnail_dir)
 
     async def setup_browser(self):
-        #Initialize Playwright browser
-        playwright = await async_playwright().start()
-        
+        #Take a browser from the shared pool and open this scraper's context on it
         # Using fixed screen dimensions
         logger.info("Using fixed screen dimensions: 1920x1080")
         
-        # Launch browser
-        self.browser = await playwright.chromium.launch(
-            headless=False, 
-            args=[
+        # Launch browser (or reuse a pooled one)
+        self.browser = await BROWSER_POOL.acquire(
+            self.headless, 
+            [
                 '--disable-blink-features=AutomationControlled',
                 '--disable-notifications',
                 '--start-maximized',
@@ -184,7 +580,7 @@ class InstagramScraper(BaseScraper):
                 '--no-sandbox',
                 f'--window-size={1920},{1080}',# can have a default value set to 1920 x 1080 or we can dynamicaly get the user system dimentions to open the browser
                 '--enable-unsafe-swiftshader'
-            ]
+            ] + (HEADLESS_ARGS if self.headless else [])
         )
         # Configure context to bypass automation detection
         self.context = await self.browser.new_context(
@@ -194,8 +590,10 @@ class InstagramScraper(BaseScraper):
             locale='en-US',
             timezone_id='Asia/Kolkata',
             screen={'width': 1920, 'height': 1080},
-            ignore_https_errors=True
+            ignore_https_errors=True,
+            storage_state=self.session_file if os.path.exists(self.session_file) else None
         )
+        await self.context.route("**/*", block_unneeded_resources)
         await self.context.add_init_script("""
             Object.defineProperty(navigator, 'webdriver', {
                 get: () => undefined
@@ -208,85 +606,169 @@ class InstagramScraper(BaseScraper):
         # Set default timeout
         self.page.set_default_timeout(30000)
         
+        # The hashtag grid fetches post metadata as JSON; read it from there
+        # instead of opening each post's modal
+        self.page.on("response", self._on_response)
+        
+        # Thumbnails download concurrently on one pooled session (at most 10 in flight)
+        if aiohttp is not None:
+            self.http = create_http_session(limit=100, limit_per_host=10)
+        self.download_semaphore = asyncio.Semaphore(10)
+        
         logger.info("Browser setup complete")
 
+    async def _on_response(self, response):
+        #Queue posts found in Instagram's GraphQL / v1 API responses
+        url = response.url
+        if "graphql/query" not in url and "/api/v1/tags/" not in url:
+            return
+        if "json" not in response.headers.get("content-type", ""):
+            return
+        
+        try:
+            data = json_loads(await response.body())
+        except Exception as e:
+            logger.debug(f"Could not parse response from {url}: {str(e)}")
+            return
+        
+        for media in self._iter_media(data):
+            post_data = self._post_from_media(media)
+            if post_data:
+                self._pending_posts.append(post_data)
+                self._intercepted = True
+
+    @classmethod
+    def _iter_media(cls, data):
+        #Yield every media object in a response; GraphQL nodes carry a shortcode, v1 items a code
+        if isinstance(data, dict):
+            if ('shortcode' in data or 'code' in data) and ('owner' in data or 'user' in data):
+                yield data
+                return
+            for value in data.values():
+                yield from cls._iter_media(value)
+        elif isinstance(data, list):
+            for value in data:
+                yield from cls._iter_media(value)
+
+    def _post_from_media(self, media):
+        #Build a post dict (same fields as _extract_post_data) from an API media object
+        post_id = media.get('shortcode') or media.get('code')
+        if not post_id:
+            return None
+        
+        # Caption: GraphQL edge list or v1 caption object
+        caption_edges = (media.get('edge_media_to_caption') or {}).get('edges') or []
+        if caption_edges:
+            caption = caption_edges[0].get('node', {}).get('text') or ''
+        else:
+            caption = (media.get('caption') or {}).get('text') or ''
+        post_text = self._clean_text(caption)
+        
+        # Hashtags are kept separately, as in the modal scraper
+        post_text, hashtags = split_hashtags(post_text)
+        
+        owner = media.get('owner') or media.get('user') or {}
+        
+        taken_at = media.get('taken_at_timestamp') or media.get('taken_at')
+        timestamp = datetime.fromtimestamp(taken_at).isoformat() if taken_at else datetime.now().isoformat()
+        
+        image_url = media.get('display_url') or media.get('thumbnail_src') or ''
+        if not image_url:
+            candidates = (media.get('image_versions2') or {}).get('candidates') or []
+            if candidates:
+                image_url = candidates[0].get('url', '')
+        
+        like_edge = media.get('edge_liked_by') or media.get('edge_media_preview_like') or {}
+        likes = like_edge.get('count', media.get('like_count'))
+        comments = (media.get('edge_media_to_comment') or {}).get('count', media.get('comment_count'))
+        
+        return {
+            'post_id': post_id,
+            'platform': 'instagram',
+            'post_text': post_text,
+            'hashtags': ','.join(hashtags),
+            'timestamp': timestamp,
+            'image_url': image_url,
+            'likes': '' if likes is None else str(likes),
+            'comments': '' if comments is None else str(comments),
+            'author': self._clean_text(owner.get('username', '')),
+            'scraped_at': datetime.now().isoformat()
+        }
+
     async def login(self):
         #Login to Instagram
         try:
             logger.info("Attempting to login to Instagram")
             await self.page.goto("https://www.instagram.com/", wait_until="networkidle")
-            await asyncio.sleep(2)
+            await self.page.wait_for_selector("input[name='username']", state="visible")
 
             # Enter username
             await self.page.fill("input[name='username']", self.username)
-            await asyncio.sleep(1)
             
             # Enter password
             await self.page.fill("input[name='password']", self.password)
-            await asyncio.sleep(1)
             
             # Click login button
             await self.page.click("button[type='submit']")
             logger.info("Login credentials submitted")
             
-            # Wait for login to complete
-            await asyncio.sleep(5)
-            
-            # Verify login success by checking for Home icon
+            # Verify login success by waiting for the Home icon
             try:
-                await self.page.wait_for_selector("svg[aria-label='Home']", timeout=10000)
+                await self.page.wait_for_selector("svg[aria-label='Home']", timeout=15000)
                 logger.info("Successfully logged in")
-                return True
             except TimeoutError:
                 logger.error("Login verification failed - Home icon not found")
                 return False
             
+            # Save the session so the next run can skip logging in
+            try:
+                await self.context.storage_state(path=self.session_file)
+            except Exception as e:
+                logger.warning(f"Could not save Instagram session: {str(e)}")
+            return True
+            
         except Exception as e:
             logger.error(f"Login failed: {str(e)}")
             return False
 
+    async def restore_session(self):
+        #True if cookies saved by an earlier login() are still logged in
+        if not os.path.exists(self.session_file):
+            return False
+        
+        try:
+            await self.page.goto("https://www.instagram.com/", wait_until="domcontentloaded")
+            # An expired session shows the login form instead of the Home icon
+            await self.page.wait_for_selector("svg[aria-label='Home'], input[name='username']", timeout=15000)
+            if await self.page.locator("svg[aria-label='Home']").count() > 0:
+                logger.info("Reusing saved Instagram session")
+                return True
+        except Exception as e:
+            logger.warning(f"Could not restore Instagram session: {str(e)}")
+        
+        logger.info("Saved Instagram session has expired, logging in again")
+        return False
+
     async def search_hashtag(self, hashtag):
         #Search Instagram for hashtag
         logger.info(f"Searching for hashtag: {hashtag}")
         
+        # Drop anything intercepted before the hashtag page (e.g. the home feed)
+        self._pending_posts.clear()
+        self._intercepted = False
+        
         try:
-            # Click on search icon
-            await self.page.click("svg[aria-label='Search']")
-            logger.info("Clicked on search icon")
-            await asyncio.sleep(2)
-            
-            # Find search input and type hashtag
-            search_input = await self.page.wait_for_selector("input[placeholder='Search']", timeout=5000)
-            await search_input.fill(f"#{hashtag}")
-            logger.info(f"Entered search text: #{hashtag}")
-            await asyncio.sleep(3)
-            
-            # Look for search results and try to click on the hashtag
-            hashtag_result = self.page.locator(f"span:has-text('#{hashtag}')")
-            if await hashtag_result.count() > 0:
-                await hashtag_result.first.click()
-                logger.info(f"Clicked on #{hashtag} in search results")
-                await asyncio.sleep(5)  # Wait for page to load
-            else:
-                # If no results found, try pressing Enter
-                await search_input.press("Enter")
-                logger.info("No results found, pressed Enter")
-                await asyncio.sleep(2)
-                
-                # Press Enter again to navigate to hashtag page
-                await search_input.press("Enter")
-                logger.info("Pressed Enter again")
-                await asyncio.sleep(5)  # Wait for page to load
+            # Go straight to the hashtag page; the posts grid check below waits for it to load
+            await self.page.goto(f"https://www.instagram.com/explore/tags/{hashtag}/", wait_until="domcontentloaded")
+            logger.info(f"Navigated to hashtag page for #{hashtag}")
         except Exception as e:
-            logger.warning(f"Search using UI failed: {str(e)}")
+            logger.warning(f"Direct URL navigation failed: {str(e)}")
             
-            # Direct URL navigation as fallback
+            # Search through the UI as fallback
             try:
-                logger.info("Trying direct URL navigation to hashtag page")
-                await self.page.goto(f"https://www.instagram.com/explore/tags/{hashtag}/", wait_until="networkidle")
-                await asyncio.sleep(5)  # Wait for page to load
+                await self._search_hashtag_ui(hashtag)
             except Exception as e2:
-                logger.error(f"Direct navigation failed: {str(e2)}")
+                logger.error(f"Search using UI failed: {str(e2)}")
                 return False
         
         # Verify posts are loaded - using different CSS selectors
@@ -307,59 +789,126 @@ class InstagramScraper(BaseScraper):
         
         return False
 
+    async def _search_hashtag_ui(self, hashtag):
+        #Open the hashtag page through the search box
+        # Click on search icon
+        await self.page.click("svg[aria-label='Search']")
+        logger.info("Clicked on search icon")
+        
+        # Find search input and type hashtag
+        search_input = await self.page.wait_for_selector("input[placeholder='Search']", timeout=7000)
+        await search_input.fill(f"#{hashtag}")
+        logger.info(f"Entered search text: #{hashtag}")
+        
+        # Wait for search results and try to click on the hashtag
+        hashtag_result = self.page.locator(f"span:has-text('#{hashtag}')")
+        try:
+            await hashtag_result.first.wait_for(state="visible", timeout=3000)
+        except TimeoutError:
+            pass
+        
+        if await hashtag_result.count() > 0:
+            await hashtag_result.first.click()
+            logger.info(f"Clicked on #{hashtag} in search results")
+        else:
+            # If no results found, try pressing Enter
+            await search_input.press("Enter")
+            logger.info("No results found, pressed Enter")
+            try:
+                await self.page.wait_for_load_state("networkidle", timeout=2000)
+            except TimeoutError:
+                pass
+            
+            # Press Enter again to navigate to hashtag page
+            await search_input.press("Enter")
+            logger.info("Pressed Enter again")
+
     async def scroll_and_scrape(self, post_limit):
         #Scroll through posts and scrape data
         posts_scraped = 0
         last_height = await self.page.evaluate("document.body.scrollHeight")
         processed_ids = set()  # Track already processed post IDs to avoid duplicates
+        tried_links = set()  # Permalinks already opened in the page pool
+        downloads = []  # Thumbnail downloads running alongside the scraping
         
-        with tqdm(total=post_limit, desc="Scraping posts") as pbar:
+        def add_post(post_data):
+            #Keep a new post and start its thumbnail download; False for duplicates
+            if post_data['post_id'] in processed_ids:
+                return False
+            processed_ids.add(post_data['post_id'])
+            self.posts_data.append(post_data)
+            
+            # Download thumbnail without holding up the next post
+            if post_data.get('image_url'):
+                downloads.append(asyncio.create_task(self._download_thumbnail(post_data)))
+            
+            return True
+        
+        with tqdm(total=post_limit, desc="Scraping posts", mininterval=0.5) as pbar:
             while posts_scraped < post_limit:
                 try:
-                    # Find all post containers in the grid using different selectors
-                    post_containers = await self.page.query_selector_all("div._aagv")
-                    if not post_containers:
-                        # Try alternative selectors if the first one fails
-                        post_containers = await self.page.query_selector_all("div._aabd._aa8k._al3l")
-                    
-                    if not post_containers:
-                        logger.warning("Could not find any post containers with known selectors")
-                        # Try a very generic selector as last resort
-                        post_containers = await self.page.query_selector_all("article div[role='button'] img")
-                    
-                    logger.info(f"Found {len(post_containers)} visible posts on the page")
-                    
-                    # Process visible posts
+                    # Posts parsed from the grid's own API responses need no modal clicks
                     posts_processed_in_batch = 0
-                    for i in range(min(len(post_containers), post_limit - posts_scraped)):
-                        if posts_scraped >= post_limit:
-                            break
-                            
-                        # Process each post
-                        post_data = await self._process_post(post_containers[i], posts_scraped + 1)
+                    while self._pending_posts and posts_scraped < post_limit:
+                        if add_post(self._pending_posts.popleft()):
+                            posts_scraped += 1
+                            posts_processed_in_batch += 1
+                    
+                    # Fall back to opening posts if no API responses were recognised
+                    if not self._intercepted:
+                        # Permalinks of the grid posts, collected in one round-trip
+                        permalinks = await self.page.evaluate(
+                            "() => [...new Set([...document.querySelectorAll('a[href*=\"/p/\"]')].map(a => a.href))]"
+                        )
+                        # Only links actually opened are marked tried, so ones past the
+                        # remaining limit are still opened on a later round
+                        new_links = []
+                        for url in permalinks:
+                            if len(new_links) >= post_limit - posts_scraped:
+                                break
+                            shortcode = url.split('/p/')[1].split('/')[0]
+                            if shortcode not in processed_ids and shortcode not in tried_links:
+                                tried_links.add(shortcode)
+                                new_links.append(url)
                         
-                        if post_data:
-                            # Check if we've already processed this post (avoid duplicates)
-                            if post_data['post_id'] not in processed_ids:
-                                processed_ids.add(post_data['post_id'])
-                                self.posts_data.append(post_data)
-                                
-                                # Download thumbnail
-                                thumbnail_success = download_thumbnail(
-                                    post_data['image_url'], 
-                                    post_data['post_id'], 
-                                    self.thumbnail_dir
-                                )
-                                
-                                if thumbnail_success:
-                                    logger.info(f"Downloaded thumbnail for post {post_data['post_id']}")
+                        if new_links:
+                            # Open several posts at once in pooled tabs instead of one modal at a time
+                            for post_data in await asyncio.gather(*(self._extract_from_url(url) for url in new_links)):
+                                if post_data and add_post(post_data):
+                                    posts_scraped += 1
+                                    posts_processed_in_batch += 1
+                        else:
+                            # Find all post containers in the grid using different selectors
+                            post_containers = await self.page.query_selector_all("div._aagv")
+                            if not post_containers:
+                                # Try alternative selectors if the first one fails
+                                post_containers = await self.page.query_selector_all("div._aabd._aa8k._al3l")
+                        
+                            if not post_containers:
+                                logger.warning("Could not find any post containers with known selectors")
+                                # Try a very generic selector as last resort
+                                post_containers = await self.page.query_selector_all("article div[role='button'] img")
+                        
+                            logger.info(f"Found {len(post_containers)} visible posts on the page")
+                        
+                            # Process visible posts
+                            for i in range(min(len(post_containers), post_limit - posts_scraped)):
+                                if posts_scraped >= post_limit:
+                                    break
                                 
-                                posts_scraped += 1
-                                posts_processed_in_batch += 1
-                                pbar.update(1)
+                                # Process each post
+                                post_data = await self._process_post(post_containers[i], posts_scraped + 1)
+                            
+                                # Check if we've already processed this post (avoid duplicates)
+                                if post_data and add_post(post_data):
+                                    posts_scraped += 1
+                                    posts_processed_in_batch += 1
                                 
-                                # Log progress
-                                logger.info(f"Successfully scraped post {posts_scraped}/{post_limit}")
+                                    # Log progress
+                                    logger.debug("Successfully scraped post %d/%d", posts_scraped, post_limit)
+                    
+                    # One progress bar update per batch
+                    pbar.update(posts_processed_in_batch)
 
                     if posts_scraped >= post_limit:
                         logger.info(f"Reached target of {post_limit} posts")
@@ -368,8 +917,7 @@ class InstagramScraper(BaseScraper):
                     if posts_processed_in_batch == 0:
                         logger.warning("No new posts were processed in this batch, attempting more aggressive scrolling")
                         # More aggressive scrolling if we're not finding new posts
-                        await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight + 2000)")
-                        await asyncio.sleep(3)
+                        await scroll_and_wait(self.page, last_height)
                         
                         # Try clicking "Load more" button if it exists
                         try:
@@ -377,53 +925,89 @@ class InstagramScraper(BaseScraper):
                             if await load_more.count() > 0:
                                 logger.info("Found 'Load more' button, clicking it")
                                 await load_more.first.click()
-                                await asyncio.sleep(3)
+                                await self._wait_for_more_content(last_height)
                         except Exception as e:
                             logger.debug(f"No 'Load more' button found: {str(e)}")
                         
-                    # Scroll down to load more posts
-                    await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    await asyncio.sleep(2)
+                    # Scroll down and wait (up to a few seconds) for more posts to load
+                    new_height = await scroll_and_wait(self.page, last_height)
                     
                     # Check if page has new content
-                    new_height = await self.page.evaluate("document.body.scrollHeight")
                     if new_height == last_height:
-                        # Try scrolling more aggressively
-                        for _ in range(3):  # Try multiple small scrolls
-                            await self.page.evaluate(f"window.scrollTo(0, {last_height + 1000})")
-                            await asyncio.sleep(1)
-                        
-                        new_height = await self.page.evaluate("document.body.scrollHeight")
-                        if new_height == last_height:
+                        # A real wheel event triggers the infinite-scroll observer when scrollTo did not
+                        await self.page.mouse.wheel(0, 5000)
+                        if not await self._wait_for_more_content(last_height, timeout=2500):
                             logger.info("Reached end of scrollable content, no more posts to load")
                             break
+                        new_height = await self.page.evaluate("document.body.scrollHeight")
                     
                     last_height = new_height
                     logger.info(f"Scrolled to new content, new height: {new_height}")
-                    await asyncio.sleep(1)  # Give some time for posts to render
                     
                 except Exception as e:
                     logger.error(f"Error during scrolling: {str(e)}")
                     # Try to continue despite errors
                     await asyncio.sleep(2)
+        
+        if downloads:
+            await asyncio.gather(*downloads, return_exceptions=True)
                     
         logger.info(f"Completed scraping with {posts_scraped} posts")
         return self.posts_data
 
+    async def _get_pool_page(self):
+        #Borrow an idle tab, opening a new one while the pool is below page_pool_size
+        if self._page_pool.empty() and self._pool_pages < self.page_pool_size:
+            self._pool_pages += 1
+            page = await self.context.new_page()
+            page.set_default_timeout(30000)
+            return page
+        return await self._page_pool.get()
+
+    async def _extract_from_url(self, url):
+        #Open a post's permalink in a pooled tab and extract its data
+        page = await self._get_pool_page()
+        try:
+            await page.goto(url, wait_until="domcontentloaded")
+            await page.wait_for_selector("main article img", timeout=10000)
+            return await self._extract_post_data(page, root="main")
+        except Exception as e:
+            logger.warning(f"Error processing post {url}: {str(e)}")
+            return None
+        finally:
+            self._page_pool.put_nowait(page)
+
+    async def _wait_for_more_content(self, last_height, timeout=4000):
+        #Wait until the page grows past last_height (more posts loaded); False on timeout
+        try:
+            await self.page.wait_for_function(
+                "height => document.body.scrollHeight > height", arg=last_height, timeout=timeout
+            )
+            return True
+        except TimeoutError:
+            return False
+
+    async def _close_modal(self):
+        #Press Escape and wait for the post modal to go away
+        await self.page.keyboard.press("Escape")
+        try:
+            await self.page.wait_for_selector("div[role='dialog']", state="detached", timeout=3000)
+        except TimeoutError:
+            logger.debug("Post modal still open after Escape")
+
     async def _process_post(self, post_container, post_number):
         #Process a single post
         try:
             # Click on the post to open it
             await post_container.click()
-            logger.info(f"Clicked on post {post_number}")
-            await asyncio.sleep(3)  # Wait for post to open
+            logger.debug("Clicked on post %s", post_number)
+            await self.page.wait_for_selector("div[role='dialog'] article img", timeout=5000)
             
             # Extract data from the opened post
             post_data = await self._extract_post_data()
             
             # Close the modal by pressing Escape
-            await self.page.keyboard.press("Escape")
-            await asyncio.sleep(1)  # Wait for modal to close
+            await self._close_modal()
             
             return post_data
                 
@@ -431,178 +1015,94 @@ class InstagramScraper(BaseScraper):
             logger.warning(f"Error processing post {post_number}: {str(e)}")
             # Try to close any open modal if there was an error
             try:
-                await self.page.keyboard.press("Escape")
-                await asyncio.sleep(1)
+                await self._close_modal()
             except:
                 pass
             
             return None
 
-    async def _extract_post_data(self):
-        #Extract comprehensive metadata from an opened post"""
+    async def _extract_post_data(self, page=None, root="div[role='dialog']"):
+        #Extract comprehensive metadata from an opened post: the modal on self.page by
+        #default, or a permalink page with root="main"
+        page = page or self.page
         try:
-            # Get the image URL from the modal
-            img = await self.page.query_selector("div[role='dialog'] article img")
-            if not img:
-                logger.warning("Could not find image in modal")
+            # Everything is read from the DOM in a single round-trip to the browser
+            data = await page.evaluate(self.POST_DATA_JS, root)
+            if not data or not data['image_url']:
+                logger.warning("Could not find image in post")
                 return None
                 
-            image_url = await img.get_attribute('src')
+            image_url = data['image_url']
             
             # Extract post ID - try multiple methods
             post_id = None
             
             # Method 1: Try to get post ID from URL in the address bar
-            try:
-                current_url = await self.page.evaluate("window.location.href")
-                if '/p/' in current_url:
-                    # Format: https://www.instagram.com/p/[POST_ID]/
-                    post_id = current_url.split('/p/')[1].split('/')[0]
-                    logger.info(f"Extracted post ID from URL: {post_id}")
-            except Exception as e:
-                logger.debug(f"Could not extract post ID from URL: {str(e)}")
+            current_url = data['url'] or ''
+            if '/p/' in current_url:
+                # Format: https://www.instagram.com/p/[POST_ID]/
+                post_id = current_url.split('/p/')[1].split('/')[0]
+                logger.debug("Extracted post ID from URL: %s", post_id)
             
             # Method 2: Extract from image URL if method 1 failed
             if not post_id:
-                try:
-                    # Extract the filename part from the URL
-                    filename = image_url.split('/')[-1].split('?')[0]
-                    # Most Instagram image filenames start with the post ID
-                    if '_' in filename:
-                        post_id = filename
-                        logger.info(f"Extracted post ID from image filename: {post_id}")
-                except Exception as e:
-                    logger.debug(f"Could not extract post ID from image URL: {str(e)}")
+                # Extract the filename part from the URL
+                filename = image_url.split('/')[-1].split('?')[0]
+                # Most Instagram image filenames start with the post ID
+                if '_' in filename:
+                    post_id = filename
+                    logger.debug("Extracted post ID from image filename: %s", post_id)
             
             # Method 3: Fallback - use image URL hash if all else fails
             if not post_id:
-                import hashlib
-                post_id = hashlib.md5(image_url.encode()).hexdigest()[:16]
-                logger.info(f"Generated fallback post ID using hash: {post_id}")
+                post_id = blake2b(image_url.encode(), digest_size=8).hexdigest()
+                logger.debug("Generated fallback post ID using hash: %s", post_id)
             
-            # Extract author/username
-            author = ""
-            try:
-                author_elem = await self.page.query_selector("div[role='dialog'] header a")
-                if author_elem:
-                    author = await author_elem.inner_text()                      
-                # Clean up author text
-                author = self._clean_text(author)
-            except Exception as e:
-                logger.warning(f"Could not extract author: {str(e)}")
+            # Clean up author text
+            author = self._clean_text(data['author'] or '')
             
-            # Extract post caption/text
+            # Post caption/text: first candidate that isn't an empty or very short string
             post_text = ""
-            try:
-                # Try multiple selectors for post text
-                caption_selectors = [
-                    "div[role='dialog'] ul div > span",
-                    "div[role='dialog'] h1", 
-                    "div[role='dialog'] div[role='button'] > span",
-                    "div[role='dialog'] span[dir='auto']"
-                ]
-                
-                for selector in caption_selectors:
-                    caption_elem = await self.page.query_selector(selector)
-                    if caption_elem:
-                        caption_text = await caption_elem.inner_text()
-                        if caption_text and len(caption_text) > 5:  # Ensure it's not an empty or very short string
-                            post_text = self._clean_text(caption_text)
-                            break
-            except Exception as e:
-                logger.warning(f"Could not extract caption: {str(e)}")
+            for caption_text in data['captions']:
+                if caption_text and len(caption_text) > 5:
+                    post_text = self._clean_text(caption_text)
+                    break
             
             # Extract hashtags from post text
             hashtags = []
             if post_text:
-                # Find all hashtags using regex
-                hashtags = re.findall(r'#(\w+)', post_text)
-                
-                # Remove hashtags from post_text
-                post_text = re.sub(r'#\w+\s*', '', post_text).strip()
-                # Clean up any double spaces created by hashtag removal
-                post_text = ' '.join(post_text.split())
+                # Collect and remove hashtags in one pass
+                post_text, hashtags = split_hashtags(post_text)
             
-            # Extract timestamp if available
-            timestamp = ""
-            try:
-                # Try to find the post timestamp
-                time_elem = await self.page.query_selector("div[role='dialog'] time")
-                if time_elem:
-                    datetime_attr = await time_elem.get_attribute('datetime')
-                    if datetime_attr:
-                        timestamp = datetime_attr
-                    else:
-                        # If datetime attribute not available, use the text
-                        timestamp = await time_elem.inner_text()
-            except Exception as e:
-                logger.warning(f"Could not extract timestamp: {str(e)}")
-                
             # If no timestamp found, use current time
-            if not timestamp:
-                timestamp = datetime.now().isoformat()
+            timestamp = data['timestamp'] or datetime.now().isoformat()
                 
-            # Extract likes count
+            # Extract likes count from the candidate texts, in selector order
             likes = ""
-            try:
-                #Look for specific like count text
-                likes_selectors = [
-                    "div[role='dialog'] section span span",
-                    "div[role='dialog'] section span a span",
-                    "div[role='dialog'] a span span",
-                    "div[role='dialog'] div:has-text('likes')",
-                    "div[role='dialog'] div:has-text('like')"
-                ]
-                
-                for selector in likes_selectors:
-                    likes_elem = await self.page.query_selector(selector)
-                    if likes_elem:
-                        likes_text = await likes_elem.inner_text()
-                        # Extract numeric value using regex
-                        likes_match = re.search(r'(\d+(?:,\d+)*)\s*(?:like|likes)', likes_text.lower())
-                        if likes_match:
-                            # Remove commas and convert to string
-                            likes = likes_match.group(1).replace(',', '')
-                            logger.info(f"Found likes count: {likes}")
-                            break
-                
-            except Exception as e:
-                logger.warning(f"Could not extract likes: {str(e)}")
+            for likes_text in data['likes']:
+                if likes_text:
+                    # Extract numeric value using regex
+                    likes_match = LIKES_RE.search(likes_text.lower())
+                    if likes_match:
+                        # Remove commas and convert to string
+                        likes = likes_match.group(1).replace(',', '')
+                        logger.debug("Found likes count: %s", likes)
+                        break
             
             # Extract comments count
             comments = ""
-            try:
-                # Approach 1: Look for text containing "comments" or "comment"
-                comments_patterns = [
-                    r'(\d+(?:,\d+)*)\s*comments',
-                    r'(\d+(?:,\d+)*)\s*comment',
-                    r'view all\s*(\d+(?:,\d+)*)\s*comments'
-                ]
-                
-                # Find elements that might contain comment counts
-                comment_selectors = [
-                    "div[role='dialog'] span:has-text('comment')",
-                    "div[role='dialog'] a:has-text('comment')",
-                    "div[role='dialog'] div:has-text('comment')"
-                ]
-                
-                for selector in comment_selectors:
-                    comments_elem = await self.page.query_selector(selector)
-                    if comments_elem:
-                        comments_text = await comments_elem.inner_text()
-                        
-                        # Try each pattern
-                        for pattern in comments_patterns:
-                            match = re.search(pattern, comments_text.lower())
-                            if match:
-                                comments = match.group(1).replace(',', '')
-                                logger.info(f"Found comments count: {comments}")
-                                break
-                        
-                        if comments:
+            for comments_text in data['comments']:
+                if comments_text:
+                    # Try each pattern
+                    for pattern in COMMENTS_RES:
+                        match = pattern.search(comments_text.lower())
+                        if match:
+                            comments = match.group(1).replace(',', '')
+                            logger.debug("Found comments count: %s", comments)
                             break
-            except Exception as e:
-                logger.warning(f"Could not extract comments count: {str(e)}")
+                    
+                    if comments:
+                        break
             
             # Compile all the data scraped
             return {
@@ -618,7 +1118,7 @@ class InstagramScraper(BaseScraper):
                 'scraped_at': datetime.now().isoformat()
             }
         except Exception as e:
-            logger.error(f"Error extracting post data from modal: {str(e)}")
+            logger.error(f"Error extracting post data: {str(e)}")
             return None
 
     def _clean_text(self, text):
@@ -626,33 +1126,20 @@ class InstagramScraper(BaseScraper):
         if not text:
             return ""
             
-        # Replace problematic characters
-        text = text.replace('\u2122', '™') 
-        text = text.replace('\u00a9', '©') 
-        text = text.replace('\u00ae', '®') 
-        
-        # Replace other common special characters
-        text = text.replace('\u2018', "'") 
-        text = text.replace('\u2019', "'") 
-        text = text.replace('\u201c', '"') 
-        text = text.replace('\u201d', '"')
-        text = text.replace('\u2013', '-')
-        text = text.replace('\u2014', '--')
-        
-        # Remove zero-width spaces and other invisible characters
-        text = text.replace('\u200b', '')  
-        text = text.replace('\ufeff', '') 
-        
-        # Normalize whitespace
-        text = ' '.join(text.split())
+        # Replace special characters and drop zero-width ones, then normalize whitespace
+        text = ' '.join(replace_special_chars(text).split())
         
         return text
 
     async def cleanup(self):
-        #Close the browser and clean up
+        #Close this scraper's context and hand the browser back to the pool
+        if self.http:
+            await self.http.close()
+        if self.context:
+            await self.context.close()
         if self.browser:
-            await self.browser.close()
-            logger.info("Browser closed")
+            await BROWSER_POOL.release(self.browser)
+            logger.info("Browser context closed")
             
     @classmethod
     async def _execute_scrape(cls, hashtag, limit):
@@ -672,8 +1159,8 @@ class InstagramScraper(BaseScraper):
             # Setup browser
             await scraper.setup_browser()
             
-            # Login to Instagram
-            if await scraper.login():
+            # Login to Instagram, unless the saved session is still valid
+            if await scraper.restore_session() or await scraper.login():
                 # Search for hashtag
                 if await scraper.search_hashtag(hashtag):
                     # Scrape posts
@@ -694,10 +1181,28 @@ class InstagramScraper(BaseScraper):
 
 #------------ YOUTUBE SCRAPER WITH GOOGLE CLOUD YOUTUBE DATA API ------------#
 
+# YouTube returns at most about this many results for one search query
+YOUTUBE_RESULTS_PER_QUERY = 500
+# Earliest publishedAfter used when splitting a search into time windows
+YOUTUBE_LAUNCH_DATE = datetime(2005, 4, 23, tzinfo=timezone.utc)
+
 class YouTubeScraper(BaseScraper):
+    # REST endpoint used by the aiohttp path (same API googleapiclient wraps)
+    API_URL = 'https://www.googleapis.com/youtube/v3'
+    
+    # Response fields actually read, so the API leaves everything else out
+    SEARCH_FIELDS = 'items(id(kind,videoId)),nextPageToken'
+    VIDEO_FIELDS = (
+        'items(id,'
+        'snippet(title,description,channelTitle,channelId,publishedAt,'
+        'thumbnails(maxres/url,high/url,medium/url,standard/url,default/url)),'
+        'statistics(likeCount,commentCount,viewCount),'
+        'contentDetails(duration))'
+    )
+    
     def __init__(self, api_key=None):
         # Load API key from config.json
-        config = load_config()
+        config = get_config()
         
         # Require API key to be in config file
         if not config.get('youtube_api_key'):
@@ -710,12 +1215,20 @@ class YouTubeScraper(BaseScraper):
         self.thumbnail_dir = config.get('thumbnail_directory', 'thumbnails')
         logger.info(f"Using thumbnail directory: {self.thumbnail_dir}")
         
-        self.youtube = build('youtube', 'v3', developerKey=self.api_key)
+        self._youtube = None  # googleapiclient client, built on first use
         self.posts_data = []
         
         # Create thumbnail directory if it doesn't exist
         ensure_dir_exists(self.thumbnail_dir)
 
+    @property
+    def youtube(self):
+        #googleapiclient client for the synchronous path. Built lazily: build() blocks
+        #(it loads the discovery document), and the aiohttp path never needs it
+        if self._youtube is None:
+            self._youtube = build('youtube', 'v3', developerKey=self.api_key)
+        return self._youtube
+
     def search_videos(self, query, max_results=50):
         #Search for videos on YouTube with the given query
         logger.info(f"Searching YouTube for: {query} (limit: {max_results} videos)")
@@ -750,18 +1263,14 @@ class YouTubeScraper(BaseScraper):
                         logger.info("No more results found")
                         break
                     
-                    # Get additional data for each video
-                    for item in items:
-                        if item['id']['kind'] == 'youtube#video':
-                            video_id = item['id']['videoId']
-                            # Get detailed video information
-                            video_data = self._get_video_details(video_id)
-                            if video_data:
-                                videos_data.append(video_data)
-                                # Download thumbnail
-                                download_thumbnail(video_data['image_url'], video_data['post_id'], self.thumbnail_dir)
-                                total_retrieved += 1
-                                pbar.update(1)
+                    # Get additional data for the whole page of videos in one request
+                    video_ids = [item['id']['videoId'] for item in items if item['id']['kind'] == 'youtube#video']
+                    for video_data in self._get_video_details_batch(video_ids):
+                        videos_data.append(video_data)
+                        # Download thumbnail
+                        download_thumbnail(video_data['image_url'], video_data['post_id'], self.thumbnail_dir)
+                        total_retrieved += 1
+                        pbar.update(1)
                     
                     # Check if there are more pages
                     next_page_token = search_response.get('nextPageToken')
@@ -776,7 +1285,7 @@ class YouTubeScraper(BaseScraper):
             return videos_data
         
         except HttpError as e:
-            error_content = json.loads(e.content.decode('utf-8'))
+            error_content = json_loads(e.content)
             error_message = error_content.get('error', {}).get('message', str(e))
             logger.error(f"YouTube API error: {error_message}")
             return []
@@ -785,12 +1294,157 @@ class YouTubeScraper(BaseScraper):
             logger.error(f"Error searching YouTube: {str(e)}")
             return []
     
+    async def search_videos_async(self, query, max_results=50, session=None, start_date=None, end_date=None, bins=None):
+        #Async version of search_videos calling the REST API with aiohttp; thumbnails
+        #download concurrently (at most 10 at a time) while later pages are fetched.
+        #YouTube stops paging a query after about 500 results, so larger requests
+        #(or an explicit bins / date range) are split into publishedAfter/publishedBefore
+        #windows that are searched concurrently, at most 5 at a time.
+        #Uses session (see create_http_session) when given, falling back to
+        #search_videos in a worker thread if aiohttp is not installed
+        if aiohttp is None:
+            return await asyncio.to_thread(self.search_videos, query, max_results)
+        if session is None:
+            async with create_http_session(limit=20) as session:
+                return await self.search_videos_async(query, max_results, session, start_date, end_date, bins)
+        
+        logger.info(f"Searching YouTube for: {query} (limit: {max_results} videos)")
+        
+        if bins is None:
+            bins = math.ceil(max_results / YOUTUBE_RESULTS_PER_QUERY)
+        if bins > 1 or start_date or end_date:
+            windows = self._time_windows(start_date, end_date, bins)
+        else:
+            windows = [(None, None)]
+        window_limit = math.ceil(max_results / len(windows))
+        scraped_at = datetime.now().isoformat()  # one timestamp for the whole scrape
+        
+        videos_data = []
+        seen = set()  # video IDs already taken, as time windows can overlap at the edges
+        downloads = []
+        semaphore = asyncio.Semaphore(10)
+        window_semaphore = asyncio.Semaphore(5)
+        
+        async def search_window(published_after, published_before):
+            #Page through one time window until it has window_limit videos
+            search_params = {
+                'q': query,
+                'part': 'id',
+                'fields': self.SEARCH_FIELDS,
+                'type': 'video',
+                'order': 'relevance'
+            }
+            if published_after:
+                search_params['publishedAfter'] = published_after
+                search_params['publishedBefore'] = published_before
+            
+            collected = 0
+            async with window_semaphore:
+                while collected < window_limit and len(videos_data) < max_results:
+                    # YouTube API allows max 50 per request
+                    search_params['maxResults'] = min(50, window_limit - collected)
+                    search_response = await self._api_get_async(session, 'search', search_params, CACHE_TTL_SEARCH)
+                    if not search_response:
+                        break
+                    
+                    items = search_response.get('items', [])
+                    if not items:
+                        logger.info("No more results found")
+                        break
+                    
+                    # Details for the whole page (less any cached ones) in one videos.list request
+                    video_ids = [
+                        item['id']['videoId'] for item in items
+                        if item['id']['kind'] == 'youtube#video' and item['id']['videoId'] not in seen
+                    ]
+                    seen.update(video_ids)
+                    found, missing = self._cached_video_items(video_ids)
+                    if missing:
+                        video_response = await self._api_get_async(session, 'videos', {
+                            'part': 'snippet,contentDetails,statistics',
+                            'fields': self.VIDEO_FIELDS,
+                            'id': ','.join(missing),
+                            'maxResults': 50
+                        })
+                        self._cache_video_items((video_response or {}).get('items', []), found)
+                    
+                    for video_data in self._videos_from_items(video_ids, found, scraped_at):
+                        if len(videos_data) >= max_results:
+                            break
+                        videos_data.append(video_data)
+                        collected += 1
+                        
+                        # Download thumbnail without holding up the next page
+                        if video_data['image_url']:
+                            downloads.append(asyncio.create_task(download_thumbnail_async(
+                                session, video_data['image_url'], video_data['post_id'], self.thumbnail_dir, semaphore
+                            )))
+                        pbar.update(1)
+                    
+                    # Check if there are more pages
+                    search_params['pageToken'] = search_response.get('nextPageToken')
+                    if not search_params['pageToken']:
+                        break
+        
+        with tqdm(total=max_results, desc="Retrieving videos") as pbar:
+            await asyncio.gather(*(search_window(after, before) for after, before in windows))
+        
+        if downloads:
+            await asyncio.gather(*downloads, return_exceptions=True)
+        
+        self.posts_data = videos_data
+        logger.info(f"Successfully retrieved {len(videos_data)} videos")
+        return videos_data
+    
+    @staticmethod
+    def _time_windows(start_date, end_date, bins):
+        #Split [start_date, end_date] (default: YouTube's launch until now) into bins
+        #equal windows, as RFC 3339 (publishedAfter, publishedBefore) pairs.
+        #Naive dates are taken as UTC; aware ones are converted to it
+        start, end = (
+            date.astimezone(timezone.utc) if date.tzinfo else date.replace(tzinfo=timezone.utc)
+            for date in (start_date or YOUTUBE_LAUNCH_DATE, end_date or datetime.now(timezone.utc))
+        )
+        step = (end - start) / bins
+        fmt = '%Y-%m-%dT%H:%M:%SZ'
+        return [
+            ((start + step * i).strftime(fmt), (start + step * (i + 1)).strftime(fmt))
+            for i in range(bins)
+        ]
+    
+    async def _api_get_async(self, session, endpoint, params, expire=None):
+        #GET an API endpoint on the aiohttp session; None (after logging) on failure.
+        #With expire, responses are cached for that many seconds
+        if expire:
+            key = cache_key(f"{self.API_URL}/{endpoint}", params)
+            data = cache_get(key)
+            if data is not None:
+                return data
+        
+        try:
+            async with session.get(f"{self.API_URL}/{endpoint}", params=dict(params, key=self.api_key)) as response:
+                data = json_loads(await response.read())
+                if response.status != 200:
+                    error_message = data.get('error', {}).get('message', f"HTTP {response.status}")
+                    if response.status in [403, 429]:  # Quota exceeded or rate limiting
+                        logger.warning(f"API quota issue: {error_message}")
+                    logger.error(f"YouTube API error: {error_message}")
+                    return None
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logger.error(f"YouTube API request failed: {str(e)}")
+            return None
+        
+        if expire:
+            cache_set(key, data, expire)
+        return data
+    
     def _make_search_request(self, query, max_results=50, page_token=None):
         #Make a search request to the YouTube API
         try:
             search_params = {
                 'q': query,
-                'part': 'snippet',
+                'part': 'id',
+                'fields': self.SEARCH_FIELDS,
                 'maxResults': max_results,
                 'type': 'video',
                 'order': 'relevance'  
@@ -799,7 +1453,11 @@ class YouTubeScraper(BaseScraper):
             if page_token:
                 search_params['pageToken'] = page_token
             
-            search_response = self.youtube.search().list(**search_params).execute()
+            key = cache_key(f"{self.API_URL}/search", search_params)
+            search_response = cache_get(key)
+            if search_response is None:
+                search_response = self.youtube.search().list(**search_params).execute()
+                cache_set(key, search_response, CACHE_TTL_SEARCH)
             return search_response
         
         except HttpError as e:
@@ -813,19 +1471,73 @@ class YouTubeScraper(BaseScraper):
     
     def _get_video_details(self, video_id):
         #Get detailed information about a video
-        try:
-            # Get video details from the API
-            video_response = self.youtube.videos().list(
-                part='snippet,contentDetails,statistics',
-                id=video_id
-            ).execute()
+        videos = self._get_video_details_batch([video_id])
+        return videos[0] if videos else None
+    
+    def _get_video_details_batch(self, video_ids):
+        #Get detailed information for many videos, up to 50 IDs per videos.list request
+        found, missing = self._cached_video_items(video_ids)
+        for start in range(0, len(missing), 50):
+            chunk = missing[start:start + 50]
+            try:
+                # Get video details from the API
+                video_response = self.youtube.videos().list(
+                    part='snippet,contentDetails,statistics',
+                    fields=self.VIDEO_FIELDS,
+                    id=','.join(chunk),
+                    maxResults=50
+                ).execute()
+            except HttpError as e:
+                logger.warning(f"API error getting video details for {len(chunk)} videos: {str(e)}")
+                continue
+            except Exception as e:
+                logger.warning(f"Error getting video details for {len(chunk)} videos: {str(e)}")
+                continue
             
-            if not video_response['items']:
+            self._cache_video_items(video_response.get('items', []), found)
+        
+        return self._videos_from_items(video_ids, found)
+    
+    def _video_cache_key(self, video_id):
+        return cache_key(f"{self.API_URL}/videos", {'id': video_id})
+    
+    def _cached_video_items(self, video_ids):
+        #Split IDs into cached videos.list items (by ID) and IDs still to request
+        found, missing = {}, []
+        for video_id in video_ids:
+            video_info = cache_get(self._video_cache_key(video_id))
+            if video_info is None:
+                missing.append(video_id)
+            else:
+                found[video_id] = video_info
+        return found, missing
+    
+    def _cache_video_items(self, items, found):
+        #Add freshly fetched videos.list items to found and to the cache
+        for video_info in items:
+            found[video_info['id']] = video_info
+            cache_set(self._video_cache_key(video_info['id']), video_info, CACHE_TTL_VIDEO)
+    
+    def _videos_from_items(self, video_ids, found, scraped_at=None):
+        #Post dicts in video_ids order, logging IDs with no details
+        scraped_at = scraped_at or datetime.now().isoformat()
+        videos = []
+        for video_id in video_ids:
+            video_info = found.get(video_id)
+            if video_info is None:
                 logger.warning(f"No details found for video ID: {video_id}")
-                return None
-            
+                continue
+            video_data = self._video_data_from_item(video_info, scraped_at)
+            if video_data:
+                videos.append(video_data)
+        return videos
+    
+    def _video_data_from_item(self, video_info, scraped_at=None):
+        #Build a post dict from one item of a videos.list response; scraped_at
+        #can be passed in so a batch shares one timestamp
+        video_id = video_info.get('id', '')
+        try:
             # Extract the video information
-            video_info = video_response['items'][0]
             snippet = video_info['snippet']
             statistics = video_info.get('statistics', {})
             
@@ -843,13 +1555,8 @@ class YouTubeScraper(BaseScraper):
             description = self._clean_text(snippet.get('description', ''))
             channel_title = self._clean_text(snippet.get('channelTitle', ''))
             
-            # Extract hashtags from description
-            hashtags = re.findall(r'#(\w+)', description)
-            
-            # Remove hashtags from description
-            description = re.sub(r'#\w+\s*', '', description).strip()
-            # Clean up any double spaces created by hashtag removal
-            description = ' '.join(description.split())
+            # Extract hashtags from description and remove them from it
+            description, hashtags = split_hashtags(description)
             
             # Format the data similar to Instagram scraper format to make the appending process easier
             video_data = {
@@ -866,14 +1573,11 @@ class YouTubeScraper(BaseScraper):
                 'duration': video_info.get('contentDetails', {}).get('duration', ''),
                 'channel_id': snippet.get('channelId', ''),
                 'url': f"https://www.youtube.com/watch?v={video_id}",
-                'scraped_at': datetime.now().isoformat()
+                'scraped_at': scraped_at or datetime.now().isoformat()
             }
             
             return video_data
             
-        except HttpError as e:
-            logger.warning(f"API error getting video details for {video_id}: {str(e)}")
-            return None
         except Exception as e:
             logger.warning(f"Error getting video details for {video_id}: {str(e)}")
             return None
@@ -883,30 +1587,13 @@ class YouTubeScraper(BaseScraper):
         if not text:
             return ""
             
-        # Replace problematic characters
-        text = text.replace('\u2122', '™')  
-        text = text.replace('\u00a9', '©') 
-        text = text.replace('\u00ae', '®') 
-        
-        # Replace other common special characters
-        text = text.replace('\u2018', "'")  
-        text = text.replace('\u2019', "'")  
-        text = text.replace('\u201c', '"') 
-        text = text.replace('\u201d', '"') 
-        text = text.replace('\u2013', '-') 
-        text = text.replace('\u2014', '--')  
-        
-        # Remove zero-width spaces and other invisible characters
-        text = text.replace('\u200b', '')  
-        text = text.replace('\ufeff', '') 
-        
-        # Normalize whitespace
-        text = ' '.join(text.split())
+        # Replace special characters and drop zero-width ones, then normalize whitespace
+        text = ' '.join(replace_special_chars(text).split())
         
         return text
 
     @classmethod
-    def _execute_scrape(cls, query, limit):
+    async def _execute_scrape(cls, query, limit):
         """
         YouTube-specific implementation of the scrape method.
         
@@ -921,7 +1608,7 @@ class YouTubeScraper(BaseScraper):
         scraper = cls()
         
         # Search for videos and collect data
-        videos_data = scraper.search_videos(query, limit)
+        videos_data = await scraper.search_videos_async(query, limit)
         return videos_data
 
 
@@ -940,7 +1627,7 @@ class RedditScraper(BaseScraper):
     """
     
     def __init__(self):
-        config = load_config()
+        config = get_config()
         
         self.base_url = "https://old.reddit.com"
         self.user_agent = config.get('reddit', {}).get(
@@ -951,12 +1638,22 @@ class RedditScraper(BaseScraper):
             'User-Agent': self.user_agent
         }
         
+        # Keep-alive session for the sync requests, so pages after the first
+        # reuse the open TLS connection to old.reddit.com
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        
         # Use thumbnail directory from config
         self.thumbnail_dir = config.get('thumbnail_directory', 'thumbnails')
         ensure_dir_exists(self.thumbnail_dir)
         
-        # Rate limiting - Reddit allows ~30 requests/minute without auth
-        self.request_delay = 2.0  # 2 seconds between requests
+        # Rate limiting - Reddit allows ~30 requests/minute without auth. The delay
+        # between requests adapts: it shrinks after each success (or follows Reddit's
+        # X-Ratelimit headers) and doubles, up to max_delay, after a 429/503
+        self.request_delay = 2.0  # starting delay in seconds
+        self.min_delay = 0.5
+        self.max_delay = 30.0
+        self.retries = 5  # attempts per request while rate limited
         self.last_request_time = 0
         
         self.posts_data = []
@@ -969,24 +1666,240 @@ class RedditScraper(BaseScraper):
             time.sleep(self.request_delay - elapsed)
         self.last_request_time = time.time()
     
+    def _update_pace(self, headers):
+        """Speed up after a successful response, pacing by Reddit's rate-limit headers when sent."""
+        try:
+            # Spread the remaining requests over the time left in Reddit's window
+            pace = float(headers['X-Ratelimit-Reset']) / max(float(headers['X-Ratelimit-Remaining']), 1.0)
+        except (KeyError, ValueError):
+            pace = self.request_delay * 0.9
+        self.request_delay = min(self.max_delay, max(self.min_delay, pace))
+    
+    def _backoff(self, headers):
+        """Double the delay after a 429/503 and return how long to wait before retrying."""
+        self.request_delay = min(self.max_delay, self.request_delay * 2.0)
+        try:
+            wait = float(headers['Retry-After'])
+        except (KeyError, ValueError):
+            wait = self.request_delay
+        return wait + random.uniform(0, self.request_delay * 0.1)
+    
     def _make_request(self, url, params=None):
-        """Make a rate-limited request to Reddit."""
-        self._rate_limit()
+        """Make a rate-limited request to Reddit, answering repeats from the cache."""
+        key = cache_key(url, params)
+        data = cache_get(key)
+        if data is not None:
+            return data
         
-        try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+        for _ in range(self.retries):
+            self._rate_limit()
             
-            if response.status_code == 429:
-                logger.warning("Rate limited by Reddit, waiting 60 seconds...")
-                time.sleep(60)
-                return self._make_request(url, params)
+            try:
+                response = self.session.get(url, params=params, timeout=30)
+                
+                if response.status_code in (429, 503):
+                    wait = self._backoff(response.headers)
+                    logger.warning(f"Rate limited by Reddit (HTTP {response.status_code}), retrying in {wait:.1f} seconds...")
+                    time.sleep(wait)
+                    continue
+                
+                response.raise_for_status()
+                self._update_pace(response.headers)
+                data = json_loads(response.content)
+                cache_set(key, data, CACHE_TTL_SEARCH)
+                return data
+                
+            except (requests.exceptions.RequestException, ValueError) as e:
+                logger.error(f"Request failed: {e}")
+                return None
+        
+        logger.error(f"Request failed: still rate limited after {self.retries} attempts")
+        return None
+    
+    async def _rate_limit_async(self):
+        """
+        Async version of _rate_limit that sleeps without blocking the event loop.
+        Each call reserves the next request slot before sleeping, so tasks sharing
+        one scraper (a CLI batch) are spaced request_delay apart instead of firing together.
+        """
+        now = time.time()
+        slot = max(now, self.last_request_time + self.request_delay)
+        self.last_request_time = slot
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
+    async def _make_request_async(self, session, url, params=None):
+        """Make a rate-limited request to Reddit on a shared aiohttp session, answering repeats from the cache."""
+        key = cache_key(url, params)
+        data = cache_get(key)
+        if data is not None:
+            return data
+        
+        for _ in range(self.retries):
+            await self._rate_limit_async()
             
-            response.raise_for_status()
-            return response.json()
+            try:
+                async with session.get(url, params=params, headers=self.headers) as response:
+                    if response.status in (429, 503):
+                        wait = self._backoff(response.headers)
+                        logger.warning(f"Rate limited by Reddit (HTTP {response.status}), retrying in {wait:.1f} seconds...")
+                    else:
+                        response.raise_for_status()
+                        self._update_pace(response.headers)
+                        data = json_loads(await response.read())
+                        cache_set(key, data, CACHE_TTL_SEARCH)
+                        return data
+                    
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                logger.error(f"Request failed: {e}")
+                return None
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            return None
+            # Wait with the connection already released back to the pool
+            await asyncio.sleep(wait)
+        
+        logger.error(f"Request failed: still rate limited after {self.retries} attempts")
+        return None
+    
+    async def _iter_listing_async(self, url, params, limit, desc, session=None):
+        """
+        Yield posts from a listing with aiohttp as each page arrives, up to `limit`.
+        
+        Pages are chained by Reddit's `after` cursor, so they are fetched in
+        order; thumbnail downloads run on the same session alongside the next
+        page request instead of blocking it. Pass a session from
+        create_http_session() to reuse its pooled connections across calls;
+        otherwise a private one is opened for this listing.
+        """
+        if session is None:
+            async with create_http_session() as session:
+                async for post_data in self._iter_listing_async(url, params, limit, desc, session):
+                    yield post_data
+            return
+        
+        count = 0
+        downloads = []
+        params = dict(params, limit=min(100, limit), raw_json=1)
+        scraped_at = datetime.now().isoformat()  # one timestamp for the whole listing
+        
+        try:
+            with tqdm(total=limit, desc=desc) as pbar:
+                while count < limit:
+                    data = await self._make_request_async(session, url, params)
+                    if not data or 'data' not in data:
+                        logger.warning("No data received, stopping")
+                        break
+                        
+                    children = data['data'].get('children', [])
+                    if not children:
+                        logger.info("No more posts available")
+                        break
+                        
+                    for child in children:
+                        if count >= limit:
+                            break
+                            
+                        post_data = self._process_post(child.get('data', {}), scraped_at)
+                        if post_data:
+                            count += 1
+                            
+                            if post_data.get('image_url'):
+                                downloads.append(asyncio.create_task(download_thumbnail_async(
+                                    session,
+                                    post_data['image_url'],
+                                    post_data['post_id'],
+                                    self.thumbnail_dir
+                                )))
+                                
+                            pbar.update(1)
+                            yield post_data
+                        
+                    params['after'] = data['data'].get('after')
+                    if not params['after']:
+                        logger.info("Reached end of listing")
+                        break
+        finally:
+            # Also runs if the consumer stops early, so no download is left behind
+            if downloads:
+                await asyncio.gather(*downloads, return_exceptions=True)
+    
+    async def _paginate_async(self, url, params, limit, desc, session=None):
+        """Collect a whole listing from _iter_listing_async into a list."""
+        posts_data = [post_data async for post_data in self._iter_listing_async(url, params, limit, desc, session)]
+        self.posts_data = posts_data
+        return posts_data
+    
+    def stream_async(self, query=None, subreddit=None, sort=None, limit=50, session=None):
+        """
+        Async iterator over posts as they are scraped, for consumers that write
+        each post out (file, database) instead of waiting for the full list.
+        Requires aiohttp.
+        
+        Args:
+            query: Search query (used if subreddit is None)
+            subreddit: Optional subreddit to list instead of searching
+            sort: Sort order (default 'hot' for a subreddit, 'relevance' for search)
+            limit: Maximum posts to yield
+            session: Optional aiohttp session from create_http_session()
+        
+        Example:
+            async for post in scraper.stream_async('python', limit=500):
+                writer.writerow(post)
+        
+        To stop early, wrap it in contextlib.aclosing() so pending thumbnail
+        downloads and a private session are closed right away.
+        """
+        if aiohttp is None:
+            raise RuntimeError("stream_async requires aiohttp")
+        
+        if subreddit:
+            return self._iter_listing_async(
+                f"{self.base_url}/r/{subreddit}/{sort or 'hot'}.json", {}, limit, f"Scraping r/{subreddit}", session
+            )
+        return self._iter_listing_async(
+            f"{self.base_url}/search.json",
+            {'q': query, 'sort': sort or 'relevance', 'type': 'link'},
+            limit,
+            f"Searching '{query}'",
+            session
+        )
+    
+    async def search_subreddit_async(self, subreddit, sort='hot', limit=50, session=None):
+        """
+        Async version of search_subreddit using aiohttp.
+        
+        Uses `session` (see create_http_session) when given. Falls back to running search_subreddit in a worker thread if aiohttp
+        is not installed.
+        """
+        if aiohttp is None:
+            return await asyncio.to_thread(self.search_subreddit, subreddit, sort=sort, limit=limit)
+        
+        logger.info(f"Scraping r/{subreddit} ({sort}) - limit: {limit}")
+        posts_data = await self._paginate_async(
+            f"{self.base_url}/r/{subreddit}/{sort}.json", {}, limit, f"Scraping r/{subreddit}", session
+        )
+        logger.info(f"Successfully scraped {len(posts_data)} posts from r/{subreddit}")
+        return posts_data
+    
+    async def search_posts_async(self, query, sort='relevance', limit=50, session=None):
+        """
+        Async version of search_posts using aiohttp.
+        
+        Uses `session` (see create_http_session) when given. Falls back to running search_posts in a worker thread if aiohttp
+        is not installed.
+        """
+        if aiohttp is None:
+            return await asyncio.to_thread(self.search_posts, query, sort=sort, limit=limit)
+        
+        logger.info(f"Searching Reddit for '{query}' ({sort}) - limit: {limit}")
+        posts_data = await self._paginate_async(
+            f"{self.base_url}/search.json",
+            {'q': query, 'sort': sort, 'type': 'link'},
+            limit,
+            f"Searching '{query}'",
+            session
+        )
+        logger.info(f"Successfully scraped {len(posts_data)} posts from search")
+        return posts_data
     
     def search_subreddit(self, subreddit, sort='hot', limit=50):
         """
@@ -1002,8 +1915,11 @@ class RedditScraper(BaseScraper):
         posts_data = []
         after = None
         posts_per_page = min(100, limit)  # Reddit max is 100 per request
+        scraped_at = datetime.now().isoformat()  # one timestamp for the whole scrape
         
-        with tqdm(total=limit, desc=f"Scraping r/{subreddit}") as pbar:
+        # Thumbnails download on worker threads while the next page is fetched;
+        # leaving the block waits for any still running
+        with ThreadPoolExecutor(max_workers=16) as thumb_pool, tqdm(total=limit, desc=f"Scraping r/{subreddit}") as pbar:
             while len(posts_data) < limit:
                 # Build URL
                 url = f"{self.base_url}/r/{subreddit}/{sort}.json"
@@ -1031,13 +1947,14 @@ class RedditScraper(BaseScraper):
                         break
                     
                     post = child.get('data', {})
-                    post_data = self._process_post(post)
+                    post_data = self._process_post(post, scraped_at)
                     if post_data:
                         posts_data.append(post_data)
                         
                         # Download thumbnail
                         if post_data.get('image_url'):
-                            download_thumbnail(
+                            thumb_pool.submit(
+                                download_thumbnail,
                                 post_data['image_url'],
                                 post_data['post_id'],
                                 self.thumbnail_dir
@@ -1069,8 +1986,10 @@ class RedditScraper(BaseScraper):
         posts_data = []
         after = None
         posts_per_page = min(100, limit)
+        scraped_at = datetime.now().isoformat()  # one timestamp for the whole scrape
         
-        with tqdm(total=limit, desc=f"Searching '{query}'") as pbar:
+        # Thumbnails download on worker threads while the next page is fetched
+        with ThreadPoolExecutor(max_workers=16) as thumb_pool, tqdm(total=limit, desc=f"Searching '{query}'") as pbar:
             while len(posts_data) < limit:
                 # Build URL
                 url = f"{self.base_url}/search.json"
@@ -1101,13 +2020,14 @@ class RedditScraper(BaseScraper):
                         break
                     
                     post = child.get('data', {})
-                    post_data = self._process_post(post)
+                    post_data = self._process_post(post, scraped_at)
                     if post_data:
                         posts_data.append(post_data)
                         
                         # Download thumbnail
                         if post_data.get('image_url'):
-                            download_thumbnail(
+                            thumb_pool.submit(
+                                download_thumbnail,
                                 post_data['image_url'],
                                 post_data['post_id'],
                                 self.thumbnail_dir
@@ -1125,8 +2045,8 @@ class RedditScraper(BaseScraper):
         logger.info(f"Successfully scraped {len(posts_data)} posts from search")
         return posts_data
     
-    def _process_post(self, post):
-        """Process a single Reddit post into our standard format."""
+    def _process_post(self, post, scraped_at=None):
+        """Process a single Reddit post into our standard format (scraped_at: shared timestamp for a scrape)."""
         try:
             post_id = post.get('id', '')
             if not post_id:
@@ -1173,7 +2093,7 @@ class RedditScraper(BaseScraper):
                 'subreddit': post.get('subreddit', ''),
                 'url': f"https://reddit.com{post.get('permalink', '')}",
                 'upvote_ratio': post.get('upvote_ratio', 0),
-                'scraped_at': datetime.now().isoformat()
+                'scraped_at': scraped_at or datetime.now().isoformat()
             }
             
         except Exception as e:
@@ -1185,22 +2105,11 @@ class RedditScraper(BaseScraper):
         if not text:
             return ""
         
-        # Replace common Reddit markdown
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        text = text.replace('&#x200B;', '')  # Zero-width space
+        # Replace common Reddit markdown (entities, incl. zero-width space) in one pass
+        text = HTML_ENTITY_RE.sub(lambda match: HTML_ENTITIES[match.group()], text)
         
-        # Replace special characters
-        text = text.replace('\u2018', "'")
-        text = text.replace('\u2019', "'")
-        text = text.replace('\u201c', '"')
-        text = text.replace('\u201d', '"')
-        text = text.replace('\u2013', '-')
-        text = text.replace('\u2014', '--')
-        
-        # Normalize whitespace
-        text = ' '.join(text.split())
+        # Replace special characters, then normalize whitespace
+        text = ' '.join(replace_special_chars(text).split())
         
         return text.strip()
     
@@ -1238,8 +2147,74 @@ class TwitterScraper(BaseScraper):
         - Extract tweet metadata (text, likes, retweets, etc.)
     """
     
+    # One round-trip per scroll step: with a timeout, scrolls to the bottom and waits
+    # up to that many ms for the timeline to add nodes (grew tells whether it did),
+    # then reads the raw fields of every tweet on the page not returned before.
+    # A MutationObserver (installed on first use) stamps every DOM addition, so the
+    # wait works even when virtualization keeps the page height unchanged.
+    # _extract_tweet_data turns each tweet into a post dict
+    TWEETS_JS = """
+        async (timeout) => {
+            let grew = true;
+            if (timeout) {
+                if (window.__lastAddedAt === undefined) {
+                    window.__lastAddedAt = Date.now();
+                    new MutationObserver(() => { window.__lastAddedAt = Date.now(); })
+                        .observe(document.body, {childList: true, subtree: true});
+                }
+                const scrolledAt = Date.now();
+                window.scrollTo(0, document.body.scrollHeight);
+                while (window.__lastAddedAt <= scrolledAt && Date.now() - scrolledAt < timeout) {
+                    await new Promise(resolve => setTimeout(resolve, 100));
+                }
+                grew = window.__lastAddedAt > scrolledAt;
+            }
+            
+            // Status ids already returned on this page: tweets stay mounted across
+            // scrolls, so they are skipped before any of their fields are read
+            const seen = window.__seenTweetIds || (window.__seenTweetIds = new Set());
+            const tweets = [];
+            for (const tweet of document.querySelectorAll('article[data-testid="tweet"]')) {
+                let statusHref = '', statusId = '';
+                for (const a of tweet.querySelectorAll('a[href*="/status/"]')) {
+                    const match = (a.getAttribute('href') || '').match(/\/status\/(\d+)/);
+                    if (match) {
+                        statusHref = a.getAttribute('href');
+                        statusId = match[1];
+                        break;
+                    }
+                }
+                if (statusId) {
+                    if (seen.has(statusId)) continue;
+                    seen.add(statusId);
+                }
+                const text = selector => {
+                    const el = tweet.querySelector(selector);
+                    return el ? el.innerText : '';
+                };
+                const attr = (selector, name) => {
+                    const el = tweet.querySelector(selector);
+                    return el ? el.getAttribute(name) || '' : '';
+                };
+                tweets.push({
+                    text: text('div[data-testid="tweetText"]'),
+                    author_href: attr('div[data-testid="User-Name"] a', 'href'),
+                    status_href: statusHref,
+                    status_id: statusId,
+                    timestamp: attr('time', 'datetime'),
+                    likes: text('div[data-testid="like"] span span'),
+                    retweets: text('div[data-testid="retweet"] span span'),
+                    replies: text('div[data-testid="reply"] span span'),
+                    image_url: attr('img[src*="pbs.twimg.com/media"]', 'src'),
+                });
+            }
+            return {grew, tweets};
+        }
+    """
+    
+    
     def __init__(self):
-        config = load_config()
+        config = get_config()
         twitter_config = config.get('twitter', {})
         
         # Twitter credentials (optional - works without login for public tweets, but limited)
@@ -1250,23 +2225,26 @@ class TwitterScraper(BaseScraper):
         self.thumbnail_dir = config.get('thumbnail_directory', 'thumbnails')
         ensure_dir_exists(self.thumbnail_dir)
         
+        # Run Chromium without a window unless config sets "headless": false
+        self.headless = config.get('headless', True)
+        
         self.browser = None
         self.context = None
         self.page = None
+        self.http = None  # aiohttp session for thumbnails, opened in setup_browser
+        self.download_semaphore = None
         self.posts_data = []
         
         logger.info(f"TwitterScraper initialized (login: {'enabled' if self.username else 'disabled'})")
     
     async def setup_browser(self):
-        """Initialize Playwright browser with anti-detection measures."""
-        playwright = await async_playwright().start()
-        
+        """Take a pooled browser and open a context with anti-detection measures."""
         logger.info("Setting up browser for Twitter scraping...")
         
-        # Launch browser with anti-detection args
-        self.browser = await playwright.chromium.launch(
-            headless=False,
-            args=[
+        # Launch browser with anti-detection args (or reuse a pooled one)
+        self.browser = await BROWSER_POOL.acquire(
+            self.headless,
+            [
                 '--disable-blink-features=AutomationControlled',
                 '--disable-notifications',
                 '--start-maximized',
@@ -1274,8 +2252,9 @@ class TwitterScraper(BaseScraper):
                 '--disable-dev-shm-usage',
                 '--no-sandbox',
                 '--window-size=1920,1080',
-                '--enable-unsafe-swiftshader'
-            ]
+                '--enable-unsafe-swiftshader',
+                '--blink-settings=imagesEnabled=false'
+            ] + (HEADLESS_ARGS if self.headless else [])
         )
         
         # Configure context to bypass automation detection
@@ -1288,6 +2267,8 @@ class TwitterScraper(BaseScraper):
             screen={'width': 1920, 'height': 1080},
             ignore_https_errors=True
         )
+        # Thumbnails are fetched separately from the img src, so the page never needs to load images
+        await self.context.route("**/*", block_unneeded_resources_and_images)
         
         # Remove webdriver property
         await self.context.add_init_script("""
@@ -1299,6 +2280,11 @@ class TwitterScraper(BaseScraper):
         self.page = await self.context.new_page()
         self.page.set_default_timeout(30000)
         
+        # Thumbnails download concurrently on one pooled session (at most 10 in flight)
+        if aiohttp is not None:
+            self.http = create_http_session(limit=100, limit_per_host=10)
+        self.download_semaphore = asyncio.Semaphore(10)
+        
         logger.info("Browser setup complete")
     
     async def login(self):
@@ -1347,32 +2333,19 @@ class TwitterScraper(BaseScraper):
             logger.error(f"Twitter login failed: {e}")
             return False
     
-    async def search_tweets(self, query, limit=50):
+    async def search_tweets(self, query, limit=50, page=None):
         """
         Search for tweets matching a query.
         
         Args:
             query: Search term or hashtag
             limit: Maximum tweets to retrieve
+            page: Tab to search in (defaults to the scraper's main page)
         """
         logger.info(f"Searching Twitter for: {query} (limit: {limit})")
         
         try:
-            # Navigate to search
-            search_url = f"https://twitter.com/search?q={query}&src=typed_query&f=live"
-            await self.page.goto(search_url, wait_until="networkidle")
-            await asyncio.sleep(3)
-            
-            # Wait for tweets to load
-            try:
-                await self.page.wait_for_selector('article[data-testid="tweet"]', timeout=15000)
-                logger.info("Tweets loaded successfully")
-            except TimeoutError:
-                logger.warning("No tweets found or page didn't load properly")
-                return []
-            
-            # Scroll and scrape
-            posts_data = await self._scroll_and_scrape(limit)
+            posts_data = [tweet_data async for tweet_data in self.iter_tweets(query, limit, page)]
             self.posts_data = posts_data
             
             logger.info(f"Successfully scraped {len(posts_data)} tweets")
@@ -1382,168 +2355,148 @@ class TwitterScraper(BaseScraper):
             logger.error(f"Error searching tweets: {e}")
             return []
     
-    async def _scroll_and_scrape(self, limit):
-        """Scroll through tweets and extract data."""
-        posts_data = []
+    async def iter_tweets(self, query, limit=50, page=None):
+        """
+        Yield tweets matching a query as they are extracted, so consumers can
+        process (or store) each one while scrolling continues.
+        
+        Args:
+            query: Search term or hashtag
+            limit: Maximum tweets to yield
+            page: Tab to search in (defaults to the scraper's main page)
+        """
+        page = page or self.page
+        
+        # Navigate to search
+        search_url = f"https://twitter.com/search?q={query}&src=typed_query&f=live"
+        await page.goto(search_url, wait_until="networkidle")
+        
+        # Wait for tweets to load (returns as soon as the first one renders)
+        try:
+            await page.wait_for_selector('article[data-testid="tweet"]', timeout=15000)
+            logger.info("Tweets loaded successfully")
+        except TimeoutError:
+            logger.warning("No tweets found or page didn't load properly")
+            return
+        
+        # Scroll and scrape
+        async for tweet_data in self._iter_scroll(limit, page):
+            yield tweet_data
+    
+    async def _iter_scroll(self, limit, page):
+        """Scroll through tweets, yielding each new one as it is extracted."""
+        count = 0
         processed_ids = set()
-        last_height = await self.page.evaluate("document.body.scrollHeight")
-        no_new_tweets_count = 0
+        no_new_tweets_count = 0  # consecutive batches without an unseen tweet
+        downloads = []  # Thumbnail downloads running alongside the scraping
+        scroll_timeout = 0  # the first read takes the tweets already on the page
         
-        with tqdm(total=limit, desc="Scraping tweets") as pbar:
-            while len(posts_data) < limit:
-                # Find all tweet articles
-                tweets = await self.page.query_selector_all('article[data-testid="tweet"]')
-                
-                for tweet in tweets:
-                    if len(posts_data) >= limit:
-                        break
+        try:
+            with tqdm(total=limit, desc="Scraping tweets") as pbar:
+                while count < limit:
+                    # Scroll, wait for new content and read the new tweet articles in one call
+                    result = await page.evaluate(self.TWEETS_JS, scroll_timeout)
+                    scroll_timeout = 3000
+                    scraped_at = datetime.now().isoformat()
+                    found_before = count
                     
-                    try:
-                        tweet_data = await self._extract_tweet_data(tweet)
+                    for tweet in result['tweets']:
+                        if count >= limit:
+                            break
+                        
+                        try:
+                            tweet_data = self._extract_tweet_data(tweet, scraped_at)
+                        except Exception as e:
+                            logger.debug(f"Error extracting tweet: {e}")
+                            continue
+                        
                         if tweet_data and tweet_data['post_id'] not in processed_ids:
                             processed_ids.add(tweet_data['post_id'])
-                            posts_data.append(tweet_data)
+                            count += 1
                             
-                            # Download media thumbnail if available
+                            # Download media thumbnail if available, without holding up scrolling
                             if tweet_data.get('image_url'):
-                                download_thumbnail(
-                                    tweet_data['image_url'],
-                                    tweet_data['post_id'],
-                                    self.thumbnail_dir
-                                )
+                                downloads.append(asyncio.create_task(self._download_thumbnail(tweet_data)))
                             
                             pbar.update(1)
-                            
-                    except Exception as e:
-                        logger.debug(f"Error extracting tweet: {e}")
-                        continue
-                
-                if len(posts_data) >= limit:
-                    break
-                
-                # Scroll down
-                await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await asyncio.sleep(2)
-                
-                # Check if we've reached the bottom
-                new_height = await self.page.evaluate("document.body.scrollHeight")
-                if new_height == last_height:
-                    no_new_tweets_count += 1
-                    if no_new_tweets_count >= 3:
+                            yield tweet_data
+                    
+                    if count >= limit:
+                        break
+                    
+                    # Stop once the timeline keeps rendering only tweets already seen
+                    if count == found_before:
+                        no_new_tweets_count += 1
+                        if no_new_tweets_count >= 3:
+                            logger.info("No new tweets after repeated scrolling")
+                            break
+                    else:
+                        no_new_tweets_count = 0
+                    
+                    # If nothing was added to the page within 3 seconds of scrolling we are at the end
+                    if not result['grew']:
                         logger.info("Reached end of tweets")
                         break
-                else:
-                    no_new_tweets_count = 0
-                    last_height = new_height
-        
-        return posts_data
+        finally:
+            # Also runs if the consumer stops early, so no download is left behind
+            if downloads:
+                await asyncio.gather(*downloads, return_exceptions=True)
     
-    async def _extract_tweet_data(self, tweet_element):
-        """Extract data from a single tweet element."""
+    def _extract_tweet_data(self, tweet, scraped_at=None):
+        """Build a post dict from one tweet's raw fields (see TWEETS_JS)."""
         try:
             # Get tweet text
-            text_elem = await tweet_element.query_selector('div[data-testid="tweetText"]')
-            post_text = ""
-            if text_elem:
-                post_text = await text_elem.inner_text()
-                post_text = self._clean_text(post_text)
+            post_text = self._clean_text(tweet['text'])
             
-            # Extract hashtags
-            hashtags = re.findall(r'#(\w+)', post_text)
-            
-            # Remove hashtags from text for cleaner storage
-            clean_text = re.sub(r'#\w+\s*', '', post_text).strip()
-            clean_text = ' '.join(clean_text.split())
+            # Extract hashtags, removing them from the text for cleaner storage
+            clean_text, hashtags = split_hashtags(post_text)
             
             # Get author/username
             author = ""
-            author_elem = await tweet_element.query_selector('div[data-testid="User-Name"] a')
-            if author_elem:
-                href = await author_elem.get_attribute('href')
-                if href:
-                    author = href.strip('/').split('/')[-1]
-            
-            # Get tweet URL (contains tweet ID)
-            post_id = ""
-            url = ""
-            links = await tweet_element.query_selector_all('a[href*="/status/"]')
-            for link in links:
-                href = await link.get_attribute('href')
-                if href and '/status/' in href:
-                    url = f"https://twitter.com{href}" if href.startswith('/') else href
-                    # Extract tweet ID from URL
-                    match = re.search(r'/status/(\d+)', href)
-                    if match:
-                        post_id = match.group(1)
-                        break
+            if tweet['author_href']:
+                author = tweet['author_href'].strip('/').split('/')[-1]
+            
+            # Tweet URL and ID, read from the first status link by TWEETS_JS
+            post_id = tweet['status_id']
+            href = tweet['status_href']
+            url = f"https://twitter.com{href}" if href.startswith('/') else href
             
             if not post_id:
                 # Generate fallback ID from content hash
-                import hashlib
-                post_id = hashlib.md5(post_text.encode()).hexdigest()[:16]
-            
-            # Get timestamp
-            timestamp = ""
-            time_elem = await tweet_element.query_selector('time')
-            if time_elem:
-                timestamp = await time_elem.get_attribute('datetime') or ""
-            
-            # Get engagement metrics
-            likes = await self._get_metric(tweet_element, 'like')
-            retweets = await self._get_metric(tweet_element, 'retweet')
-            replies = await self._get_metric(tweet_element, 'reply')
-            
-            # Get media/image URL
-            image_url = ""
-            img_elem = await tweet_element.query_selector('img[src*="pbs.twimg.com/media"]')
-            if img_elem:
-                image_url = await img_elem.get_attribute('src') or ""
+                post_id = blake2b(post_text.encode(), digest_size=8).hexdigest()
             
             return {
                 'post_id': post_id,
                 'platform': 'twitter',
                 'post_text': clean_text,
                 'hashtags': ','.join(hashtags),
-                'timestamp': timestamp,
-                'image_url': image_url,
-                'likes': likes,
-                'comments': replies,
+                'timestamp': tweet['timestamp'],
+                'image_url': tweet['image_url'],
+                'likes': self._parse_metric_text(tweet['likes']),
+                'comments': self._parse_metric_text(tweet['replies']),
                 'author': author,
-                'retweet_count': retweets,
+                'retweet_count': self._parse_metric_text(tweet['retweets']),
                 'url': url,
-                'scraped_at': datetime.now().isoformat()
+                'scraped_at': scraped_at or datetime.now().isoformat()
             }
             
         except Exception as e:
             logger.debug(f"Error extracting tweet data: {e}")
             return None
     
-    async def _get_metric(self, tweet_element, metric_type):
-        """Extract a specific metric (likes, retweets, replies) from tweet."""
-        try:
-            selector = f'div[data-testid="{metric_type}"] span span'
-            elem = await tweet_element.query_selector(selector)
-            if elem:
-                text = await elem.inner_text()
-                return self._parse_metric_text(text)
-        except Exception:
-            pass
-        return 0
-    
     def _parse_metric_text(self, text):
-        """Parse metric text like '1.2K' or '3M' into integers."""
+        """Parse metric text like '1.2K', '3M' or '1B' into integers."""
         if not text:
             return 0
         
-        text = text.strip().upper()
+        text = text.strip().upper().replace(',', '')
         
+        # One suffix lookup instead of scanning for each unit
+        multiplier = METRIC_MULTIPLIERS.get(text[-1:])
         try:
-            if 'K' in text:
-                return int(float(text.replace('K', '')) * 1000)
-            elif 'M' in text:
-                return int(float(text.replace('M', '')) * 1000000)
-            else:
-                return int(text.replace(',', ''))
+            if multiplier:
+                return int(float(text[:-1]) * multiplier)
+            return int(float(text))
         except (ValueError, TypeError):
             return 0
     
@@ -1552,26 +2505,20 @@ class TwitterScraper(BaseScraper):
         if not text:
             return ""
         
-        # Replace special characters
-        text = text.replace('\u2018', "'")
-        text = text.replace('\u2019', "'")
-        text = text.replace('\u201c', '"')
-        text = text.replace('\u201d', '"')
-        text = text.replace('\u2013', '-')
-        text = text.replace('\u2014', '--')
-        text = text.replace('\u200b', '')
-        text = text.replace('\ufeff', '')
-        
-        # Normalize whitespace
-        text = ' '.join(text.split())
+        # Replace special characters and drop zero-width ones, then normalize whitespace
+        text = ' '.join(replace_special_chars(text).split())
         
         return text.strip()
     
     async def cleanup(self):
-        """Close the browser and clean up resources."""
+        """Close this scraper's context and hand the browser back to the pool."""
+        if self.http:
+            await self.http.close()
+        if self.context:
+            await self.context.close()
         if self.browser:
-            await self.browser.close()
-            logger.info("Browser closed")
+            await BROWSER_POOL.release(self.browser)
+            logger.info("Browser context closed")
     
     @classmethod
     async def _execute_scrape(cls, query, limit):
@@ -1599,3 +2546,73 @@ class TwitterScraper(BaseScraper):
             raise
         finally:
             await scraper.cleanup()
+    
+    @classmethod
+    async def stream(cls, query, limit=50):
+        """
+        Async iterator over tweets as they are scraped, for consumers that
+        write each post out instead of waiting for the full list. Sets up
+        (and logs in) a browser context for the run and closes it at the end.
+        
+        Example:
+            async for post in TwitterScraper.stream('python', limit=200):
+                writer.writerow(post)
+        
+        To stop early, wrap it in contextlib.aclosing() so the context and
+        pending thumbnail downloads are closed right away.
+        """
+        scraper = cls()
+        try:
+            await scraper.setup_browser()
+            await scraper.login()
+            async for tweet_data in scraper.iter_tweets(query, limit):
+                yield tweet_data
+        finally:
+            await scraper.cleanup()
+    
+    @classmethod
+    async def scrape_many(cls, queries, limit=50, concurrency=4):
+        """
+        Scrape several queries in one browser context, each on its own tab.
+        The browser is set up and logged in once for the whole batch.
+        
+        Args:
+            queries: Search terms or hashtags
+            limit: Maximum tweets to retrieve per query
+            concurrency: Maximum number of tabs searching at once
+            
+        Returns:
+            Dict mapping each distinct query to its list of post dicts, or to
+            the exception that query failed with (other queries keep their results)
+        """
+        queries = list(dict.fromkeys(queries))
+        scraper = cls()
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _one(query):
+            async with semaphore:
+                page = await scraper.context.new_page()
+                page.set_default_timeout(30000)
+                try:
+                    return await scraper.search_tweets(query, limit, page=page)
+                finally:
+                    await page.close()
+        
+        try:
+            await scraper.setup_browser()
+            await scraper.login()
+        except Exception as e:
+            # No context to search in: every query fails the same way
+            logger.error(f"Twitter scraping failed: {e}")
+            await scraper.cleanup()
+            return {query: e for query in queries}
+        
+        try:
+            results = await asyncio.gather(*[_one(query) for query in queries], return_exceptions=True)
+        finally:
+            await scraper.cleanup()
+        
+        for query, result in zip(queries, results):
+            if isinstance(result, Exception):
+                logger.error(f"Twitter scraping failed for '{query}': {result}")
+        return dict(zip(queries, results))
@@ -0,0 +1,39 @@
+"""Tests for Database upserts."""
+
+import pytest
+
+pytest.importorskip("duckdb")
+pytest.importorskip("pyarrow")
+
+from database import Database
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(str(tmp_path / "test.duckdb"))
+    yield database
+    database.close()
+
+
+def test_insert_posts_merges_in_batch_duplicates_like_upsert(db):
+    posts = [
+        {
+            'post_id': '1', 'platform': 'twitter', 'post_text': 'first', 'hashtags': 'a,b',
+            'sentiment_label': 'positive', 'likes': 1, 'comments': 1,
+            'scraped_at': '2024-01-01T00:00:00',
+        },
+        {'post_id': '2', 'platform': 'twitter', 'post_text': 'other', 'likes': 5},
+        {
+            'post_id': '1', 'platform': 'twitter', 'post_text': 'dup', 'likes': 9, 'comments': 4,
+            'scraped_at': '2024-02-01T00:00:00',
+        },
+    ]
+    
+    assert db.insert_posts(posts) == 2
+    
+    row = db.conn.execute(
+        "SELECT post_text, hashtags, sentiment_label, likes, comments, CAST(scraped_at AS VARCHAR) "
+        "FROM posts WHERE post_id = '1' AND platform = 'twitter'"
+    ).fetchone()
+    # Content from the first copy, refreshed counters and scrape time from the last
+    assert row == ('first', ['a', 'b'], 'positive', 9, 4, '2024-02-01 00:00:00')
@@ -0,0 +1,42 @@
+"""Tests for TextProcessor sentiment preparation."""
+
+import random
+
+import pytest
+
+from utils import TextProcessor
+
+
+def _legacy_cleaned_text(text, include_emojis):
+    """prepare_for_sentiment's cleaning as separate remove_* passes, before the single regex."""
+    cleaned = TextProcessor.clean(text)
+    cleaned = TextProcessor.remove_urls(cleaned)
+    cleaned = TextProcessor.remove_hashtags(cleaned)
+    if not include_emojis:
+        cleaned = TextProcessor.EMOJI_PATTERN.sub('', cleaned)
+    cleaned = TextProcessor.MENTION_PATTERN.sub('', cleaned)
+    return ' '.join(cleaned.split())
+
+
+@pytest.mark.parametrize('text', [
+    'a #éwww.',
+    '@é#http:// x',
+    '@bob#tag x',
+    '@#tag bob',
+    '#abcwww.x.com rest',
+    'great #day http://t.co/x @bob 😊',
+])
+@pytest.mark.parametrize('include_emojis', [True, False])
+def test_prepare_for_sentiment_matches_separate_passes(text, include_emojis):
+    result = TextProcessor.prepare_for_sentiment(text, include_emojis=include_emojis)
+    assert result['cleaned_text'] == _legacy_cleaned_text(text, include_emojis)
+
+
+def test_prepare_for_sentiment_matches_separate_passes_fuzz():
+    rng = random.Random(0)
+    alphabet = ['#', '@', 'http://', 'https://', 'www.', 'w', '.', ':', '/', 'a', 'é', '_', ' ', '—', '😊']
+    for _ in range(20000):
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 8)))
+        for include_emojis in (True, False):
+            result = TextProcessor.prepare_for_sentiment(text, include_emojis=include_emojis)
+            assert result['cleaned_text'] == _legacy_cleaned_text(text, include_emojis), text
@@ -4,9 +4,12 @@ Provides rate limiting, retry logic, and text processing for sentiment analysis.
 """
 
 import time
+import random
 import re
 import asyncio
+import threading
 from datetime import datetime
+from bisect import bisect_right
 from functools import wraps
 import logging
 
@@ -16,6 +19,8 @@ logger = logging.getLogger(__name__)
 class RateLimiter:
     """
     Simple token bucket rate limiter to avoid API/scraping bans.
+    Safe to share between threads and asyncio tasks: each caller reserves
+    the next free slot under a lock, so concurrent callers never fire together.
     
     Usage:
         limiter = RateLimiter(requests_per_minute=30)
@@ -24,28 +29,34 @@ class RateLimiter:
     
     def __init__(self, requests_per_minute: int = 30):
         self.min_interval = 60.0 / requests_per_minute
-        self.last_request_time = 0.0
+        self._next_ok = 0.0  # time.monotonic() of the next free request slot
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Claim the next request slot and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_ok - now
+            self._next_ok = max(now, self._next_ok) + self.min_interval
+        return max(0.0, wait)
         
     def wait(self):
         """Block until it's safe to make the next request."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_interval:
-            sleep_time = self.min_interval - elapsed
+        sleep_time = self._reserve()
+        if sleep_time:
             time.sleep(sleep_time)
-        self.last_request_time = time.time()
         
     async def async_wait(self):
         """Async version of wait()."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_interval:
-            sleep_time = self.min_interval - elapsed
+        sleep_time = self._reserve()
+        if sleep_time:
             await asyncio.sleep(sleep_time)
-        self.last_request_time = time.time()
 
 
 class RetryHandler:
     """
-    Retry decorator with exponential backoff for handling transient failures.
+    Retry decorator with jittered exponential backoff for handling transient failures.
+    A server-sent Retry-After on the exception takes precedence over the backoff.
     
     Usage:
         @RetryHandler.retry(max_attempts=3, base_delay=1.0)
@@ -54,27 +65,61 @@ class RetryHandler:
     """
     
     @staticmethod
-    def retry(max_attempts: int = 3, base_delay: float = 1.0, exceptions: tuple = (Exception,)):
+    def _retry_after(error) -> float:
+        """Seconds from a Retry-After carried by the exception (or its response), else None."""
+        value = getattr(error, 'retry_after', None)
+        if value is None:
+            headers = getattr(error, 'headers', None) or getattr(getattr(error, 'response', None), 'headers', None)
+            value = headers.get('Retry-After') if headers else None
+        try:
+            return max(0.0, float(value)) if value is not None else None
+        except (TypeError, ValueError):
+            return None  # HTTP-date form; fall back to the backoff
+    
+    @staticmethod
+    def _backoff(attempt: int, prev_delay: float, base_delay: float, max_delay: float, jitter: str) -> float:
+        """
+        Next backoff delay.
+        'none': base * 2^attempt; 'full': uniform(0, that);
+        'decorrelated': uniform(base, 3 * previous delay), so concurrent workers drift apart.
+        """
+        if jitter == 'decorrelated':
+            delay = random.uniform(base_delay, prev_delay * 3)
+        elif jitter == 'full':
+            delay = random.uniform(0, base_delay * (2 ** attempt))
+        else:
+            delay = base_delay * (2 ** attempt)
+        return min(max_delay, delay)
+    
+    @staticmethod
+    def retry(max_attempts: int = 3, base_delay: float = 1.0, exceptions: tuple = (Exception,),
+              max_delay: float = 60.0, jitter: str = 'decorrelated'):
         """
-        Decorator that retries a function with exponential backoff.
+        Decorator that retries a function with jittered exponential backoff.
         
         Args:
             max_attempts: Maximum number of retry attempts
             base_delay: Initial delay between retries (seconds)
             exceptions: Tuple of exceptions to catch and retry
+            max_delay: Upper bound on the backoff delay (seconds)
+            jitter: 'decorrelated' (default), 'full' or 'none'
         """
         def decorator(func):
             @wraps(func)
             def wrapper(*args, **kwargs):
                 last_exception = None
+                backoff = base_delay
                 for attempt in range(max_attempts):
                     try:
                         return func(*args, **kwargs)
                     except exceptions as e:
                         last_exception = e
                         if attempt < max_attempts - 1:
-                            delay = base_delay * (2 ** attempt)
-                            logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay}s...")
+                            backoff = RetryHandler._backoff(attempt, backoff, base_delay, max_delay, jitter)
+                            delay = RetryHandler._retry_after(e)
+                            if delay is None:
+                                delay = backoff
+                            logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay:.1f}s...")
                             time.sleep(delay)
                         else:
                             logger.error(f"All {max_attempts} attempts failed for {func.__name__}")
@@ -83,20 +128,25 @@ class RetryHandler:
         return decorator
     
     @staticmethod
-    def async_retry(max_attempts: int = 3, base_delay: float = 1.0, exceptions: tuple = (Exception,)):
+    def async_retry(max_attempts: int = 3, base_delay: float = 1.0, exceptions: tuple = (Exception,),
+                    max_delay: float = 60.0, jitter: str = 'decorrelated'):
         """Async version of retry decorator."""
         def decorator(func):
             @wraps(func)
             async def wrapper(*args, **kwargs):
                 last_exception = None
+                backoff = base_delay
                 for attempt in range(max_attempts):
                     try:
                         return await func(*args, **kwargs)
                     except exceptions as e:
                         last_exception = e
                         if attempt < max_attempts - 1:
-                            delay = base_delay * (2 ** attempt)
-                            logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay}s...")
+                            backoff = RetryHandler._backoff(attempt, backoff, base_delay, max_delay, jitter)
+                            delay = RetryHandler._retry_after(e)
+                            if delay is None:
+                                delay = backoff
+                            logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay:.1f}s...")
                             await asyncio.sleep(delay)
                         else:
                             logger.error(f"All {max_attempts} attempts failed for {func.__name__}")
@@ -115,6 +165,14 @@ class TextProcessor:
     URL_PATTERN = re.compile(r'https?://\S+|www\.\S+')
     MENTION_PATTERN = re.compile(r'@\w+')
     HASHTAG_PATTERN = re.compile(r'#(\w+)')
+    HASHTAG_REMOVE_PATTERN = re.compile(r'#\w+\s*')
+    # URLs and hashtags, stripped in one pass by prepare_for_sentiment. A hashtag
+    # stops where URL_PATTERN would match and its trailing whitespace run takes
+    # any URLs in it along, so this equals remove_urls followed by remove_hashtags
+    # (mentions are removed afterwards, as before)
+    SENTIMENT_STRIP_PATTERN = re.compile(
+        r'https?://\S+|www\.\S+|#(?:(?!https?://\S|www\.\S)\w)+(?:\s|https?://\S+|www\.\S+)*'
+    )
     EMOJI_PATTERN = re.compile(
         "["
         "\U0001F600-\U0001F64F"  # emoticons
@@ -151,14 +209,11 @@ class TextProcessor:
         if not text:
             return ""
             
-        # Apply character replacements
+        # Apply character replacements (chained str.replace is faster than a
+        # str.translate dict table on non-ASCII text) and normalize whitespace
         for old, new in cls.CHAR_REPLACEMENTS.items():
             text = text.replace(old, new)
-        
-        # Normalize whitespace
-        text = ' '.join(text.split())
-        
-        return text.strip()
+        return ' '.join(text.split())
     
     @classmethod
     def extract_hashtags(cls, text: str) -> list:
@@ -172,7 +227,7 @@ class TextProcessor:
         """Remove hashtags from text."""
         if not text:
             return ""
-        text = re.sub(r'#\w+\s*', '', text)
+        text = cls.HASHTAG_REMOVE_PATTERN.sub('', text)
         return ' '.join(text.split())
     
     @classmethod
@@ -215,19 +270,21 @@ class TextProcessor:
         hashtags = cls.extract_hashtags(text)
         mentions = cls.extract_mentions(text)
         has_urls = bool(cls.URL_PATTERN.search(text))
-        emoji_count = len(cls.EMOJI_PATTERN.findall(text))
+        # ASCII-only text has no emojis; isascii() is O(1), the pattern scan is not
+        has_emojis = not text.isascii()
+        emoji_count = len(cls.EMOJI_PATTERN.findall(text)) if has_emojis else 0
         
-        # Clean text
+        # Clean text, removing URLs and hashtags
         cleaned = cls.clean(text)
-        cleaned = cls.remove_urls(cleaned)
-        cleaned = cls.remove_hashtags(cleaned)
+        cleaned = cls.SENTIMENT_STRIP_PATTERN.sub('', cleaned)
         
         # Optionally remove emojis
-        if not include_emojis:
+        if not include_emojis and has_emojis:
             cleaned = cls.EMOJI_PATTERN.sub('', cleaned)
         
-        # Remove mentions for cleaner sentiment analysis
-        cleaned = re.sub(r'@\w+', '', cleaned)
+        # Remove mentions for cleaner sentiment analysis (after hashtags and
+        # emojis, whose removal can join a bare '@' to the next word)
+        cleaned = cls.MENTION_PATTERN.sub('', cleaned)
         cleaned = ' '.join(cleaned.split())
         
         return {
@@ -258,6 +315,16 @@ class DataLabeler:
         '😢', '😡', '👎', '💔', '😤', '🤮'
     }
     
+    # Platform-specific (medium, high, viral) engagement cutoffs
+    ENGAGEMENT_CUTOFFS = {
+        'instagram': (100, 1000, 10000),
+        'youtube': (1000, 10000, 100000),
+        'twitter': (50, 500, 5000),
+        'reddit': (100, 1000, 10000),
+    }
+    # Levels indexed by how many of a platform's cutoffs a score reaches
+    ENGAGEMENT_LEVELS = ('low', 'medium', 'high', 'viral')
+    
     @classmethod
     def estimate_sentiment(cls, text: str) -> str:
         """
@@ -287,24 +354,10 @@ class DataLabeler:
         Estimate engagement level based on platform norms.
         Returns: 'low', 'medium', 'high', or 'viral'
         """
-        # Platform-specific thresholds
-        thresholds = {
-            'instagram': {'medium': 100, 'high': 1000, 'viral': 10000},
-            'youtube': {'medium': 1000, 'high': 10000, 'viral': 100000},
-            'twitter': {'medium': 50, 'high': 500, 'viral': 5000},
-            'reddit': {'medium': 100, 'high': 1000, 'viral': 10000},
-        }
-        
-        levels = thresholds.get(platform, thresholds['twitter'])
+        cutoffs = cls.ENGAGEMENT_CUTOFFS.get(platform, cls.ENGAGEMENT_CUTOFFS['twitter'])
         total_engagement = likes + (comments * 2)  # Weight comments higher
         
-        if total_engagement >= levels['viral']:
-            return 'viral'
-        elif total_engagement >= levels['high']:
-            return 'high'
-        elif total_engagement >= levels['medium']:
-            return 'medium'
-        return 'low'
+        return cls.ENGAGEMENT_LEVELS[bisect_right(cutoffs, total_engagement)]
     
     @classmethod
     def label_post(cls, post_data: dict) -> dict: